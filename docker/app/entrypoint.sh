@@ -2,7 +2,15 @@
 
 case "$1" in
     gunicorn)
-        gunicorn -c gunicorn.conf.py my_game_list.my_game_list.wsgi:application
+        my-game-list-manage.py cache_openapi_schema
+        gunicorn -c gunicorn.conf.py
+    ;;
+    celery_worker)
+        celery -A my_game_list.my_game_list.celery worker --queues "${CELERY_WORKER_QUEUES:-high,default}" \
+            --concurrency "${CELERY_WORKER_CONCURRENCY:-2}" --loglevel "${CELERY_LOGLEVEL:-info}"
+    ;;
+    celery_beat)
+        celery -A my_game_list.my_game_list.celery beat --loglevel "${CELERY_LOGLEVEL:-info}"
     ;;
     set_state)
         my-game-list-manage.py collectstatic --no-input && \
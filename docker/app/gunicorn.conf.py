@@ -1,7 +1,15 @@
 """This module contains the configuration for the gunicorn."""
 
+import gc
 import multiprocessing
 import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gunicorn.arbiter import Arbiter  # type: ignore[import-untyped]
+    from gunicorn.workers.base import Worker  # type: ignore[import-untyped]
 
 oeg = os.environ.get
 
@@ -12,4 +20,75 @@
 errorlog = "-"
 accesslog = "-"
 timeout = int(oeg("GUNICORN_TIMEOUT", 300))
-workers = multiprocessing.cpu_count() * 2 + 1
+workers = int(oeg("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# The application is imported and warmed up once in the master, the forked workers share its memory pages
+# (copy-on-write). The reload requires the workers to import the application, so it disables the preload.
+preload_app = oeg("GUNICORN_PRELOAD", "True").lower() == "true" and not reload
+if preload_app:
+    # The garbage collection writes to the headers of the objects, which copies their memory pages into the workers.
+    # It is disabled in the master, the objects of the master are frozen before the fork.
+    gc.disable()
+
+# The worker mode, "sync" runs the WSGI application in the sync workers and "asgi" runs the ASGI application
+# in the uvicorn workers, where a slow client does not block the whole worker and the async views are run
+# in the event loop.
+GUNICORN_WORKER_MODE = oeg("GUNICORN_WORKER_MODE", "sync").lower()
+if GUNICORN_WORKER_MODE == "asgi":
+    worker_class = "uvicorn_worker.UvicornWorker"
+    wsgi_app = "my_game_list.my_game_list.asgi:application"
+elif GUNICORN_WORKER_MODE == "sync":
+    worker_class = "sync"
+    wsgi_app = "my_game_list.my_game_list.wsgi:application"
+else:
+    msg = f"Unknown GUNICORN_WORKER_MODE: {GUNICORN_WORKER_MODE}, use 'sync' or 'asgi'."
+    raise ValueError(msg)
+# The async views of the application are enabled only in the ASGI worker mode.
+os.environ["MGL_ASYNC_VIEWS"] = str(GUNICORN_WORKER_MODE == "asgi")
+
+# Prometheus multiprocess mode, the metrics of all workers are aggregated by the metrics endpoint.
+# It has to be set before the workers import the `prometheus_client`.
+PROMETHEUS_MULTIPROC_DIR = Path(oeg("PROMETHEUS_MULTIPROC_DIR", "/tmp/my_game_list_prometheus"))  # noqa: S108
+os.environ["PROMETHEUS_MULTIPROC_DIR"] = str(PROMETHEUS_MULTIPROC_DIR)
+# The preloaded application creates the metrics in the master, before the server is starting.
+PROMETHEUS_MULTIPROC_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def on_starting(server: "Arbiter") -> None:  # noqa: ARG001
+    """Remove the metrics left by the previous run of the server."""
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    PROMETHEUS_MULTIPROC_DIR.mkdir(parents=True)
+
+
+def when_ready(server: "Arbiter") -> None:  # noqa: ARG001
+    """Warm up the caches of the preloaded application, before the master forks the workers."""
+    if preload_app:
+        from my_game_list.my_game_list.warmup import warm_up
+
+        warm_up()
+
+
+def pre_fork(server: "Arbiter", worker: "Worker") -> None:  # noqa: ARG001
+    """Freeze the objects of the master, so the garbage collection of the worker does not touch their pages."""
+    if preload_app:
+        gc.freeze()
+
+
+def post_fork(server: "Arbiter", worker: "Worker") -> None:  # noqa: ARG001
+    """Enable the garbage collection in the worker, it is disabled in the master with the preloaded application."""
+    if preload_app:
+        gc.enable()
+
+
+def child_exit(server: "Arbiter", worker: "Worker") -> None:  # noqa: ARG001
+    """Mark the metrics of the exited worker as dead, so its live gauges are not exported anymore."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
+
+
+def post_worker_init(worker: "Worker") -> None:  # noqa: ARG001
+    """Start the metrics sampler in the worker, every worker has its own database connection pools."""
+    from my_game_list.my_game_list.metrics import SystemMetricsSampler
+
+    SystemMetricsSampler.ensure_started()
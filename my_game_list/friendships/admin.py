@@ -3,27 +3,30 @@
 from django.contrib import admin
 
 from my_game_list.friendships.models import Friendship, FriendshipRequest
+from my_game_list.my_game_list.admin import PerformanceModelAdmin
 
 
 @admin.register(Friendship)
-class FriendshipAdmin(admin.ModelAdmin[Friendship]):
+class FriendshipAdmin(PerformanceModelAdmin[Friendship]):
     """Admin model for the friendship model."""
 
     readonly_fields = ("id", "created_at")
-    search_fields = (*readonly_fields, "user__username")
+    search_fields = ("=id", "user__username")
     raw_id_fields = (
         "user",
         "friend",
     )
+    list_select_related = raw_id_fields
     list_display = (*readonly_fields, *raw_id_fields)
 
 
 @admin.register(FriendshipRequest)
-class FriendshipRequestAdmin(admin.ModelAdmin[FriendshipRequest]):
+class FriendshipRequestAdmin(PerformanceModelAdmin[FriendshipRequest]):
     """Admin model for the friendship request model."""
 
     readonly_fields = ("id",)
-    search_fields = (*readonly_fields, "sender__username", "receiver__username")
+    search_fields = ("=id", "sender__username", "receiver__username")
     raw_id_fields = ("sender", "receiver")
+    list_select_related = raw_id_fields
     list_filter = ("created_at", "last_modified_at", "rejected_at")
     list_display = (*readonly_fields, *list_filter, *raw_id_fields)
@@ -25,6 +25,7 @@ class FriendshipRequestFilterSet(filters.FilterSet):
 
     sender = filters.NumberFilter(field_name="sender__id")
     receiver = filters.NumberFilter(field_name="receiver__id")
+    rejected = filters.BooleanFilter(field_name="rejected_at", lookup_expr="isnull", exclude=True)
 
     class Meta:
         """Meta class for friendship request model."""
@@ -34,4 +35,5 @@ class Meta:
             "id",
             "sender",
             "receiver",
+            "rejected",
         )
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.6 on 2026-10-19 15:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("friendships", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="friendshiprequest",
+            index=models.Index(fields=["receiver", "rejected_at"], name="friend_request_receiver_idx"),
+        ),
+        migrations.AlterField(
+            model_name="friendshiprequest",
+            name="receiver",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="received_friend_requests",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="friendshiprequest",
+            name="sender",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="sent_friend_requests",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -62,11 +62,19 @@ class FriendshipRequest(BaseModel):
     created_at = models.DateTimeField(_("creation time"), auto_now_add=True)
     last_modified_at = models.DateTimeField(_("last modified"), auto_now=True)
 
-    sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="sent_friend_requests")
+    # The requests sent by the user use the unique constraint and the requests received by the user use the index
+    # of the receiver, so the foreign keys are not indexed on their own
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="sent_friend_requests",
+        db_index=False,
+    )
     receiver = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         related_name="received_friend_requests",
+        db_index=False,
     )
 
     class Meta(BaseModel.Meta):
@@ -77,6 +85,10 @@ class Meta(BaseModel.Meta):
         constraints: ClassVar[list[models.BaseConstraint]] = [
             models.UniqueConstraint(fields=("sender", "receiver"), name="unique_sender_receiver"),
         ]
+        indexes: ClassVar[list[models.Index]] = [
+            # The requests received by the user, pending or rejected (`FriendshipRequestFilterSet`)
+            models.Index(fields=("receiver", "rejected_at"), name="friend_request_receiver_idx"),
+        ]
 
     def __str__(self: Self) -> str:
         """String representation of the friendship request model."""
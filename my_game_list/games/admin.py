@@ -3,7 +3,7 @@
 from django.contrib import admin
 
 from my_game_list.games.models import Company, Game, GameFollow, GameList, GameMedia, GameReview, Genre, Platform
-from my_game_list.my_game_list.admin import BaseDictionaryModelAdmin
+from my_game_list.my_game_list.admin import BaseDictionaryModelAdmin, PerformanceModelAdmin
 
 
 @admin.register(Company)
@@ -15,60 +15,65 @@ class CompanyAdmin(BaseDictionaryModelAdmin):
 
 
 @admin.register(GameFollow)
-class GameFollowAdmin(admin.ModelAdmin[GameFollow]):
+class GameFollowAdmin(PerformanceModelAdmin[GameFollow]):
     """Admin model for the game follow model."""
 
     readonly_fields = ("id",)
-    search_fields = (*readonly_fields, "game__title", "user__username")
+    search_fields = ("=id", "game__title", "user__username")
     raw_id_fields = ("game", "user")
+    list_select_related = raw_id_fields
     list_filter = ("created_at",)
     list_display = (*readonly_fields, *list_filter, *raw_id_fields)
 
 
 @admin.register(GameList)
-class GameListAdmin(admin.ModelAdmin[GameList]):
+class GameListAdmin(PerformanceModelAdmin[GameList]):
     """Admin model for the game list model."""
 
     readonly_fields = ("id",)
-    search_fields = (*readonly_fields, "game__title", "user__username")
+    search_fields = ("=id", "game__title", "user__username")
     raw_id_fields = ("game", "user")
+    list_select_related = raw_id_fields
     list_filter = ("status", "created_at", "last_modified_at", "score")
     list_display = (*readonly_fields, *list_filter, *raw_id_fields)
 
 
 @admin.register(GameReview)
-class GameReviewAdmin(admin.ModelAdmin[GameReview]):
+class GameReviewAdmin(PerformanceModelAdmin[GameReview]):
     """Admin model for the game review model."""
 
     readonly_fields = ("id",)
-    search_fields = (*readonly_fields, "game__title", "user__username")
+    search_fields = ("=id", "game__title", "user__username")
     raw_id_fields = ("game", "user")
+    list_select_related = raw_id_fields
     list_filter = ("created_at",)
     list_display = (*readonly_fields, *list_filter, *raw_id_fields)
 
 
 @admin.register(Game)
-class GameAdmin(admin.ModelAdmin[Game]):
+class GameAdmin(PerformanceModelAdmin[Game]):
     """Admin model for the game model."""
 
     readonly_fields = ("id", "cover_image_tag", "cover_image_id", "igdb_id")
     search_fields = (
-        "id",
+        "=id",
         "title",
-        "igdb_id",
+        "=igdb_id",
         "publisher__name",
         "developer__name",
-        "genres__name",
-        "platforms__name",
     )
+    exists_search_fields = ("genres__name", "platforms__name")
     raw_id_fields = ("publisher", "developer")
+    list_select_related = raw_id_fields
     list_filter = ("created_at", "last_modified_at", "release_date")
+    # The cover image is shown only on the change page, the changelist does not render the image of every row.
     list_display = (
-        *readonly_fields,
+        "id",
+        "cover_image_id",
+        "igdb_id",
         *list_filter,
         *raw_id_fields,
         "title",
-        "cover_image_id",
     )
 
 
@@ -1,5 +1,7 @@
 """This module contains the configuration for the game application."""
 
+from typing import Self
+
 from django.apps import AppConfig
 
 
@@ -8,3 +10,7 @@ class GamesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "my_game_list.games"
+
+    def ready(self: Self) -> None:
+        """Connect the signal receivers of the application."""
+        from my_game_list.games import signals  # noqa: F401
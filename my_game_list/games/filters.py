@@ -13,7 +13,7 @@
     Genre,
     Platform,
 )
-from my_game_list.my_game_list.filters import BaseDictionaryFilterSet
+from my_game_list.my_game_list.filters import BaseDictionaryFilterSet, DictionaryExistsFilter
 
 
 class CompanyFilterSet(BaseDictionaryFilterSet):
@@ -88,15 +88,14 @@ class GameFilterSet(filters.FilterSet):
     release_date = filters.DateFromToRangeFilter()
     publisher = filters.CharFilter(field_name="publisher__name", lookup_expr="icontains")
     developer = filters.CharFilter(field_name="developer__name", lookup_expr="icontains")
-    genres = filters.ModelMultipleChoiceFilter(
-        field_name="genres__name",
-        to_field_name="name",
-        queryset=Genre.objects.all(),
-    )
-    platforms = filters.ModelMultipleChoiceFilter(
-        field_name="platforms__name",
-        to_field_name="name",
-        queryset=Platform.objects.all(),
+    genres = DictionaryExistsFilter(field_name="genres", model=Genre, label="Any of the genres")
+    genres_all = DictionaryExistsFilter(field_name="genres", model=Genre, require_all=True, label="All of the genres")
+    platforms = DictionaryExistsFilter(field_name="platforms", model=Platform, label="Any of the platforms")
+    platforms_all = DictionaryExistsFilter(
+        field_name="platforms",
+        model=Platform,
+        require_all=True,
+        label="All of the platforms",
     )
     ordering = filters.OrderingFilter(
         fields=(
@@ -117,7 +116,9 @@ class Meta:
             "publisher",
             "developer",
             "genres",
+            "genres_all",
             "platforms",
+            "platforms_all",
         )
 
 
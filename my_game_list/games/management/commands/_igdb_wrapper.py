@@ -4,11 +4,14 @@
 from abc import ABC
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Any, Self, TypeAlias
+from typing import TYPE_CHECKING, Any, Self, TypeAlias
 
-import requests
 from django.conf import settings
-from requests_futures.sessions import FuturesSession
+
+from my_game_list.games.metrics import IGDBImportMetrics
+
+if TYPE_CHECKING:
+    import requests
 
 IGDB_OBJECT: TypeAlias = "IGDBPlatformResponse | IGDBGenreResponse | IGDBCompanyResponse | IGDBGameResponse"
 IGDB_API_RESPONSE: TypeAlias = list[IGDB_OBJECT]
@@ -17,6 +20,7 @@
 class IGDBEndpoints(StrEnum):
     """IGDB endpoints used in the application."""
 
+    AUTHENTICATION = "authentication"
     GENRES = "genres"
     PLATFORMS = "platforms"
     GAMES = "games"
@@ -137,10 +141,7 @@ class IGDBInteractionError(Exception):
 class IGDBWrapper:
     """IGDB wrapper class."""
 
-    IGDB_AUTHENTICATION_URL = (
-        "https://id.twitch.tv/oauth2/token"
-        f"?client_id={settings.IGDB_CLIENT_ID}&client_secret={settings.IGDB_CLIENT_SECRET}&grant_type=client_credentials"
-    )
+    IGDB_AUTHENTICATION_URL = "https://id.twitch.tv/oauth2/token"
     IGDB_BASE_URL = "https://api.igdb.com/v4/"
     QUERY_ITEM_LIMIT = 500
     MAX_REQUESTS_TO_IGDB = 4
@@ -158,16 +159,40 @@ def basic_auth_headers(self: Self) -> dict[str, str]:
         """The headers for the IGDB API request."""
         return self._basic_auth_headers
 
+    @staticmethod
+    def get_igdb_authentication_url() -> str:
+        """Get the URL of the IGDB authentication, the credentials are read from the settings on the call."""
+        return (
+            f"{IGDBWrapper.IGDB_AUTHENTICATION_URL}?client_id={settings.IGDB_CLIENT_ID}"
+            f"&client_secret={settings.IGDB_CLIENT_SECRET}&grant_type=client_credentials"
+        )
+
     def get_igdb_access_token(self: Self) -> str:
         """Get the IGDB access token."""
+        # The requests are imported by the wrapper methods, so the module is imported quickly without them.
+        import requests
+
         try:
-            response = requests.post(self.IGDB_AUTHENTICATION_URL, timeout=10)
+            response = requests.post(self.get_igdb_authentication_url(), timeout=10)
+            self._observe_response(IGDBEndpoints.AUTHENTICATION, response)
             response.raise_for_status()
             return IGDBAuthenticationResponse(**response.json()).access_token
         except requests.HTTPError as e:
             error_message = f"Unable to get the access_token for IGDB. Error: {e}"
             raise IGDBInteractionError(error_message) from e
 
+    @staticmethod
+    def _observe_response(endpoint: IGDBEndpoints, response: "requests.Response") -> None:
+        """Record the metrics for a response received from the IGDB API.
+
+        Args:
+            endpoint (IGDBEndpoints): The endpoint the request was sent to.
+            response (requests.Response): The response from the IGDB API.
+        """
+        IGDBImportMetrics.requests_total.labels(endpoint.value, response.status_code).inc()
+        IGDBImportMetrics.response_bytes_total.labels(endpoint.value).inc(len(response.content))
+        IGDBImportMetrics.request_duration_seconds.labels(endpoint.value).observe(response.elapsed.total_seconds())
+
     def _cast_response(self: Self, endpoint: IGDBEndpoints, response_json: list[dict[str, Any]]) -> IGDB_API_RESPONSE:
         """Cast the response to the correct type for the endpoint."""
         response_map = {
@@ -191,6 +216,8 @@ def api_request(self: Self, endpoint: IGDBEndpoints, query: str) -> IGDB_API_RES
             endpoint (IGDBEndpoints): The name of the endpoint.
             query (str): The query for the endpoint.
         """
+        import requests
+
         if not query:
             error_message = "No query provided."
             raise IGDBInteractionError(error_message)
@@ -201,6 +228,7 @@ def api_request(self: Self, endpoint: IGDBEndpoints, query: str) -> IGDB_API_RES
                 headers=self.basic_auth_headers,
                 timeout=10,
             )
+            self._observe_response(endpoint, response)
             response.raise_for_status()
         except requests.HTTPError as e:
             error_message = f"Unable to get the {endpoint.value}. Error: {e}"
@@ -228,10 +256,16 @@ def get_all_objects(self: Self, endpoint: IGDBEndpoints, query: str) -> IGDB_API
                 break
             offset += self.QUERY_ITEM_LIMIT
             # IGDB API has a limit of 4 requests per second
-            time.sleep(1)
+            with IGDBImportMetrics.rate_limit_wait_seconds.labels(endpoint.value).time():
+                time.sleep(1)
         return result
 
-    def api_multi_request(self: Self, endpoint: IGDBEndpoints, query: str, offset: int = 0) -> list[requests.Response]:
+    def api_multi_request(
+        self: Self,
+        endpoint: IGDBEndpoints,
+        query: str,
+        offset: int = 0,
+    ) -> "list[requests.Response]":
         """
         Run up to `MAX_REQUESTS_TO_IGDB` request at the same time to the IGDB API.
 
@@ -243,6 +277,8 @@ def api_multi_request(self: Self, endpoint: IGDBEndpoints, query: str, offset: i
         Returns:
             list[requests.Response]: A list of the responses.
         """
+        from requests_futures.sessions import FuturesSession
+
         if not query:
             error_message = "No query provided."
             raise IGDBInteractionError(error_message)
@@ -260,7 +296,10 @@ def api_multi_request(self: Self, endpoint: IGDBEndpoints, query: str, offset: i
                 self.QUERY_ITEM_LIMIT,
             )
         ]
-        return [req.result() for req in requests]
+        responses = [req.result() for req in requests]
+        for response in responses:
+            self._observe_response(endpoint, response)
+        return responses
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 """A custom django command to import data from the IGDB database."""
 
 from datetime import UTC, date, datetime
-from typing import Any, Literal, Self, TypeVar
+from functools import cached_property
+from typing import Any, Literal, Self, TypeVar, cast
 
-from django.core.management.base import BaseCommand, CommandParser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import Field, Manager, Model, UniqueConstraint
 
 from my_game_list.games.management.commands._igdb_wrapper import (
     IGDB_API_RESPONSE,
@@ -17,9 +19,12 @@
     IGDBPlatformResponse,
     IGDBWrapper,
 )
+from my_game_list.games.metrics import IGDBImportMetrics
 from my_game_list.games.models import Company, Game, Genre, Platform
+from my_game_list.my_game_list.response_cache import invalidate_cached_responses
 
 ModelType = TypeVar("ModelType", Game, Company, Genre, Platform)
+BulkModelType = TypeVar("BulkModelType", bound=Model)
 
 
 class Command(BaseCommand):
@@ -27,10 +32,10 @@ class Command(BaseCommand):
 
     help = "Import data from the IGDB database."
 
-    def __init__(self: Self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
-        """Initializer for the command."""
-        super().__init__(*args, **kwargs)
-        self.igdb_wrapper = IGDBWrapper()
+    @cached_property
+    def igdb_wrapper(self: Self) -> IGDBWrapper:
+        """The IGDB wrapper, it is authenticated by the first import instead of the command creation (e.g. help)."""
+        return IGDBWrapper()
 
     def add_arguments(self: Self, parser: CommandParser) -> None:
         """Add arguments to the command."""
@@ -40,6 +45,14 @@ def add_arguments(self: Self, parser: CommandParser) -> None:
             nargs="+",
             help="What to import from the IGDB database.",
         )
+        parser.add_argument(
+            "--metrics-textfile",
+            default=None,
+            help=(
+                "Path of the `*.prom` file to which the import metrics are written at the end of the run, "
+                "to be picked up by the node exporter textfile collector."
+            ),
+        )
 
     @staticmethod
     def _get_company(
@@ -145,15 +158,85 @@ def _import_data(
             tuple[list[ModelType], IGDB_API_RESPONSE]: A tuple containing a list of created model instances
             and the raw IGDB API response data.
         """
-        data_from_igdb = self.igdb_wrapper.get_all_objects(
-            endpoint=endpoint,
-            query=query,
-        )
+        stage_duration = IGDBImportMetrics.stage_duration_seconds
+        with stage_duration.labels(model.__name__, "fetch").time():
+            data_from_igdb = self.igdb_wrapper.get_all_objects(
+                endpoint=endpoint,
+                query=query,
+            )
+
+        with stage_duration.labels(model.__name__, "transform").time():
+            company_igdb_to_db_mapping = {company.igdb_id: company for company in Company.objects.all()}
+            data_to_import = [
+                model(**self._get_model_input(data, company_igdb_to_db_mapping)) for data in data_from_igdb
+            ]
+
+        with stage_duration.labels(model.__name__, "insert").time():
+            created_objects = self._bulk_create(model.objects, data_to_import)
+
+        return created_objects, data_from_igdb
+
+    @staticmethod
+    def _bulk_create(manager: Manager[BulkModelType], objects: list[BulkModelType]) -> list[BulkModelType]:
+        """Insert the objects ignoring the conflicts and record how many rows were inserted or skipped.
+
+        Args:
+            manager (Manager[BulkModelType]): The manager of the model to insert the objects with.
+            objects (list[BulkModelType]): The objects to insert.
+
+        Returns:
+            list[BulkModelType]: The objects passed to `bulk_create`.
+        """
+        model_name = manager.model.__name__
+        key_fields = Command._get_key_fields(manager.model)
+        keys = {tuple(getattr(obj, field) for field in key_fields) for obj in objects}
+        existing_keys = Command._get_existing_keys(manager, key_fields, keys)
+        created_objects = manager.bulk_create(objects, ignore_conflicts=True)
+        inserted = len(keys - existing_keys)
+        IGDBImportMetrics.rows_total.labels(model_name, "inserted").inc(inserted)
+        IGDBImportMetrics.rows_total.labels(model_name, "skipped").inc(len(objects) - inserted)
+        if inserted:
+            # The bulk insert does not send the `post_save` signal, which invalidates the cached responses.
+            invalidate_cached_responses(manager.model)
+        return created_objects
+
+    @staticmethod
+    def _get_key_fields(model: type[Model]) -> tuple[str, ...]:
+        """Get the attributes of the unique key identifying the imported rows of the model.
 
-        company_igdb_to_db_mapping = {company.igdb_id: company for company in Company.objects.all()}
-        data_to_import = [model(**self._get_model_input(data, company_igdb_to_db_mapping)) for data in data_from_igdb]
+        The IGDB models are identified by the IGDB ID, the many-to-many through tables by their unique relation.
 
-        return model.objects.bulk_create(data_to_import, ignore_conflicts=True), data_from_igdb
+        Raises:
+            CommandError: The model has neither the IGDB ID nor any unique key of its fields.
+        """
+        opts = model._meta  # noqa: SLF001
+        if any(field.name == "igdb_id" for field in opts.fields):
+            return ("igdb_id",)
+        unique_fields = [
+            *opts.unique_together,
+            *(
+                constraint.fields
+                for constraint in opts.constraints
+                if isinstance(constraint, UniqueConstraint) and constraint.fields and constraint.condition is None
+            ),
+        ]
+        if not unique_fields:
+            msg = f"The imported rows of {model.__name__} are not identified by the IGDB ID or any unique key."
+            raise CommandError(msg)
+        return tuple(cast("Field[Any, Any]", opts.get_field(name)).attname for name in unique_fields[0])
+
+    @staticmethod
+    def _get_existing_keys(
+        manager: Manager[BulkModelType],
+        key_fields: tuple[str, ...],
+        keys: set[tuple[object, ...]],
+    ) -> set[tuple[object, ...]]:
+        """Get the keys of the batch already stored, they are filtered by the first key field of the batch."""
+        if not keys:
+            return set()
+        first_values = {key[0] for key in keys}
+        stored = manager.filter(**{f"{key_fields[0]}__in": first_values}).values_list(*key_fields)
+        return {tuple(row) for row in stored} & keys
 
     def import_games(self: Self) -> None:
         """Import games from the IGDB database to the application database."""
@@ -167,6 +250,20 @@ def import_games(self: Self) -> None:
             model=Game,
         )
 
+        relations_stage = IGDBImportMetrics.stage_duration_seconds.labels(Game.__name__, "relations")
+        with relations_stage.time():
+            self._import_game_relations(igdb_games)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Successfully imported {len(imported_games)} 'Game' from the IGDB database."),
+        )
+
+    def _import_game_relations(self: Self, igdb_games: IGDB_API_RESPONSE) -> None:
+        """Import the genres and platforms relations for the imported games.
+
+        Args:
+            igdb_games (IGDB_API_RESPONSE): The games fetched from the IGDB database.
+        """
         genre_igdb_to_db_mapping = {genre.igdb_id: genre.id for genre in Genre.objects.all()}
         platform_igdb_to_db_mapping = {platform.igdb_id: platform.id for platform in Platform.objects.all()}
         igdb_games_mapping = {game.id: game for game in igdb_games}
@@ -192,12 +289,8 @@ def import_games(self: Self) -> None:
                     ]
                     platforms_to_games_relation.extend(platforms)
 
-        Game.genres.through.objects.bulk_create(genres_to_games_relation, ignore_conflicts=True)
-        Game.platforms.through.objects.bulk_create(platforms_to_games_relation, ignore_conflicts=True)
-
-        self.stdout.write(
-            self.style.SUCCESS(f"Successfully imported {len(imported_games)} 'Game' from the IGDB database."),
-        )
+        self._bulk_create(Game.genres.through.objects, genres_to_games_relation)
+        self._bulk_create(Game.platforms.through.objects, platforms_to_games_relation)
 
     def import_companies(self: Self) -> None:
         """Import companies from the IGDB database to the application database."""
@@ -252,10 +345,14 @@ def handle(self: Self, *args: None, **options: dict[str, int | None | str]) -> N
             "games": self.import_games,
         }
 
-        for item in options["what_to_import"]:
-            action = actions.get(item)
-            if action:
-                action()
+        try:
+            for item in options["what_to_import"]:
+                action = actions.get(item)
+                if action:
+                    action()
+        finally:
+            if metrics_textfile := options["metrics_textfile"]:
+                IGDBImportMetrics.write_to_textfile(str(metrics_textfile))
 
         self.stdout.write(
             self.style.SUCCESS("Import process completed."),
@@ -0,0 +1,66 @@
+"""This module contains the Prometheus metrics for the IGDB import pipeline."""
+
+from pathlib import Path
+from typing import Self
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, write_to_textfile
+
+
+class IGDBImportMetrics:
+    """A class containing the metrics of the IGDB import pipeline."""
+
+    requests_total = Counter(
+        "igdb_requests_total",
+        "Number of requests sent to the IGDB API.",
+        ("endpoint", "status_code"),
+    )
+    response_bytes_total = Counter(
+        "igdb_response_bytes_total",
+        "Number of bytes received from the IGDB API.",
+        ("endpoint",),
+    )
+    request_duration_seconds = Histogram(
+        "igdb_request_duration_seconds",
+        "Latency of a single page requested from the IGDB API.",
+        ("endpoint",),
+        buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+    )
+    rate_limit_wait_seconds = Histogram(
+        "igdb_rate_limit_wait_seconds",
+        "Time spent waiting because of the IGDB API rate limit.",
+        ("endpoint",),
+        buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 5.0),
+    )
+    rows_total = Counter(
+        "igdb_import_rows_total",
+        "Number of rows processed by the IGDB import, by result.",
+        ("model", "result"),
+    )
+    stage_duration_seconds = Histogram(
+        "igdb_import_stage_duration_seconds",
+        "Duration of the IGDB import stages.",
+        ("model", "stage"),
+        buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+    )
+
+    @classmethod
+    def write_to_textfile(cls: type[Self], path: Path | str) -> None:
+        """Write the import metrics into a file readable by the node exporter textfile collector.
+
+        Only the import metrics are written, so the file does not collide with the metrics
+        exported by the node exporter itself (e.g. the `process_*` ones).
+
+        Args:
+            path (Path | str): The path of the `*.prom` file to write.
+        """
+        registry = CollectorRegistry()
+        for metric in (
+            cls.requests_total,
+            cls.response_bytes_total,
+            cls.request_duration_seconds,
+            cls.rate_limit_wait_seconds,
+            cls.rows_total,
+            cls.stage_duration_seconds,
+        ):
+            registry.register(metric)
+        write_to_textfile(str(path), registry)
@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-19 15:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0013_alter_gamefollow_options"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="game",
+            index=models.Index(fields=["release_date"], name="game_release_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="gamelist",
+            index=models.Index(fields=["user", "status"], name="game_list_user_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="gamelist",
+            index=models.Index(fields=["user", "last_modified_at"], name="game_list_user_modified_idx"),
+        ),
+        migrations.AlterField(
+            model_name="gamelist",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="game_lists",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
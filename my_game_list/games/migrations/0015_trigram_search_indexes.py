@@ -0,0 +1,42 @@
+# Generated by Django 5.1.6 on 2026-10-19 18:02
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("games", "0014_game_gamelist_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="company",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast("name", models.TextField()),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="company_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="game",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast("title", models.TextField()),
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="game_title_trgm_idx",
+            ),
+        ),
+    ]
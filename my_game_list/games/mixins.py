@@ -6,19 +6,28 @@
 
 from typing import Self
 
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from my_game_list.my_game_list.response_cache import CachedResponse, cache_response, is_cacheable
+
 
 class DictionaryAllValuesMixin:
     """A mixin for ViewSets that allows to get all values of the model."""
 
     @action(detail=False, methods=("get",), url_path="all-values", pagination_class=None)
-    def all_values(self: Self, request: Request) -> Response:  # noqa: ARG002
-        """Return all values of the Publisher model."""
-        data = self.get_queryset().order_by("name")  # type: ignore[attr-defined]
-        serializer = self.get_serializer(data, many=True)  # type: ignore[attr-defined]
+    def all_values(self: Self, request: Request) -> Response | HttpResponse:
+        """Return all values of the Publisher model, the rendered response is cached until the model is changed."""
+        queryset = self.get_queryset()  # type: ignore[attr-defined]
+        key = None
+        if is_cacheable(request):
+            key, cached_response = CachedResponse.get(request, [queryset.model])
+            if cached_response is not None:
+                return cached_response.to_response()
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = self.get_serializer(queryset.order_by("name"), many=True)  # type: ignore[attr-defined]
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        return response if key is None else cache_response(key, response)
@@ -1,11 +1,14 @@
 """This module contains the models for the game related data."""
 
+from decimal import Decimal
 from typing import ClassVar, Self
 
 from django.conf import settings
 from django.contrib import admin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils.functional import cached_property
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
@@ -42,6 +45,13 @@ class Meta(BaseDictionaryModel.Meta):
 
         verbose_name = _("company")
         verbose_name_plural = _("companies")
+        indexes: ClassVar[list[models.Index]] = [
+            # The `icontains` search of the name (the admin search), `UPPER(name::text) LIKE UPPER(pattern)`
+            GinIndex(
+                OpClass(Upper(Cast("name", models.TextField())), name="gin_trgm_ops"),
+                name="company_name_trgm_idx",
+            ),
+        ]
 
     @property
     @admin.display(description="Company logo preview")
@@ -115,7 +125,13 @@ class GameList(BaseModel):
     last_modified_at = models.DateTimeField(_("last modified"), auto_now=True)
 
     game = models.ForeignKey("Game", on_delete=models.CASCADE, related_name="game_lists")
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="game_lists")
+    # The game lists of the user use the indexes led by the user, so the foreign key is not indexed on its own
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="game_lists",
+        db_index=False,
+    )
     owned_on = models.ManyToManyField(GameMedia, related_name="game_lists")
 
     class Meta(BaseModel.Meta):
@@ -126,6 +142,12 @@ class Meta(BaseModel.Meta):
         constraints: ClassVar[list[models.BaseConstraint]] = [
             models.UniqueConstraint(fields=("game", "user"), name="unique_game_user_in_game_list"),
         ]
+        indexes: ClassVar[list[models.Index]] = [
+            # The game lists of the user filtered by the status (`GameListFilterSet`)
+            models.Index(fields=("user", "status"), name="game_list_user_status_idx"),
+            # The latest updates of the user game list (`UserDetailSerializer`)
+            models.Index(fields=("user", "last_modified_at"), name="game_list_user_modified_idx"),
+        ]
 
     def __str__(self: Self) -> str:
         """String representation of the game list model."""
@@ -218,6 +240,15 @@ class Meta(BaseModel.Meta):
 
         verbose_name = _("game")
         verbose_name_plural = _("games")
+        indexes: ClassVar[list[models.Index]] = [
+            # The games ordered by the release date (`GameViewSet`)
+            models.Index(fields=("release_date",), name="game_release_date_idx"),
+            # The `icontains` search of the title (the admin search), `UPPER(title::text) LIKE UPPER(pattern)`
+            GinIndex(
+                OpClass(Upper(Cast("title", models.TextField())), name="gin_trgm_ops"),
+                name="game_title_trgm_idx",
+            ),
+        ]
 
     def __str__(self: Self) -> str:
         """String representation of the game model."""
@@ -235,7 +266,7 @@ def cover_image_tag(self: Self) -> str:
         return ""
 
     @cached_property
-    def average_score(self: Self) -> float:
+    def average_score(self: Self) -> Decimal:
         """Annotate the average score for the game."""
         return Game.objects.with_average_score().get(id=self.id).average_score
 
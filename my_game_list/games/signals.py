@@ -0,0 +1,21 @@
+"""This module contains the signal receivers of the games application."""
+
+from typing import Any
+
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from my_game_list.games.models import Company, GameMedia, Genre, Platform
+
+
+@receiver((post_save, post_delete), sender=Company, dispatch_uid="invalidate_company_responses")
+@receiver((post_save, post_delete), sender=GameMedia, dispatch_uid="invalidate_game_media_responses")
+@receiver((post_save, post_delete), sender=Genre, dispatch_uid="invalidate_genre_responses")
+@receiver((post_save, post_delete), sender=Platform, dispatch_uid="invalidate_platform_responses")
+def invalidate_dictionary_responses(sender: type[Model], **kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Invalidate the cached all values responses of the changed dictionary."""
+    # The response cache imports the REST framework, which is not needed by the startup.
+    from my_game_list.my_game_list.response_cache import invalidate_cached_responses
+
+    invalidate_cached_responses(sender)
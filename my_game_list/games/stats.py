@@ -0,0 +1,86 @@
+"""This module contains the statistics of all games, rebuilt in the background by the Celery task."""
+
+from decimal import Decimal
+from typing import TypedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from my_game_list.games.models import Game
+
+GAME_STATISTICS_CACHE_KEY = "mgl_game_statistics"
+
+
+class GameStatistics(TypedDict):
+    """The statistics of a game, relative to all games."""
+
+    average_score: Decimal
+    scores_count: int
+    members_count: int
+    rank_position: int
+    popularity: int
+
+
+def get_game_statistics_key(game_id: int) -> str:
+    """Get the cache key of the statistics of the game."""
+    return f"{GAME_STATISTICS_CACHE_KEY}:{game_id}"
+
+
+def rebuild_game_statistics() -> dict[int, GameStatistics]:
+    """Calculate the statistics of all games by a single query and store them in the cache.
+
+    The statistics of every game are stored under its own key for two rebuild intervals, so the stale statistics
+    expire when the rebuilds stop. The cache has to be shared by the processes (`DJANGO_CACHE_URL`), so the web workers
+    read the statistics rebuilt by the Celery worker.
+
+    Returns:
+        dict[int, GameStatistics]: The statistics by the game ID.
+    """
+    games = Game.objects.with_rank_position().with_popularity().with_scores_count().only("id")
+    statistics = {
+        game.id: GameStatistics(
+            average_score=game.average_score,
+            scores_count=game.scores_count,
+            members_count=game.members_count,
+            rank_position=game.rank_position,
+            popularity=game.popularity,
+        )
+        for game in games
+    }
+    cache.set_many(
+        {get_game_statistics_key(game_id): game_statistics for game_id, game_statistics in statistics.items()},
+        timeout=settings.MGL_GAME_STATISTICS_REBUILD_MINUTES * 2 * 60,
+    )
+    return statistics
+
+
+def get_game_statistics(game_id: int) -> GameStatistics | None:
+    """Get the statistics of the game from the cache, None if they are not rebuilt yet."""
+    statistics: GameStatistics | None = cache.get(get_game_statistics_key(game_id))
+    return statistics
+
+
+async def aget_game_statistics(game_id: int) -> GameStatistics | None:
+    """Get the statistics of the game from the cache by the async view, None if they are not rebuilt yet."""
+    statistics: GameStatistics | None = await cache.aget(get_game_statistics_key(game_id))
+    return statistics
+
+
+def set_game_statistics(game: Game, statistics: GameStatistics | None) -> Game:
+    """Set the rank position and the popularity of the game from its statistics, replacing its annotations.
+
+    The annotations of a single game are calculated by the window functions limited to the game itself, so its rank
+    position and popularity are correct only in the statistics calculated for all games. Its other annotations are
+    exact and up to date, so they are kept.
+
+    Args:
+        game (Game): The game.
+        statistics (GameStatistics | None): The cached statistics, None keeps all annotations.
+
+    Returns:
+        Game: The same game.
+    """
+    if statistics is not None:
+        game.rank_position = statistics["rank_position"]
+        game.popularity = statistics["popularity"]
+    return game
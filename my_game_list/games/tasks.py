@@ -0,0 +1,26 @@
+"""This module contains the Celery tasks of the game application."""
+
+from collections.abc import Sequence
+
+from django.core.management import call_command
+
+from my_game_list.games import stats
+from my_game_list.my_game_list.celery import app
+
+IGDB_SYNC_ITEMS = ("platforms", "genres", "companies", "games")
+
+
+@app.task
+def rebuild_game_statistics() -> int:
+    """Rebuild the statistics of all games.
+
+    Returns:
+        int: The number of the games.
+    """
+    return len(stats.rebuild_game_statistics())
+
+
+@app.task
+def sync_igdb_data(what_to_import: Sequence[str] = IGDB_SYNC_ITEMS) -> None:
+    """Import the data from the IGDB database, the dictionaries are imported before the games referencing them."""
+    call_command("import_data_from_igdb", *what_to_import)
@@ -33,11 +33,14 @@
     GenreSerializer,
     PlatformSerializer,
 )
+from my_game_list.games.stats import aget_game_statistics, get_game_statistics, set_game_statistics
+from my_game_list.my_game_list.mixins import AsyncReadModelMixin, CompiledListMixin
+from my_game_list.my_game_list.pagination import EstimatedCountPagination
 from my_game_list.my_game_list.permissions import IsAdminOrReadOnly
 
 
 @extend_schema_view(all_values=extend_schema(responses={status.HTTP_200_OK: CompanySimpleNameSerializer(many=True)}))
-class CompanyViewSet(ModelViewSet[Company], DictionaryAllValuesMixin):
+class CompanyViewSet(CompiledListMixin[Company], ModelViewSet[Company], DictionaryAllValuesMixin):
     """A ViewSet for the Company model."""
 
     queryset = Company.objects.all()
@@ -59,12 +62,13 @@ class GameFollowViewSet(ModelViewSet[GameFollow]):
     filterset_class = GameFollowFilterSet
 
 
-class GameListViewSet(ModelViewSet[GameList]):
+class GameListViewSet(CompiledListMixin[GameList], AsyncReadModelMixin[GameList], ModelViewSet[GameList]):
     """A ViewSet for the GameList model."""
 
-    queryset = GameList.objects.all()
+    queryset = GameList.objects.all().select_related("game").prefetch_related("owned_on")
     serializer_class = GameListSerializer
     permission_classes = (IsAuthenticated,)
+    pagination_class = EstimatedCountPagination
     filterset_class = GameListFilterSet
 
     def get_serializer_class(self: Self) -> type[GameListCreateSerializer] | type[GameListSerializer]:
@@ -86,6 +90,7 @@ class GameReviewViewSet(ModelViewSet[GameReview]):
 
     queryset = GameReview.objects.all()
     permission_classes = (IsAuthenticated,)
+    pagination_class = EstimatedCountPagination
     filterset_class = GameReviewFilterSet
 
     def get_serializer_class(self: Self) -> type[GameReviewCreateSerializer] | type[GameReviewSerializer]:
@@ -102,11 +107,19 @@ def get_serializer_class(self: Self) -> type[GameReviewCreateSerializer] | type[
         )
 
 
-class GameViewSet(ModelViewSet[Game]):
+class GameViewSet(CompiledListMixin[Game], AsyncReadModelMixin[Game], ModelViewSet[Game]):
     """A ViewSet for the Game model."""
 
-    queryset = Game.objects.all().prefetch_related("game_lists").with_rank_position().with_popularity()
+    queryset = (
+        Game.objects.all()
+        .select_related("publisher", "developer")
+        .prefetch_related("game_lists", "genres", "platforms")
+        .with_rank_position()
+        .with_popularity()
+        .with_scores_count()
+    )
     permission_classes = (IsAdminOrReadOnly,)
+    pagination_class = EstimatedCountPagination
     filterset_class = GameFilterSet
     ordering_fields = ("release_date",)
     ordering = ("release_date",)
@@ -115,9 +128,19 @@ def get_serializer_class(self: Self) -> type[GameCreateSerializer] | type[GameSe
         """Get the serializer class for the Game model."""
         return GameCreateSerializer if self.action in ["create", "update", "partial_update"] else GameSerializer
 
+    def get_object(self: Self) -> Game:
+        """Get the game with the statistics relative to all games, rebuilt in the background."""
+        game = super().get_object()
+        return set_game_statistics(game, get_game_statistics(game.id))
+
+    async def aget_object(self: Self) -> Game:
+        """Get the game with the statistics relative to all games by the async view."""
+        game = await super().aget_object()
+        return set_game_statistics(game, await aget_game_statistics(game.id))
+
 
 @extend_schema_view(all_values=extend_schema(responses={status.HTTP_200_OK: GenreSerializer(many=True)}))
-class GenreViewSet(ModelViewSet[Genre], DictionaryAllValuesMixin):
+class GenreViewSet(CompiledListMixin[Genre], ModelViewSet[Genre], DictionaryAllValuesMixin):
     """A ViewSet for the Genre model."""
 
     queryset = Genre.objects.all()
@@ -127,7 +150,7 @@ class GenreViewSet(ModelViewSet[Genre], DictionaryAllValuesMixin):
 
 
 @extend_schema_view(all_values=extend_schema(responses={status.HTTP_200_OK: PlatformSerializer(many=True)}))
-class PlatformViewSet(ModelViewSet[Platform], DictionaryAllValuesMixin):
+class PlatformViewSet(CompiledListMixin[Platform], ModelViewSet[Platform], DictionaryAllValuesMixin):
     """A ViewSet for the Platform model."""
 
     queryset = Platform.objects.all()
@@ -137,7 +160,7 @@ class PlatformViewSet(ModelViewSet[Platform], DictionaryAllValuesMixin):
 
 
 @extend_schema_view(all_values=extend_schema(responses={status.HTTP_200_OK: GameMediaSerializer(many=True)}))
-class GameMediaViewSet(ModelViewSet[GameMedia], DictionaryAllValuesMixin):
+class GameMediaViewSet(CompiledListMixin[GameMedia], ModelViewSet[GameMedia], DictionaryAllValuesMixin):
     """A ViewSet for the GameMedia model."""
 
     queryset = GameMedia.objects.all()
@@ -1,8 +1,116 @@
-"""This module contains the base model class for all admin dictionary models."""
+"""This module contains the base model classes for the admin models and the slow query admin."""
+
+from typing import Self, TypeVar, cast
 
 from django.contrib import admin
+from django.contrib.admin.utils import get_fields_from_path, lookup_spawns_duplicates
+from django.core.exceptions import ValidationError
+from django.db.models import CharField, Exists, ManyToManyField, Model, OuterRef, Q, QuerySet, TextField
+from django.http import HttpRequest
+from django.utils.text import smart_split, unescape_string_literal
+
+from my_game_list.my_game_list.models import BaseDictionaryModel, SlowQuery
+from my_game_list.my_game_list.pagination import EstimatedCountPaginator
+
+_MT = TypeVar("_MT", bound=Model)
+
+
+def get_search_terms(search_term: str) -> list[str]:
+    """Split the search term into the terms, the quoted terms can contain the spaces, as by the admin search."""
+    return [
+        unescape_string_literal(term) if term.startswith(('"', "'")) and term[0] == term[-1] else term
+        for term in smart_split(search_term)
+    ]
+
+
+class PerformanceModelAdmin(admin.ModelAdmin[_MT]):
+    """Base admin model for the large tables, its changelist does not run any full count of the table.
+
+    The number of the rows is estimated by the `EstimatedCountPaginator` and the unfiltered count is not shown.
+    The search across the many-to-many relations (`exists_search_fields`) filters by the `EXISTS` subqueries,
+    so the changelist is not joined with the relations and it does not need `DISTINCT`. The `icontains` search
+    of the text columns is backed by the trigram indexes of the models (`GinIndex` with `gin_trgm_ops`). The other
+    columns are searched by the exact value (`=` prefix), so every condition of the search can use an index.
+    """
+
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    exists_search_fields: tuple[str, ...] = ()
+
+    def get_search_condition(self: Self, search_field: str, term: str) -> Q | None:
+        """Get the condition of the search field for the term, as by the prefixes of the admin search fields.
+
+        The `^` prefix searches the values starting with the term, the `@` prefix by the full-text search and the `=`
+        prefix the exact value, case-insensitive for the text fields. The other fields contain the term.
 
-from my_game_list.my_game_list.models import BaseDictionaryModel
+        Args:
+            search_field (str): The search field with the optional prefix.
+            term (str): The search term.
+
+        Returns:
+            Q | None: The condition, None if the term is not a valid value of the field searched by the exact value.
+        """
+        if search_field.startswith("^"):
+            return Q(**{f"{search_field.removeprefix('^')}__istartswith": term})
+        if search_field.startswith("@"):
+            return Q(**{f"{search_field.removeprefix('@')}__search": term})
+        if not search_field.startswith("="):
+            return Q(**{f"{search_field}__icontains": term})
+        field_path = search_field.removeprefix("=")
+        field = get_fields_from_path(self.model, field_path)[-1]
+        if isinstance(field, CharField | TextField):
+            return Q(**{f"{field_path}__iexact": term})
+        # The `iexact` lookup would compare the field cast to the text, which is not backed by its index.
+        try:
+            value = field.to_python(term)
+        except ValidationError:
+            return None
+        return Q(**{field_path: value})
+
+    def get_exists_search_condition(self: Self, field_path: str, term: str) -> Exists:
+        """Get the condition of the objects with any related object whose field contains the term."""
+        relation, _, lookup = field_path.partition("__")
+        field = self.model._meta.get_field(relation)  # noqa: SLF001
+        if not isinstance(field, ManyToManyField):
+            msg = f"{field_path} is not a field of a many-to-many relation."
+            raise TypeError(msg)
+        related_model = cast("type[Model]", field.related_model)
+        related_queryset = related_model._default_manager.filter(  # noqa: SLF001
+            **{field.related_query_name(): OuterRef("pk"), f"{lookup}__icontains": term},
+        )
+        return Exists(related_queryset)
+
+    def get_search_results(
+        self: Self,
+        request: HttpRequest,
+        queryset: QuerySet[_MT],
+        search_term: str,
+    ) -> tuple[QuerySet[_MT], bool]:
+        """Filter the queryset by the search term, every term is matched by any of the search fields.
+
+        Args:
+            request (HttpRequest): The request of the changelist.
+            queryset (QuerySet[_MT]): The queryset of the changelist.
+            search_term (str): The search term.
+
+        Returns:
+            tuple[QuerySet[_MT], bool]: The filtered queryset and whether it may have the duplicates.
+        """
+        search_fields = [str(search_field) for search_field in self.get_search_fields(request)]
+        if not (terms := get_search_terms(search_term)) or not (search_fields or self.exists_search_fields):
+            return queryset, False
+        for term in terms:
+            conditions = [
+                *(self.get_search_condition(search_field, term) for search_field in search_fields),
+                *(Q(self.get_exists_search_condition(field_path, term)) for field_path in self.exists_search_fields),
+            ]
+            if not (valid_conditions := [condition for condition in conditions if condition is not None]):
+                return queryset.none(), False
+            queryset = queryset.filter(Q(*valid_conditions, _connector=Q.OR))
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, search_field.lstrip("^@=")) for search_field in search_fields
+        )
+        return queryset, may_have_duplicates
 
 
 class BaseDictionaryModelAdmin(admin.ModelAdmin[BaseDictionaryModel]):
@@ -11,3 +119,21 @@ class BaseDictionaryModelAdmin(admin.ModelAdmin[BaseDictionaryModel]):
     readonly_fields: tuple[str, ...] = ("id",)
     search_fields: tuple[str, ...] = ("name",)
     list_display: tuple[str, ...] = (*readonly_fields, *search_fields)
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin[SlowQuery]):
+    """Read-only admin model for the slow query log."""
+
+    readonly_fields = ("id", "created_at", "duration", "view_name", "sql", "fingerprint", "params", "stack", "explain")
+    search_fields = ("view_name", "fingerprint")
+    list_filter = ("created_at", "view_name")
+    list_display = ("id", "created_at", "duration", "view_name", "fingerprint")
+
+    def has_add_permission(self: Self, request: HttpRequest) -> bool:  # noqa: ARG002
+        """The slow queries are only captured by the slow query log."""
+        return False
+
+    def has_change_permission(self: Self, request: HttpRequest, obj: SlowQuery | None = None) -> bool:  # noqa: ARG002
+        """The slow queries are read-only."""
+        return False
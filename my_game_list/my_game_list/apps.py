@@ -0,0 +1,18 @@
+"""This module contains the configuration for the main application."""
+
+from typing import Self
+
+from django.apps import AppConfig
+
+
+class MyGameListConfig(AppConfig):
+    """Configuration for the main application."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "my_game_list.my_game_list"
+
+    def ready(self: Self) -> None:
+        """Start the listeners of the logging queue handlers, the logging is configured before the applications."""
+        from my_game_list.my_game_list.log import start_queue_listeners
+
+        start_queue_listeners()
@@ -0,0 +1,18 @@
+"""This module contains the Celery application running the heavy background work.
+
+The tasks are routed by their priority to the queues (`CELERY_TASK_ROUTES`), which are consumed by separate workers,
+so a long IGDB import never delays the short tasks. The tasks are scheduled by the beat (`CELERY_BEAT_SCHEDULE`).
+
+The application is imported by the `tasks` modules only, not by the package, so the web workers and the management
+commands do not import Celery at the startup.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "my_game_list.settings.base")
+
+app = Celery("my_game_list")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
@@ -0,0 +1,241 @@
+"""This module contains the compiled read-only serialization of the list endpoints.
+
+The `ModelSerializer` serializes every row by the generic steps of every field: the lookup of the attribute by its
+source, the check for None and the `to_representation` call. The compiled serializer resolves these steps once into
+the accessor and the converter of every field, so the rows are serialized by a loop over plain functions. The fields
+without a fast path keep their own `get_attribute` and `to_representation`, so the representation is the same as
+the representation of the `ModelSerializer`.
+"""
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from contextlib import suppress
+from inspect import isfunction
+from operator import attrgetter, itemgetter
+from typing import Any, NamedTuple, Self
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models import ForeignKey, Model
+from django.db.models.manager import BaseManager
+from rest_framework import serializers
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject
+
+Accessor = Callable[[Any], Any]
+Converter = Callable[[Any], Any]
+Representation = Callable[[Any], dict[str, Any]]
+
+# The fields whose `to_representation` only converts the value to the built-in type, None keeps the value as it is.
+FAST_CONVERTERS: dict[type[Field[Any, Any, Any, Any]], Converter | None] = {
+    serializers.ReadOnlyField: None,
+    serializers.CharField: str,
+    serializers.IntegerField: int,
+}
+
+
+class CompiledField(NamedTuple):
+    """The field of the compiled serializer."""
+
+    name: str
+    """The name of the field in the representation."""
+    accessor: Accessor | None
+    """The function getting the attribute from the row, None if the field gets it by its `get_attribute`."""
+    converter: Converter | None
+    """The function converting the attribute to its representation, None if the attribute is represented as is."""
+    field: Field[Any, Any, Any, Any]
+    """The serializer field, it serializes the attribute when the accessor fails."""
+
+
+def get_model(serializer: serializers.BaseSerializer[Any]) -> type[Model] | None:
+    """Get the model of the model serializer, None for the other serializers."""
+    meta = getattr(serializer, "Meta", None)
+    return getattr(meta, "model", None)
+
+
+def get_related_model(model: type[Model], relations: Sequence[str]) -> type[Model] | None:
+    """Get the model related to the model by the foreign keys, None if any of the relations is not a foreign key."""
+    for relation in relations:
+        try:
+            model_field = model._meta.get_field(relation)  # noqa: SLF001
+        except FieldDoesNotExist:
+            return None
+        if not isinstance(model_field, ForeignKey):
+            return None
+        model = model_field.related_model  # type: ignore[assignment]
+    return model
+
+
+def get_pk_accessor(field: serializers.PrimaryKeyRelatedField[Any], model: type[Model]) -> Accessor | None:
+    """Get the accessor of the primary key of the related object, which is stored on the instance."""
+    try:
+        model_field = model._meta.get_field(field.source_attrs[0])  # noqa: SLF001
+    except FieldDoesNotExist:
+        return None
+    return attrgetter(model_field.attname) if isinstance(model_field, ForeignKey) else None
+
+
+def get_accessor(field: Field[Any, Any, Any, Any], model: type[Model] | None) -> Accessor | None:
+    """Get the accessor of the field attribute on the model instance.
+
+    The source of the field can follow only the foreign keys, the method at the end of the source is called as by
+    the `Field.get_attribute`.
+
+    Args:
+        field (Field[Any, Any, Any, Any]): The readable field of the serializer.
+        model (type[Model] | None): The model of the serializer.
+
+    Returns:
+        Accessor | None: The accessor, None if the field has to get the attribute by its `get_attribute`.
+    """
+    if field.source == "*":
+        return lambda instance: instance
+    pk_only = type(field) is serializers.PrimaryKeyRelatedField and field.pk_field is None
+    if model is not None and pk_only and len(field.source_attrs) == 1:
+        return get_pk_accessor(field, model)  # type: ignore[arg-type]
+    if model is None or type(field).get_attribute is not Field.get_attribute:
+        return None
+
+    *relations, name = field.source_attrs
+    if (related_model := get_related_model(model, relations)) is None:
+        return None
+    getter = attrgetter(".".join(field.source_attrs))
+    if isfunction(getattr(related_model, name, None)):
+        return lambda instance: getter(instance)()
+    return getter
+
+
+def get_serializer_converter(serializer: serializers.BaseSerializer[Any]) -> Converter:
+    """Get the converter of the nested serializer, the compiled representation of its items."""
+    if isinstance(serializer, serializers.ListSerializer):
+        if type(serializer).to_representation is not serializers.ListSerializer.to_representation:
+            return serializer.to_representation
+        child = CompiledListSerializer.compile(serializer.child)  # type: ignore[arg-type]
+        return lambda value: [child(item) for item in (value.all() if isinstance(value, BaseManager) else value)]
+    if type(serializer).to_representation is not serializers.Serializer.to_representation:
+        return serializer.to_representation
+    return CompiledListSerializer.compile(serializer)  # type: ignore[arg-type]
+
+
+def get_converter(field: Field[Any, Any, Any, Any]) -> Converter | None:
+    """Get the converter of the attribute to the representation of the field, None if it is represented as is."""
+    if isinstance(field, serializers.BaseSerializer):
+        return get_serializer_converter(field)
+    if isinstance(field, serializers.SerializerMethodField):
+        method: Converter = getattr(field.parent, field.method_name)
+        return method
+    if type(field) in FAST_CONVERTERS:
+        return FAST_CONVERTERS[type(field)]
+    if type(field) is serializers.PrimaryKeyRelatedField and field.pk_field is None:
+        # The accessor gets the primary key of the related object instead of the object.
+        return None
+    return field.to_representation
+
+
+def get_values_fields(serializer: serializers.BaseSerializer[Any]) -> tuple[str, ...] | None:
+    """Get the model fields of the serializer, for the serialization of the rows of `QuerySet.values()`.
+
+    Args:
+        serializer (serializers.BaseSerializer[Any]): The serializer of the list items.
+
+    Returns:
+        tuple[str, ...] | None: The names of the model fields, None if the serializer represents any other
+            attribute than the concrete model field, such as a relation, a method or a nested serializer.
+    """
+    model = get_model(serializer)
+    if model is None or not isinstance(serializer, serializers.Serializer):
+        return None
+
+    fields: list[str] = []
+    for field in serializer._readable_fields:  # noqa: SLF001
+        if type(field) not in FAST_CONVERTERS or len(field.source_attrs) != 1:
+            return None
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])  # noqa: SLF001
+        except FieldDoesNotExist:
+            return None
+        if model_field.is_relation or not model_field.concrete:
+            return None
+        fields.append(field.source_attrs[0])
+    return tuple(fields)
+
+
+def compile_fields(serializer: serializers.Serializer[Any], *, values: bool) -> list[CompiledField]:
+    """Compile the readable fields of the serializer, for the model instances or the rows of `QuerySet.values()`."""
+    model = get_model(serializer)
+    return [
+        CompiledField(
+            field.field_name or "",
+            itemgetter(field.source_attrs[0]) if values else get_accessor(field, model),
+            get_converter(field),
+            field,
+        )
+        for field in serializer._readable_fields  # noqa: SLF001
+    ]
+
+
+def represent_field(field: Field[Any, Any, Any, Any], instance: Any) -> Any:  # noqa: ANN401
+    """Represent the attribute of the field the same way as the `Serializer.to_representation`.
+
+    Raises:
+        SkipField: The field is not represented.
+    """
+    attribute = field.get_attribute(instance)
+    check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+    return None if check_for_none is None else field.to_representation(attribute)
+
+
+class CompiledListSerializer(serializers.ListSerializer[Any]):
+    """The read-only list serializer representing the items by the compiled fields of its child.
+
+    The items can be the model instances, with all the serialized relations selected or prefetched,
+    or the rows of `QuerySet.values()` with the fields returned by `get_values_fields`.
+    """
+
+    @staticmethod
+    def compile(serializer: serializers.Serializer[Any], *, values: bool = False) -> Representation:
+        """Compile the representation of the items by the serializer.
+
+        Args:
+            serializer (serializers.Serializer[Any]): The serializer of the items.
+            values (bool): Whether the items are the rows of `QuerySet.values()`.
+
+        Returns:
+            Representation: The function representing the item.
+        """
+        fields = compile_fields(serializer, values=values)
+
+        def represent(instance: Any) -> dict[str, Any]:  # noqa: ANN401
+            representation: dict[str, Any] = {}
+            for name, accessor, converter, field in fields:
+                if accessor is not None:
+                    try:
+                        attribute = accessor(instance)
+                    except (AttributeError, KeyError, ObjectDoesNotExist):
+                        # The missing related object, the field raises the error or represents its default.
+                        pass
+                    else:
+                        if attribute is None or converter is None:
+                            representation[name] = attribute
+                        else:
+                            representation[name] = converter(attribute)
+                        continue
+                with suppress(SkipField):
+                    representation[name] = represent_field(field, instance)
+            return representation
+
+        return represent
+
+    def __init__(self: Self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the serializer, the representations are compiled by the first serialization."""
+        super().__init__(*args, **kwargs)
+        # The representations of the model instances (False) and the rows of `QuerySet.values()` (True).
+        self.representations: dict[bool, Representation] = {}
+
+    def to_representation(self: Self, data: Iterable[Any]) -> list[dict[str, Any]]:  # type: ignore[override]
+        """Represent the items by the compiled representation of the child serializer."""
+        items = list(data.all() if isinstance(data, BaseManager) else data)
+        if not items:
+            return []
+        values = isinstance(items[0], Mapping)
+        if (represent := self.representations.get(values)) is None:
+            represent = self.representations[values] = self.compile(self.child, values=values)  # type: ignore[arg-type]
+        return [represent(item) for item in items]
@@ -0,0 +1,66 @@
+"""This module contains the compression of the API responses.
+
+The encoding is negotiated by the `Accept-Encoding` request header, brotli is preferred to gzip when the client
+accepts both of them with the same quality.
+"""
+
+import gzip
+
+import brotli
+
+# The supported encodings, in the order of the preference of the server.
+ENCODINGS = ("br", "gzip")
+# The compression levels of the responses compressed on every request, they trade the size for the speed.
+BROTLI_QUALITY = 5
+GZIP_LEVEL = 6
+
+
+def parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Parse the `Accept-Encoding` header into the qualities of the encodings.
+
+    Args:
+        accept_encoding (str): The value of the header, e.g. `gzip, deflate, br;q=0.9`.
+
+    Returns:
+        dict[str, float]: The quality of every listed encoding, the encoding without the quality has 1.
+    """
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        encoding, _, parameters = item.partition(";")
+        if not (encoding := encoding.strip().lower()):
+            continue
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[encoding] = quality
+    return qualities
+
+
+def get_accepted_encoding(accept_encoding: str) -> str | None:
+    """Get the supported encoding accepted by the client with the highest quality.
+
+    Args:
+        accept_encoding (str): The value of the `Accept-Encoding` request header.
+
+    Returns:
+        str | None: The encoding, None if the client does not accept any of the supported encodings.
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    default = qualities.get("*", 0.0)
+    # The encodings with the same quality are chosen by the preference of the server.
+    quality, _, encoding = max(
+        (qualities.get(encoding, default), -preference, encoding) for preference, encoding in enumerate(ENCODINGS)
+    )
+    return encoding if quality > 0 else None
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    """Compress the content by the encoding, `br` or `gzip`."""
+    if encoding == "br":
+        return brotli.compress(content, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
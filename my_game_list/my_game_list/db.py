@@ -0,0 +1,312 @@
+"""This module contains the database related helpers."""
+
+import logging
+import queue
+import random
+import re
+import threading
+import traceback
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, close_old_connections, connections, transaction
+from django.db.models import Model, QuerySet
+from django.db.models.sql import Query
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_RE = re.compile(r"%s|\?")
+_PLACEHOLDER_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+_ROW_LOCK_RE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b|\bFOR\s+(?:KEY\s+)?SHARE\b", re.IGNORECASE)
+
+_PACKAGE_DIR = str(Path(__file__).resolve().parents[1])
+_INTERNAL_MODULES = (__file__, str(Path(__file__).with_name("middleware.py")))
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Normalize the SQL query, so queries differing only in the parameters have the same fingerprint.
+
+    Literals and placeholders are replaced with `?` and lists of placeholders (e.g. `IN (%s, %s, %s)`)
+    are collapsed into `(...)`.
+
+    Args:
+        sql (str): The SQL query.
+
+    Returns:
+        str: The fingerprint of the SQL query.
+    """
+    fingerprint = _STRING_LITERAL_RE.sub("?", sql)
+    fingerprint = _NUMBER_LITERAL_RE.sub("?", fingerprint)
+    fingerprint = _PLACEHOLDER_RE.sub("?", fingerprint)
+    fingerprint = _PLACEHOLDER_LIST_RE.sub("(...)", fingerprint)
+    return _WHITESPACE_RE.sub(" ", fingerprint).strip()
+
+
+def get_stack_summary(limit: int = 10) -> str:
+    """Get the summary of the current stack, limited to the frames from the application code.
+
+    Args:
+        limit (int): The maximum number of the most recent frames in the summary.
+
+    Returns:
+        str: The formatted stack summary.
+    """
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(_PACKAGE_DIR) and frame.filename not in _INTERNAL_MODULES
+    ]
+    return "".join(traceback.format_list(frames[-limit:]))
+
+
+def is_select(sql: str) -> bool:
+    """Check if the query is `SELECT`, so its parameters are the filters of the query, never the written values."""
+    return sql.lstrip().upper().startswith("SELECT")
+
+
+def is_explainable(sql: str) -> bool:
+    """Check if the query can be safely run with `EXPLAIN ANALYZE`, which executes the query."""
+    return is_select(sql) and _ROW_LOCK_RE.search(sql) is None
+
+
+def is_unfiltered(query: Query) -> bool:
+    """Check if the query returns every row of its table once, so its count is the number of the rows of the table."""
+    # The aggregates annotated on the model group by all of its fields (`group_by` True), so every row stays once.
+    return (
+        not query.where
+        and not query.distinct
+        and query.group_by in (None, True)
+        and not query.combinator
+        and not query.is_sliced
+        and not query.extra_tables
+    )
+
+
+def get_estimated_count(queryset: QuerySet[Any]) -> int | None:
+    """Get the number of the rows of the queryset estimated by the PostgreSQL planner, without running the query.
+
+    The count of the unfiltered queryset is estimated by `pg_class.reltuples` of its table, which is updated by
+    `VACUUM` and `ANALYZE`. The filtered querysets are not estimated, the rows of their plans can be off by orders of
+    magnitude.
+
+    Args:
+        queryset (QuerySet[Any]): The queryset to count.
+
+    Returns:
+        int | None: The estimated count, None if the database is not PostgreSQL, the queryset is filtered, or the
+            table was never analyzed.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or not is_unfiltered(queryset.query):
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],  # noqa: SLF001
+        )
+        row = cursor.fetchone()
+    estimate = row[0] if row is not None else -1
+    # The table which was never analyzed has `reltuples` -1.
+    return int(estimate) if estimate >= 0 else None
+
+
+@dataclass
+class SlowQueryEntry:
+    """A slow query waiting to be stored in the `SlowQuery` model."""
+
+    sql: str
+    """The SQL query."""
+    params: Any
+    """The parameters of the query."""
+    duration: float
+    """The duration of the query in seconds."""
+    view_name: str
+    """The name of the view which ran the query."""
+    using: str
+    """The alias of the database connection."""
+    many: bool = False
+    """If the query was run with `executemany`."""
+    stack: str = field(default_factory=get_stack_summary)
+    """The summary of the stack which ran the query."""
+    explain: bool = False
+    """If the query should be run with `EXPLAIN (ANALYZE, BUFFERS)`."""
+
+
+class SlowQueryLog:
+    """The log of the slow queries, stored in the `SlowQuery` model bounded to `MGL_SLOW_QUERY_LOG_SIZE` rows.
+
+    The captured queries are stored by a background thread, so the request is not slowed down further.
+    A `MGL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE` fraction of them is run again with `EXPLAIN (ANALYZE, BUFFERS)`
+    on the database connection of the background thread.
+    """
+
+    QUEUE_SIZE = 1000
+
+    def __init__(self: Self) -> None:
+        """Initialize the slow query log."""
+        self._queue: queue.Queue[SlowQueryEntry] = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def capture(self: Self, entry: SlowQueryEntry) -> None:
+        """Capture the slow query to be stored in the background.
+
+        Args:
+            entry (SlowQueryEntry): The slow query.
+        """
+        entry.explain = (
+            not entry.many
+            and is_explainable(entry.sql)
+            and random.random() < settings.MGL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE  # noqa: S311
+        )
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            logger.warning("The slow query log queue is full, dropping the query from %s.", entry.view_name)
+            return
+        self._ensure_worker_started()
+
+    def _ensure_worker_started(self: Self) -> None:
+        """Start the background thread storing the slow queries, unless it is already running."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="slow-query-log", daemon=True)
+                self._worker.start()
+
+    def _run(self: Self) -> None:
+        """Store the captured slow queries."""
+        while True:
+            entry = self._queue.get()
+            try:
+                self.record(entry)
+            except DatabaseError:
+                logger.exception("Unable to store the slow query from %s.", entry.view_name)
+            finally:
+                close_old_connections()
+
+    @staticmethod
+    def explain(entry: SlowQueryEntry) -> str:
+        """Run the query with `EXPLAIN (ANALYZE, BUFFERS)`.
+
+        The query is run in a transaction which is rolled back, with `MGL_SLOW_QUERY_EXPLAIN_TIMEOUT` timeout.
+
+        Args:
+            entry (SlowQueryEntry): The slow query.
+
+        Returns:
+            str: The query plan, empty if the database is not PostgreSQL.
+        """
+        connection = connections[entry.using]
+        if connection.vendor != "postgresql":
+            return ""
+        with transaction.atomic(using=entry.using), connection.cursor() as cursor:
+            transaction.set_rollback(True, using=entry.using)
+            cursor.execute(
+                "SET LOCAL statement_timeout = %s",
+                [int(settings.MGL_SLOW_QUERY_EXPLAIN_TIMEOUT * 1000)],
+            )
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {entry.sql}", entry.params)
+            return "\n".join(row[0] for row in cursor.fetchall())
+
+    def record(self: Self, entry: SlowQueryEntry) -> None:
+        """Store the slow query and remove the oldest ones exceeding the size of the log.
+
+        Args:
+            entry (SlowQueryEntry): The slow query.
+        """
+        from my_game_list.my_game_list.models import SlowQuery
+
+        # The parameters of the writes are the stored values (e.g. the password hashes and the emails of the users),
+        # so only the parameters of the `SELECT` queries are stored.
+        slow_query = SlowQuery.objects.create(
+            duration=entry.duration,
+            sql=entry.sql,
+            fingerprint=fingerprint_sql(entry.sql),
+            params=repr(entry.params) if entry.params is not None and is_select(entry.sql) else "",
+            view_name=entry.view_name,
+            stack=entry.stack,
+            explain=self.explain(entry) if entry.explain else "",
+        )
+        SlowQuery.objects.filter(id__lte=slow_query.id - settings.MGL_SLOW_QUERY_LOG_SIZE).delete()
+
+
+slow_query_log = SlowQueryLog()
+
+
+@dataclass
+class ReplicaRouting:
+    """The routing of the database queries of a single request."""
+
+    use_replica: bool = True
+    """If the reads are routed to the replicas."""
+    wrote: bool = False
+    """If the request wrote to the primary database."""
+
+
+_replica_routing: ContextVar[ReplicaRouting | None] = ContextVar("replica_routing", default=None)
+
+
+@contextmanager
+def read_from_replicas(*, enabled: bool = True) -> Iterator[ReplicaRouting]:
+    """Route the reads in the context to the replicas in `MGL_DB_REPLICAS`.
+
+    Outside of this context (e.g. in the management commands and the Celery tasks) all the queries go
+    to the primary database, so they always read their own writes.
+
+    Args:
+        enabled (bool): If the reads are routed to the replicas, False pins the context to the primary.
+
+    Yields:
+        ReplicaRouting: The routing of the context, telling if the context wrote to the primary.
+    """
+    routing = ReplicaRouting(use_replica=enabled)
+    token = _replica_routing.set(routing)
+    try:
+        yield routing
+    finally:
+        _replica_routing.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Database router sending the writes to the primary and the reads to the replicas.
+
+    The reads go to a random replica only inside the `read_from_replicas` context. After the first write
+    in the context, all the following reads go to the primary as well.
+    """
+
+    def db_for_read(self: Self, model: type[Model], **hints: Any) -> str:  # noqa: ANN401, ARG002
+        """Get the database alias for reading the model."""
+        routing = _replica_routing.get()
+        if routing is None or not routing.use_replica or not settings.MGL_DB_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.MGL_DB_REPLICAS)  # noqa: S311
+
+    def db_for_write(self: Self, model: type[Model], **hints: Any) -> str:  # noqa: ANN401, ARG002
+        """Get the database alias for writing the model, always the primary."""
+        routing = _replica_routing.get()
+        if routing is not None:
+            routing.use_replica = False
+            routing.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self: Self, obj1: Model, obj2: Model, **hints: Any) -> bool:  # noqa: ANN401, ARG002
+        """Allow the relations between the objects of all databases, the replicas have the same data."""
+        return True
+
+    def allow_migrate(
+        self: Self,
+        db: str,
+        app_label: str,  # noqa: ARG002
+        model_name: str | None = None,  # noqa: ARG002
+        **hints: Any,  # noqa: ANN401, ARG002
+    ) -> bool:
+        """Allow the migrations only on the primary, the replicas receive them by the replication."""
+        return db not in settings.MGL_DB_REPLICAS
@@ -1,6 +1,152 @@
-"""Base filters for dictionary models."""
+"""Base filters for dictionary models and the slow query filters."""
 
+from collections.abc import Collection
+from typing import Any, Self, cast
+
+from django import forms
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Exists, ManyToManyField, Model, OuterRef, QuerySet
 from django_filters import rest_framework as filters
+from drf_spectacular.drainage import set_override
+
+from my_game_list.my_game_list.models import BaseDictionaryModel, SlowQuery
+from my_game_list.my_game_list.response_cache import get_version_key
+
+DICTIONARY_IDS_KEY_PREFIX = "mgl_dictionary_ids"
+
+
+def get_dictionary_ids(model: type[BaseDictionaryModel]) -> dict[str, int]:
+    """Get the IDs of the dictionary objects by their names.
+
+    The map is cached by the version of the model, so it is invalidated by `invalidate_cached_responses` on every
+    change of the dictionary, the same as the cached responses.
+
+    Args:
+        model (type[BaseDictionaryModel]): The dictionary model.
+
+    Returns:
+        dict[str, int]: The IDs by the names.
+    """
+    version = cache.get(get_version_key(model), 0)
+    key = f"{DICTIONARY_IDS_KEY_PREFIX}:{model._meta.label_lower}:{version}"  # noqa: SLF001
+    ids: dict[str, int] | None = cache.get(key)
+    if ids is None:
+        ids = dict(model._default_manager.values_list("name", "pk"))  # noqa: SLF001
+        cache.set(key, ids, timeout=settings.MGL_DICTIONARY_IDS_CACHE_TIMEOUT)
+    return ids
+
+
+def resolve_dictionary_ids(model: type[BaseDictionaryModel], names: Collection[str]) -> dict[str, int]:
+    """Resolve the names of the dictionary objects to their IDs.
+
+    The names are resolved by the cached map (`get_dictionary_ids`). The map cached by another process can miss
+    the objects created since it was cached, so the names missing from the map are looked up in the database.
+
+    Args:
+        model (type[BaseDictionaryModel]): The dictionary model.
+        names (Collection[str]): The names of the dictionary objects.
+
+    Returns:
+        dict[str, int]: The IDs by the names, without the names of the missing objects.
+    """
+    dictionary_ids = get_dictionary_ids(model)
+    ids = {name: dictionary_ids[name] for name in names if name in dictionary_ids}
+    if missing := set(names) - ids.keys():
+        ids.update(model._default_manager.filter(name__in=missing).values_list("name", "pk"))  # noqa: SLF001
+    return ids
+
+
+class DictionaryNamesField(forms.MultipleChoiceField):
+    """The form field of the names of the dictionary objects, cleaned to their IDs.
+
+    The names are not choices of the field, so they are neither loaded for the form nor listed by the schema.
+    """
+
+    def __init__(
+        self: Self,
+        *args: Any,  # noqa: ANN401
+        model: type[BaseDictionaryModel],
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the field.
+
+        Args:
+            *args (Any): The arguments of the `MultipleChoiceField`.
+            model (type[BaseDictionaryModel]): The dictionary model.
+            **kwargs (Any): The keyword arguments of the `MultipleChoiceField`.
+        """
+        super().__init__(*args, **kwargs)
+        self.dictionary_model = model
+
+    def validate(self: Self, value: Any) -> None:  # noqa: ANN401
+        """Validate the required names, their existence is validated by `clean`."""
+        forms.Field.validate(self, value)
+
+    def clean(self: Self, value: Any) -> list[int]:  # noqa: ANN401
+        """Validate the names and resolve them to the sorted IDs of the dictionary objects.
+
+        Raises:
+            ValidationError: Any of the names is not a name of the dictionary object.
+        """
+        names: list[str] = super().clean(value)
+        ids = resolve_dictionary_ids(self.dictionary_model, names)
+        if invalid := [name for name in names if name not in ids]:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": invalid[0]},
+            )
+        return sorted(set(ids.values()))
+
+
+class DictionaryExistsFilter(filters.MultipleChoiceFilter):
+    """Filter of the objects by the names of the dictionary objects of their many-to-many relation.
+
+    The names are validated and resolved to the IDs by the `DictionaryNamesField`, mostly by the cached map
+    without querying the dictionary. The objects are filtered by the `EXISTS` subqueries on the through table
+    of the relation instead of the join, which would duplicate the objects with more of the dictionary objects.
+    """
+
+    field_class = DictionaryNamesField
+
+    def __init__(
+        self: Self,
+        *args: Any,  # noqa: ANN401
+        model: type[BaseDictionaryModel],
+        require_all: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            *args (Any): The arguments of the `MultipleChoiceFilter`.
+            model (type[BaseDictionaryModel]): The dictionary model of the relation.
+            require_all (bool): Whether the object has to be related to all of the dictionary objects,
+                otherwise to any of them.
+            **kwargs (Any): The keyword arguments of the `MultipleChoiceFilter`.
+        """
+        super().__init__(*args, model=model, **kwargs)
+        self.dictionary_model = model
+        self.require_all = require_all
+        # The names are documented as the strings, instead of the type of the relation of the model.
+        set_override(self, "field", {"type": "string", "description": self.label})
+
+    def filter(self: Self, qs: QuerySet[Any], value: list[int]) -> QuerySet[Any]:
+        """Filter the queryset by the IDs of the dictionary objects, cleaned from their names."""
+        if not value:
+            return qs
+        field = qs.model._meta.get_field(self.field_name)  # noqa: SLF001
+        if not isinstance(field, ManyToManyField):
+            msg = f"{self.field_name} is not a many-to-many field of {qs.model.__name__}."
+            raise TypeError(msg)
+        through = cast("type[Model]", field.remote_field.through)._default_manager  # noqa: SLF001
+        related = through.filter(**{field.m2m_field_name(): OuterRef("pk")})
+        target = field.m2m_reverse_field_name()
+        if self.require_all:
+            return qs.filter(*(Exists(related.filter(**{target: pk})) for pk in value))
+        return qs.filter(Exists(related.filter(**{f"{target}__in": value})))
 
 
 class BaseDictionaryFilterSet(filters.FilterSet):
@@ -12,3 +158,16 @@ class Meta:
         """Meta class for BaseDictionaryFilterSet."""
 
         fields: tuple[str, ...] = ("id", "name")
+
+
+class SlowQueryFilterSet(filters.FilterSet):
+    """Filter set for the slow query log."""
+
+    view_name = filters.CharFilter()
+    duration = filters.RangeFilter()
+
+    class Meta:
+        """Meta class for SlowQueryFilterSet."""
+
+        model = SlowQuery
+        fields = ("id", "view_name", "duration")
@@ -0,0 +1,229 @@
+"""This module contains the logging handlers, filters and formatters."""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import weakref
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Self, cast
+
+# The attributes of every `LogRecord`, the other ones are passed in the `extra` argument.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", logging.NOTSET, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+}
+
+
+class JSONFormatter(logging.Formatter):
+    """Formatter writing the record as a compact single line JSON object, parsable by promtail.
+
+    The `extra` attributes of the record are included as additional keys.
+    """
+
+    def format(self: Self, record: logging.LogRecord) -> str:
+        """Format the record as JSON."""
+        data: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "process": record.process,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        data.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES)
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def parse_sampling_rates(value: str) -> dict[str, float]:
+    """Parse the sample rates in the `logger=rate,logger=rate` format.
+
+    Args:
+        value (str): The sample rates, e.g. `django.db.backends=0.1,django.request=0.5`.
+
+    Returns:
+        dict[str, float]: The sample rates by the logger name.
+    """
+    rates = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        logger_name, _, rate = item.partition("=")
+        rates[logger_name.strip()] = float(rate)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Filter passing only a fraction of the records below `WARNING` from the high volume loggers.
+
+    The rates are matched by the logger name, the most specific logger wins, e.g. with rates
+    `{"django.db": 0.1, "django.db.backends.schema": 1.0}` all the schema records pass and only
+    every 10th record from the other `django.db` loggers passes.
+    """
+
+    def __init__(self: Self, rates: dict[str, float] | str | None = None) -> None:
+        """Initialize the filter.
+
+        Args:
+            rates (dict[str, float] | str | None): The fractions of the records to pass, by the logger name,
+                or in the `logger=rate,logger=rate` format.
+        """
+        super().__init__()
+        self.rates = parse_sampling_rates(rates) if isinstance(rates, str) else rates or {}
+
+    def get_rate(self: Self, logger_name: str) -> float:
+        """Get the sample rate of the logger, 1 if the logger is not sampled."""
+        name = logger_name
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self: Self, record: logging.LogRecord) -> bool:
+        """Check if the record should be logged."""
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.get_rate(record.name)
+        return rate >= 1 or random.random() < rate  # noqa: S311
+
+
+class QueueListenerHandler(QueueHandler):
+    """Handler passing the records through a queue to the handlers run by a background `QueueListener`.
+
+    The formatting and the I/O of the target handlers (e.g. the rotation of the log file) are moved out of
+    the logging thread. When the queue is full, the records are dropped instead of blocking the request.
+    The listener is started by `start_queue_listeners` after the logging is configured, the records logged
+    before wait in the queue. The listener is restarted in the forked processes (e.g. the gunicorn workers
+    of a preloaded application).
+    """
+
+    def __init__(self: Self, handlers: Sequence[logging.Handler | str], queue_size: int = 10000) -> None:
+        """Initialize the handler, the target handlers are resolved when the listener is started.
+
+        Args:
+            handlers (Sequence[logging.Handler | str]): The target handlers. In the `LOGGING` configuration
+                they are referenced as `cfg://handlers.<name>`, which are resolved to the configured handlers.
+            queue_size (int): The maximum number of records waiting in the queue.
+        """
+        self.handlers = handlers
+        self.queue_size = queue_size
+        self.dropped = 0
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.listener: QueueListener | None = None
+        _queue_handlers.add(self)
+
+    @property
+    def target_handlers(self: Self) -> list[logging.Handler]:
+        """The target handlers, the `cfg://` references are resolved by the `dictConfig` when they are accessed.
+
+        Raises:
+            TypeError: Any of the targets is not a configured handler.
+        """
+        target_handlers = [self.handlers[index] for index in range(len(self.handlers))]
+        for handler in target_handlers:
+            if not isinstance(handler, logging.Handler):
+                msg = f"The target {handler!r} of the queue handler is not a configured handler."
+                raise TypeError(msg)
+        return cast("list[logging.Handler]", target_handlers)
+
+    def start_listener(self: Self) -> None:
+        """Start the listener processing the queued records, if it is not started yet."""
+        if self.listener is None:
+            self.listener = QueueListener(self.queue, *self.target_handlers, respect_handler_level=True)
+            self.listener.start()
+
+    def stop_listener(self: Self) -> None:
+        """Stop the listener, processing all the queued records first."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def restart_listener_after_fork(self: Self) -> None:
+        """Restart the listener, whose thread does not exist in the forked process."""
+        if self.listener is not None:
+            self.listener = None
+            self.queue = queue.Queue(maxsize=self.queue_size)
+            self.dropped = 0
+            self.start_listener()
+
+    def close(self: Self) -> None:
+        """Stop the listener when the handler is closed, e.g. by the next configuration of the logging."""
+        self.stop_listener()
+        _queue_handlers.discard(self)
+        super().close()
+
+    def prepare(self: Self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare the record for the queue.
+
+        Unlike the `QueueHandler.prepare` the record is not formatted, only the message arguments are merged,
+        so they cannot change before the record is handled. The formatting is left to the target handlers.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self: Self, record: logging.LogRecord) -> None:
+        """Put the record into the queue, dropping it when the queue is full.
+
+        The number of the dropped records is logged as soon as there is a space in the queue again.
+        """
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self._make_dropped_record())
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _make_dropped_record(self: Self) -> logging.LogRecord:
+        """Make the record reporting the number of the dropped records."""
+        return logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Dropped {self.dropped} log records, the logging queue was full.",
+            args=None,
+            exc_info=None,
+        )
+
+
+# The queue handlers of the process, their listeners are stopped at the exit and restarted after the fork.
+_queue_handlers: weakref.WeakSet[QueueListenerHandler] = weakref.WeakSet()
+
+
+def start_queue_listeners() -> None:
+    """Start the listeners of the queue handlers, it is called after the logging is configured."""
+    for handler in list(_queue_handlers):
+        handler.start_listener()
+
+
+def stop_queue_listeners() -> None:
+    """Stop the listeners of the queue handlers, processing all the queued records first."""
+    for handler in list(_queue_handlers):
+        handler.stop_listener()
+
+
+def _restart_queue_listeners_after_fork() -> None:
+    """Restart the listeners of the queue handlers in the forked process."""
+    for handler in list(_queue_handlers):
+        handler.restart_listener_after_fork()
+
+
+atexit.register(stop_queue_listeners)
+os.register_at_fork(after_in_child=_restart_queue_listeners_after_fork)
@@ -0,0 +1 @@
+"""Django related commands."""
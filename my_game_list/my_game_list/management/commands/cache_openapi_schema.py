@@ -0,0 +1,40 @@
+"""A custom django command to render the OpenAPI schema into the schema cache."""
+
+from typing import TYPE_CHECKING, Any, Self
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import translation
+
+from my_game_list.my_game_list.schema import SchemaCache
+from my_game_list.my_game_list.views import CachedSpectacularAPIView
+
+if TYPE_CHECKING:
+    from rest_framework.renderers import BaseRenderer
+
+
+class Command(BaseCommand):
+    """A custom django command to render the OpenAPI schema into the schema cache.
+
+    The schema is rendered in every format served by the schema view and in every language, so the first
+    requests of the workers do not generate it.
+    """
+
+    help = "Render the OpenAPI schema into the schema cache (MGL_OPENAPI_SCHEMA_DIR)."
+
+    def handle(self: Self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Render and store the schema."""
+        view = CachedSpectacularAPIView
+        # The first renderer of every format, e.g. the same schema is served as `application/json` as well.
+        renderers: dict[str, BaseRenderer] = {}
+        for renderer_class in view.renderer_classes:
+            renderers.setdefault(renderer_class.format, renderer_class())
+        for language, _ in settings.LANGUAGES:
+            with translation.override(language):
+                generator = view.generator_class(urlconf=view.urlconf, patterns=view.patterns)
+                data = generator.get_schema(request=None, public=view.serve_public)  # type: ignore[no-untyped-call]
+                for renderer_format, renderer in renderers.items():
+                    content = renderer.render(data, renderer.media_type, {})
+                    SchemaCache.set(renderer_format, language, content)
+                    path = SchemaCache.get_path(renderer_format, language)
+                    self.stdout.write(self.style.SUCCESS(f"Stored the OpenAPI schema in {path}."))
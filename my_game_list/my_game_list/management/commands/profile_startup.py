@@ -0,0 +1,85 @@
+"""A custom django command to profile the import times and the `django.setup()` phases of the application."""
+
+import json
+import subprocess
+import sys
+from collections.abc import Sequence
+from typing import Any, Self
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from my_game_list.my_game_list.startup import ImportTiming, PhaseTiming, iter_import_times, parse_import_times
+
+
+class Command(BaseCommand):
+    """A custom django command to profile the import times and the `django.setup()` phases of the application.
+
+    The application is set up in a new interpreter run with `python -X importtime`, so the modules already imported
+    by this command are measured as well.
+    """
+
+    help = "Report the ranked import-time tree and the django.setup() phase timings of a cold start."
+
+    def add_arguments(self: Self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument("--limit", type=int, default=15, help="The number of the reported modules per level.")
+        parser.add_argument("--depth", type=int, default=4, help="The depth of the reported import tree.")
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=5.0,
+            help="The minimal cumulative import time of the reported modules and phases in milliseconds.",
+        )
+        parser.add_argument("--no-urls", action="store_true", help="Do not load the URL configuration.")
+
+    def handle(self: Self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Profile the startup and print the report."""
+        command = [sys.executable, "-X", "importtime", "-m", "my_game_list.my_game_list.startup"]
+        if options["no_urls"]:
+            command.append("--no-urls")
+        process = subprocess.run(command, capture_output=True, text=True, check=False)  # noqa: S603
+        if process.returncode != 0:
+            error_message = f"The profiled startup failed:\n{process.stderr[-2000:]}"
+            raise CommandError(error_message)
+
+        imports = parse_import_times(process.stderr.splitlines())
+        phases = [PhaseTiming(**phase) for phase in json.loads(process.stdout.splitlines()[-1])]
+
+        total_us = sum(timing.cumulative_us for timing in imports)
+        modules = sum(1 for _ in iter_import_times(imports))
+        heading = f"Import time tree ({total_us / 1000:.1f} ms, {modules} modules):"
+        self.stdout.write(self.style.MIGRATE_HEADING(heading))
+        self._write_tree(imports, options["depth"], options["limit"], options["min_ms"] * 1000)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Slowest modules by self time:"))
+        slowest = sorted(iter_import_times(imports), key=lambda timing: timing.self_us, reverse=True)
+        for timing in slowest[: options["limit"]]:
+            self.stdout.write(f"  {timing.self_us / 1000:>8.1f} ms  {timing.name}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("django.setup() phases:"))
+        for phase in phases:
+            if phase.seconds * 1000 < options["min_ms"]:
+                continue
+            self.stdout.write(f"  {phase.seconds * 1000:>8.1f} ms  {phase.name}")
+        total_seconds = sum(phase.seconds for phase in phases)
+        self.stdout.write(self.style.SUCCESS(f"The application was set up in {total_seconds * 1000:.1f} ms."))
+
+    def _write_tree(
+        self: Self,
+        timings: Sequence[ImportTiming],
+        depth: int,
+        limit: int,
+        min_us: float,
+        level: int = 0,
+    ) -> None:
+        """Write the imports ranked by the cumulative time, with their slowest nested imports indented."""
+        ranked = sorted(timings, key=lambda timing: timing.cumulative_us, reverse=True)
+        for timing in ranked[:limit]:
+            if timing.cumulative_us < min_us:
+                break
+            self.stdout.write(
+                f"  {timing.cumulative_us / 1000:>8.1f} ms {timing.self_us / 1000:>8.1f} ms  "
+                f"{'  ' * level}{timing.name}",
+            )
+            if level + 1 < depth:
+                self._write_tree(timing.children, depth, limit, min_us, level + 1)
@@ -0,0 +1,46 @@
+"""A custom django command to generate the synthetic data for the benchmarks."""
+
+import dataclasses
+from typing import Any, Self
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from my_game_list.my_game_list.synthetic import DEFAULT_PASSWORD, SIZE_PRESETS, seed_synthetic_data
+
+
+class Command(BaseCommand):
+    """A custom django command to generate the synthetic data for the benchmarks.
+
+    The data are generated by the size preset, optionally with more or less users and games, and appended
+    to the existing data. The same seed on the same database generates the same data.
+    """
+
+    help = "Generate reproducible, realistically skewed synthetic users, games, game lists and friendships."
+
+    def add_arguments(self: Self, parser: CommandParser) -> None:
+        """Add arguments to the command."""
+        parser.add_argument("--size", choices=SIZE_PRESETS, default="small", help="The size preset of the data.")
+        parser.add_argument("--users", type=int, default=None, help="The number of the users, overrides the preset.")
+        parser.add_argument("--games", type=int, default=None, help="The number of the games, overrides the preset.")
+        parser.add_argument("--seed", type=int, default=0, help="The seed of the random generator.")
+        parser.add_argument("--batch-size", type=int, default=10_000, help="The number of the rows written at once.")
+        parser.add_argument("--password", default=DEFAULT_PASSWORD, help="The password of all the generated users.")
+
+    def handle(self: Self, *args: Any, **options: Any) -> None:  # noqa: ANN401, ARG002
+        """Generate the data and report the written rows."""
+        size = SIZE_PRESETS[options["size"]]
+        overrides = {field: options[field] for field in ("users", "games") if options[field] is not None}
+        size = dataclasses.replace(size, **overrides)
+        self.stdout.write(f"Generating the synthetic data: {size}.")
+
+        counts, seconds = seed_synthetic_data(
+            size,
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            password=options["password"],
+        )
+        for table, count in counts.most_common():
+            self.stdout.write(f"  {count:>12,}  {table}")
+        total = counts.total()
+        rate = total / seconds * 60 if seconds else 0
+        self.stdout.write(self.style.SUCCESS(f"Generated {total:,} rows in {seconds:.1f} s ({rate:,.0f} rows/minute)."))
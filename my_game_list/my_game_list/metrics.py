@@ -1,25 +1,172 @@
 """This module contains the custom Prometheus metrics."""
 
+import threading
+from typing import ClassVar, Self
+
+from django.conf import settings
+from django.db import connections
 from django.http import HttpResponse
 from django_prometheus.exports import ExportToDjangoView
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge, Histogram
 from rest_framework.request import Request
 
-from my_game_list.my_game_list.decorators import calculate_cpu_usage_metric, calculate_memory_usage_metric
-
 
 class Metrics:
     """A class containing custom metrics."""
 
-    cpu_usage_metric = Gauge("cpu_usage_percent", "CPU usage percentage.")
-    memory_usage_metric = Gauge("memory_usage_percent", "Percentage of memory usage.")
+    # System wide values, the same for every process, so in the multiprocess mode the latest sample is exported.
+    cpu_usage_metric = Gauge("cpu_usage_percent", "CPU usage percentage.", multiprocess_mode="mostrecent")
+    memory_usage_metric = Gauge(
+        "memory_usage_percent",
+        "Percentage of memory usage.",
+        multiprocess_mode="mostrecent",
+    )
+    # The memory unique to the process (USS), which is not shared with the master and the other workers.
+    unique_memory_metric = Gauge(
+        "worker_unique_memory_bytes",
+        "The unique memory (USS) of the process in bytes.",
+        multiprocess_mode="liveall",
+    )
+    db_queries_by_view_method = Histogram(
+        "django_http_db_queries_by_view_method",
+        "Histogram of the number of database queries per request labelled by view.",
+        ("view", "method"),
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+    )
+    db_duration_by_view_method = Histogram(
+        "django_http_db_duration_seconds_by_view_method",
+        "Histogram of the database time per request labelled by view.",
+        ("view", "method"),
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+
+    # The connection pools of the processes, in the multiprocess mode the values of the live workers are summed.
+    db_pool_size = Gauge(
+        "django_db_pool_size",
+        "The number of the connections opened by the pool.",
+        ("alias",),
+        multiprocess_mode="livesum",
+    )
+    db_pool_connections_in_use = Gauge(
+        "django_db_pool_connections_in_use",
+        "The number of the pool connections used by the requests.",
+        ("alias",),
+        multiprocess_mode="livesum",
+    )
+    db_pool_requests_waiting = Gauge(
+        "django_db_pool_requests_waiting",
+        "The number of the requests waiting for a free pool connection.",
+        ("alias",),
+        multiprocess_mode="livesum",
+    )
+    db_pool_requests = Counter(
+        "django_db_pool_requests",
+        "The number of the connections requested from the pool.",
+        ("alias",),
+    )
+    db_pool_wait_seconds = Counter(
+        "django_db_pool_wait_seconds",
+        "The time the requests waited for a free pool connection.",
+        ("alias",),
+    )
+    db_pool_timeouts = Counter(
+        "django_db_pool_timeouts",
+        "The number of the requests which did not get a pool connection in time.",
+        ("alias",),
+    )
+    db_pool_connections_opened = Counter(
+        "django_db_pool_connections_opened",
+        "The number of the connections opened by the pool.",
+        ("alias",),
+    )
+    db_pool_connect_seconds = Counter(
+        "django_db_pool_connect_seconds",
+        "The time spent opening the pool connections.",
+        ("alias",),
+    )
+
+
+class SystemMetricsSampler(threading.Thread):
+    """A daemon thread updating the system metrics on an interval, so the scrape request does not measure them.
+
+    The connection pool metrics are sampled by the sampler as well. Every process has its own pools, so
+    the sampler is started in every gunicorn worker.
+    """
+
+    _instance: ClassVar["SystemMetricsSampler | None"] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self: Self, interval: float) -> None:
+        """Initialize the sampler.
+
+        Args:
+            interval (float): The number of seconds between the samples.
+        """
+        super().__init__(name="system-metrics-sampler", daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    @classmethod
+    def ensure_started(cls: type[Self]) -> None:
+        """Start the sampler for the current process, unless it is already running or disabled in the settings."""
+        if settings.MGL_SYSTEM_METRICS_INTERVAL <= 0:
+            return
+        with cls._instance_lock:
+            # A sampler started before the fork does not run in the child process, so it is started again.
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = cls(settings.MGL_SYSTEM_METRICS_INTERVAL)
+                cls._instance.start()
+
+    @staticmethod
+    def sample() -> None:
+        """Update the system metrics."""
+        # The psutil is imported by the sampler only, not by the startup of every process.
+        import psutil
+
+        Metrics.cpu_usage_metric.set(psutil.cpu_percent())
+        Metrics.memory_usage_metric.set(psutil.virtual_memory().percent)
+        Metrics.unique_memory_metric.set(psutil.Process().memory_full_info().uss)
+        SystemMetricsSampler.sample_database_pools()
+
+    @staticmethod
+    def sample_database_pools() -> None:
+        """Update the metrics of the databases configured with the psycopg connection pool."""
+        for alias in connections:
+            if not connections.settings[alias].get("OPTIONS", {}).get("pool"):
+                continue
+            # The pool is shared by the connections of all threads, it is opened by the first access.
+            pool = getattr(connections[alias], "pool", None)
+            if pool is None:
+                continue
+            # The counters are reset by the `pop_stats`, so they are added to the Prometheus counters only once.
+            stats = pool.pop_stats()
+            in_use = stats.get("pool_size", 0) - stats.get("pool_available", 0)
+            Metrics.db_pool_size.labels(alias).set(stats.get("pool_size", 0))
+            Metrics.db_pool_connections_in_use.labels(alias).set(in_use)
+            Metrics.db_pool_requests_waiting.labels(alias).set(stats.get("requests_waiting", 0))
+            Metrics.db_pool_requests.labels(alias).inc(stats.get("requests_num", 0))
+            Metrics.db_pool_wait_seconds.labels(alias).inc(stats.get("requests_wait_ms", 0) / 1000)
+            Metrics.db_pool_timeouts.labels(alias).inc(stats.get("requests_errors", 0))
+            Metrics.db_pool_connections_opened.labels(alias).inc(stats.get("connections_num", 0))
+            Metrics.db_pool_connect_seconds.labels(alias).inc(stats.get("connections_ms", 0) / 1000)
+
+    def run(self: Self) -> None:
+        """Sample the system metrics until the sampler is stopped."""
+        self.sample()
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self: Self) -> None:
+        """Stop the sampler."""
+        self._stop_event.set()
 
 
-@calculate_memory_usage_metric
-@calculate_cpu_usage_metric
 def custom_export_to_django_view(request: Request) -> HttpResponse:
     """A wrapper for a function that returns metrics for Prometheus.
 
-    Used to add decorators that configure custom values for metrics set during a request.
+    The system metrics are not measured during the request, but by the `SystemMetricsSampler`, which is started
+    here if it is not running yet. When `PROMETHEUS_MULTIPROC_DIR` is set (e.g. by the gunicorn configuration),
+    the metrics of all worker processes are aggregated.
     """
+    SystemMetricsSampler.ensure_started()
     return ExportToDjangoView(request)
@@ -0,0 +1,445 @@
+"""This module contains the custom middlewares."""
+
+import cProfile
+import hashlib
+import io
+import logging
+import pstats
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Self
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from my_game_list.my_game_list.compression import compress, get_accepted_encoding
+from my_game_list.my_game_list.db import SlowQueryEntry, fingerprint_sql, read_from_replicas, slow_query_log
+from my_game_list.my_game_list.metrics import Metrics
+
+logger = logging.getLogger(__name__)
+
+UNNAMED_VIEW = "<unnamed view>"
+
+
+def get_view_name(request: HttpRequest) -> str:
+    """Get the name of the view resolved for the request, as labelled by the `django_prometheus` metrics."""
+    if request.resolver_match is not None and request.resolver_match.view_name:
+        return request.resolver_match.view_name
+    return UNNAMED_VIEW
+
+
+class QueryRecorder:
+    """Database execute wrapper counting and timing the queries run on the connection.
+
+    Queries exceeding the `MGL_SLOW_QUERY_THRESHOLD` are captured by the slow query log.
+    """
+
+    def __init__(self: Self, request: HttpRequest, *, capture_slow_queries: bool = True) -> None:
+        """Initialize the recorder.
+
+        Args:
+            request (HttpRequest): The request during which the queries are run.
+            capture_slow_queries (bool): If the slow queries should be captured by the slow query log.
+        """
+        self.request = request
+        self.capture_slow_queries = capture_slow_queries
+        self.count = 0
+        self.duration = 0.0
+        self.queries: Counter[str] = Counter()
+
+    def __call__(
+        self: Self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,  # noqa: ANN401
+        many: bool,  # noqa: FBT001
+        context: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """Execute the query and record its duration."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.duration += duration
+            self.count += 1
+            self.queries[sql] += 1
+            if self.capture_slow_queries and 0 < settings.MGL_SLOW_QUERY_THRESHOLD <= duration:
+                slow_query_log.capture(
+                    SlowQueryEntry(
+                        sql=sql,
+                        params=params,
+                        duration=duration,
+                        view_name=get_view_name(self.request),
+                        using=context["connection"].alias,
+                        many=many,
+                    ),
+                )
+
+    def top_fingerprints(self: Self, limit: int = 5) -> list[tuple[str, int]]:
+        """Get the most frequent normalized SQL queries.
+
+        Args:
+            limit (int): The number of fingerprints to return.
+
+        Returns:
+            list[tuple[str, int]]: The fingerprints with the number of executions, the most frequent first.
+        """
+        fingerprints: Counter[str] = Counter()
+        for sql, count in self.queries.items():
+            fingerprints[fingerprint_sql(sql)] += count
+        return fingerprints.most_common(limit)
+
+
+def record_queries(recorder: QueryRecorder) -> ExitStack:
+    """Install the query recorder on all database connections until the returned context is closed."""
+    stack = ExitStack()
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(recorder))
+    return stack
+
+
+class DatabaseMetricsMiddleware:
+    """Middleware recording the number of database queries and the database time of each request.
+
+    The values are exported to Prometheus labelled by the view name and the method. Requests exceeding
+    the `MGL_DB_SLOW_REQUEST_THRESHOLD` or `MGL_DB_HIGH_QUERY_COUNT_THRESHOLD` are logged with their
+    most frequent normalized SQL queries. With `MGL_DB_QUERY_HEADERS` the values are returned in the response
+    headers as well (e.g. for the load benchmarks).
+    """
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        """Run the request with the query recorder installed on all database connections."""
+        recorder = QueryRecorder(request)
+        with record_queries(recorder):
+            response = self.get_response(request)
+
+        view_name = get_view_name(request)
+        method = request.method or ""
+        Metrics.db_queries_by_view_method.labels(view_name, method).observe(recorder.count)
+        Metrics.db_duration_by_view_method.labels(view_name, method).observe(recorder.duration)
+        if settings.MGL_DB_QUERY_HEADERS:
+            response["X-DB-Queries"] = str(recorder.count)
+            response["X-DB-Time"] = f"{recorder.duration:.6f}"
+
+        if (
+            recorder.duration >= settings.MGL_DB_SLOW_REQUEST_THRESHOLD
+            or recorder.count >= settings.MGL_DB_HIGH_QUERY_COUNT_THRESHOLD
+        ):
+            logger.warning(
+                "Expensive database usage in %s %s (%s): %d queries, %.3fs. Most frequent queries: %s",
+                method,
+                request.path,
+                view_name,
+                recorder.count,
+                recorder.duration,
+                "; ".join(f"{count}x {fingerprint}" for fingerprint, count in recorder.top_fingerprints()),
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    """Middleware profiling a single request with `cProfile`.
+
+    A request is profiled when it is sent by a staff user with the `X-Profile` header, or it is sampled
+    with the `MGL_PROFILING_SAMPLE_RATE` probability. The profile (`*.prof` for `pstats`/snakeviz and `*.txt`
+    report with the database time broken out) is stored in `MGL_PROFILING_DIR`, which keeps only
+    the `MGL_PROFILING_MAX_FILES` most recent profiles. With `X-Profile: text` the report is returned
+    instead of the response.
+    """
+
+    HEADER = "HTTP_X_PROFILE"
+    # The values of the header requesting the profile, `text` returns the report instead of the response.
+    HEADER_VALUES = ("1", "text")
+    REPORT_STATS_LIMIT = 50
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        """Run the request, profiling it when it is requested by a staff user or sampled."""
+        profile_header = request.META.get(self.HEADER, "")
+        requested = profile_header in self.HEADER_VALUES and self._is_staff(request)
+        sampled = random.random() < settings.MGL_PROFILING_SAMPLE_RATE  # noqa: S311
+        if not (requested or sampled):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder(request, capture_slow_queries=False)
+        start = time.perf_counter()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is already active in this process (e.g. in a concurrent request)
+            logger.warning("Unable to profile the request to %s, another profiler is active.", request.path)
+            return self.get_response(request)
+        try:
+            with record_queries(recorder):
+                response = self.get_response(request)
+        finally:
+            profiler.disable()
+        total_time = time.perf_counter() - start
+
+        report = self._build_report(request, profiler, recorder, total_time)
+        profile_id = self._store_profile(request, profiler, report)
+        if requested and profile_header == "text":
+            return HttpResponse(report, content_type="text/plain; charset=utf-8")
+        if requested:
+            response["X-Profile-Id"] = profile_id
+            response["X-Profile-Total-Time"] = f"{total_time:.6f}"
+            response["X-Profile-SQL-Time"] = f"{recorder.duration:.6f}"
+            response["X-Profile-SQL-Queries"] = str(recorder.count)
+        return response
+
+    @staticmethod
+    def _is_staff(request: HttpRequest) -> bool:
+        """Check if the request is sent by a staff user.
+
+        The API uses the authentication of the Django REST framework, which is run only in the view,
+        so the configured authentication classes are run here.
+        """
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return bool(user.is_staff)
+        drf_request = Request(request)
+        for authenticator in APIView().get_authenticators():
+            try:
+                user_and_token = authenticator.authenticate(drf_request)
+            except APIException:
+                return False
+            if user_and_token is not None:
+                return bool(user_and_token[0].is_staff)
+        return False
+
+    def _build_report(
+        self: Self,
+        request: HttpRequest,
+        profiler: cProfile.Profile,
+        recorder: QueryRecorder,
+        total_time: float,
+    ) -> str:
+        """Build the text report of the profile with the database time broken out."""
+        stream = io.StringIO()
+        sql_share = recorder.duration / total_time * 100 if total_time else 0.0
+        stream.write(f"{request.method} {request.get_full_path()} ({get_view_name(request)})\n")
+        stream.write(f"Total time: {total_time:.6f}s\n")
+        stream.write(f"SQL time: {recorder.duration:.6f}s ({sql_share:.1f}%) in {recorder.count} queries\n")
+        for fingerprint, count in recorder.top_fingerprints(limit=10):
+            stream.write(f"    {count}x {fingerprint}\n")
+        stream.write("\n")
+        pstats.Stats(profiler, stream=stream).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            self.REPORT_STATS_LIMIT,
+        )
+        return stream.getvalue()
+
+    @staticmethod
+    def _store_profile(request: HttpRequest, profiler: cProfile.Profile, report: str) -> str:
+        """Store the profile and the report, removing the oldest profiles exceeding the limit.
+
+        Returns:
+            str: The ID of the profile, used as the name of the files.
+        """
+        profiling_dir = Path(settings.MGL_PROFILING_DIR)
+        profiling_dir.mkdir(parents=True, exist_ok=True)
+        view_name = re.sub(r"[^\w.-]", "_", get_view_name(request))
+        profile_id = f"{timezone.now():%Y%m%dT%H%M%S}-{view_name}-{uuid.uuid4().hex[:8]}"
+        profiler.dump_stats(profiling_dir / f"{profile_id}.prof")
+        (profiling_dir / f"{profile_id}.txt").write_text(report, encoding="utf-8")
+
+        profiles = sorted(profiling_dir.glob("*.prof"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for old_profile in profiles[settings.MGL_PROFILING_MAX_FILES :]:
+            old_profile.unlink(missing_ok=True)
+            old_profile.with_suffix(".txt").unlink(missing_ok=True)
+        return profile_id
+
+
+class ReplicaRoutingMiddleware:
+    """Middleware routing the database reads of the safe requests to the read replicas in `MGL_DB_REPLICAS`.
+
+    After a request wrote to the primary, the requests of the same client read from the primary for
+    `MGL_DB_PRIMARY_STICKY_SECONDS`, so the client reads its own writes despite the replication lag.
+    The client is tracked by a cookie and by a cache key of its credentials, for the API clients ignoring cookies.
+    """
+
+    COOKIE_NAME = "mgl_use_primary"
+    CACHE_KEY_PREFIX = "mgl_use_primary"
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        """Run the request, reading from the replicas unless it is unsafe or the client wrote recently."""
+        if not settings.MGL_DB_REPLICAS:
+            return self.get_response(request)
+
+        use_replica = request.method in SAFE_METHODS and not self._is_sticky(request)
+        with read_from_replicas(enabled=use_replica) as routing:
+            response = self.get_response(request)
+        if routing.wrote:
+            self._make_sticky(request, response)
+        return response
+
+    def _get_cache_key(self: Self, request: HttpRequest) -> str | None:
+        """Get the cache key of the client, None for the anonymous clients."""
+        if authorization := request.META.get("HTTP_AUTHORIZATION"):
+            return f"{self.CACHE_KEY_PREFIX}:{hashlib.sha256(authorization.encode()).hexdigest()}"
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"{self.CACHE_KEY_PREFIX}:user:{user.pk}"
+        return None
+
+    def _is_sticky(self: Self, request: HttpRequest) -> bool:
+        """Check if the client wrote recently and has to read from the primary."""
+        if self.COOKIE_NAME in request.COOKIES:
+            return True
+        cache_key = self._get_cache_key(request)
+        return cache_key is not None and cache.get(cache_key) is not None
+
+    def _make_sticky(self: Self, request: HttpRequest, response: HttpResponse) -> None:
+        """Make the next requests of the client read from the primary."""
+        sticky_seconds = settings.MGL_DB_PRIMARY_STICKY_SECONDS
+        response.set_cookie(self.COOKIE_NAME, "1", max_age=sticky_seconds, httponly=True, samesite="Lax")
+        if cache_key := self._get_cache_key(request):
+            cache.set(cache_key, 1, timeout=sticky_seconds)
+
+
+class PathScopedMiddleware:
+    """Middleware running the `MGL_SESSION_MIDDLEWARE` only for the paths starting with `MGL_SESSION_PATH_PREFIXES`.
+
+    The scoped middlewares are chained in front of the rest of the stack as if they were in the `MIDDLEWARE`,
+    including their `process_view`, `process_exception` and `process_template_response` hooks (e.g. the CSRF
+    check of the `CsrfViewMiddleware`). The other requests (e.g. the API requests authenticated with JWT) skip
+    them, so they do not load the session and the user from the database.
+    """
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware and the scoped middlewares."""
+        self.get_response = get_response
+        self.path_prefixes = tuple(settings.MGL_SESSION_PATH_PREFIXES)
+        self.view_hooks: list[Callable[..., HttpResponse | None]] = []
+        self.exception_hooks: list[Callable[[HttpRequest, Exception], HttpResponse | None]] = []
+        self.template_response_hooks: list[Callable[[HttpRequest, HttpResponse], HttpResponse]] = []
+
+        # The hooks are ordered the same way as by the Django handler, the view hooks in the order
+        # of the middlewares and the other hooks in the reverse order.
+        handler = get_response
+        for middleware_path in reversed(settings.MGL_SESSION_MIDDLEWARE):
+            middleware = import_string(middleware_path)(handler)
+            if hasattr(middleware, "process_view"):
+                self.view_hooks.insert(0, middleware.process_view)
+            if hasattr(middleware, "process_exception"):
+                self.exception_hooks.append(middleware.process_exception)
+            if hasattr(middleware, "process_template_response"):
+                self.template_response_hooks.append(middleware.process_template_response)
+            handler = middleware
+        self.scoped_handler = handler
+
+    def is_scoped(self: Self, request: HttpRequest) -> bool:
+        """Check if the scoped middlewares are run for the request."""
+        return request.path_info.startswith(self.path_prefixes)
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        """Run the request through the scoped middlewares if the path matches, directly otherwise."""
+        if self.is_scoped(request):
+            return self.scoped_handler(request)
+        return self.get_response(request)
+
+    def process_view(
+        self: Self,
+        request: HttpRequest,
+        view_func: Callable[..., HttpResponse],
+        view_args: tuple[Any, ...],
+        view_kwargs: dict[str, Any],
+    ) -> HttpResponse | None:
+        """Run the view hooks of the scoped middlewares."""
+        if not self.is_scoped(request):
+            return None
+        for hook in self.view_hooks:
+            if (response := hook(request, view_func, view_args, view_kwargs)) is not None:
+                return response
+        return None
+
+    def process_exception(self: Self, request: HttpRequest, exception: Exception) -> HttpResponse | None:
+        """Run the exception hooks of the scoped middlewares."""
+        if not self.is_scoped(request):
+            return None
+        for hook in self.exception_hooks:
+            if (response := hook(request, exception)) is not None:
+                return response
+        return None
+
+    def process_template_response(self: Self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        """Run the template response hooks of the scoped middlewares."""
+        if not self.is_scoped(request):
+            return response
+        for hook in self.template_response_hooks:
+            response = hook(request, response)
+        return response
+
+
+class CompressionMiddleware:
+    """Middleware compressing the responses by brotli or gzip, negotiated by the `Accept-Encoding` request header.
+
+    Only the responses of the paths with `MGL_COMPRESSION_PATH_PREFIXES` larger than `MGL_COMPRESSION_MIN_SIZE`
+    are compressed. The responses served from the response cache are compressed once per cache entry, the compressed
+    content is stored in the cache entry.
+    """
+
+    def __init__(self: Self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the middleware."""
+        self.get_response = get_response
+
+    @staticmethod
+    def is_compressible(request: HttpRequest, response: HttpResponse) -> bool:
+        """Whether the response can be compressed, regardless of the encodings accepted by the client."""
+        return (
+            not response.streaming
+            and not response.has_header("Content-Encoding")
+            and request.path.startswith(tuple(settings.MGL_COMPRESSION_PATH_PREFIXES))
+            and len(response.content) >= settings.MGL_COMPRESSION_MIN_SIZE
+        )
+
+    def __call__(self: Self, request: HttpRequest) -> HttpResponse:
+        """Compress the content of the response by the encoding accepted by the client."""
+        response = self.get_response(request)
+        if not self.is_compressible(request, response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if (encoding := get_accepted_encoding(request.headers.get("Accept-Encoding", ""))) is None:
+            return response
+        if (cached_response := getattr(response, "cached_response", None)) is not None:
+            content = cached_response.get_encoded(encoding)
+        else:
+            content = compress(response.content, encoding)
+        if len(content) >= len(response.content):
+            return response
+
+        response.content = content
+        response["Content-Length"] = str(len(content))
+        response["Content-Encoding"] = encoding
+        # The compressed content differs from the content byte for byte, so its ETag is weak (as by `GZipMiddleware`).
+        if (etag := response.get("ETag")) and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        return response
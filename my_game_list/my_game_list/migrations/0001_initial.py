@@ -0,0 +1,32 @@
+# Generated by Django 5.1.6 on 2026-10-19 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="creation time")),
+                ("duration", models.FloatField(help_text="Duration of the query in seconds.", verbose_name="duration")),
+                ("sql", models.TextField(verbose_name="SQL")),
+                ("fingerprint", models.TextField(verbose_name="fingerprint")),
+                ("params", models.TextField(blank=True, verbose_name="parameters")),
+                ("view_name", models.CharField(max_length=255, verbose_name="view name")),
+                ("stack", models.TextField(blank=True, verbose_name="stack summary")),
+                ("explain", models.TextField(blank=True, verbose_name="EXPLAIN (ANALYZE, BUFFERS) output")),
+            ],
+            options={
+                "verbose_name": "slow query",
+                "verbose_name_plural": "slow queries",
+                "ordering": ("-id",),
+            },
+        ),
+    ]
@@ -0,0 +1,179 @@
+"""
+This module contains the mixins shared by the ViewSets of all applications.
+
+The mixins are used to add custom functionality to the ViewSets.
+"""
+
+from collections.abc import Coroutine, Sequence
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
+
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpRequest, HttpResponseBase
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+from rest_framework.viewsets import GenericViewSet
+
+from my_game_list.my_game_list.compiled import CompiledListSerializer, get_values_fields
+from my_game_list.my_game_list.pagination import AsyncPageNumberPagination
+
+if TYPE_CHECKING:
+    from rest_framework.decorators import ViewSetAction
+    from rest_framework.views import AsView, GenericView
+
+_MT = TypeVar("_MT", bound=Model)
+
+
+class AsyncReadModelMixin(RetrieveModelMixin, ListModelMixin, GenericViewSet[_MT]):
+    """A mixin for ViewSets running the `list` and `retrieve` actions as coroutines with the async ORM.
+
+    The async views are enabled by the `MGL_ASYNC_VIEWS` setting, which is set by the ASGI (uvicorn) worker mode.
+    Otherwise, the actions are run by the `ListModelMixin` and `RetrieveModelMixin`, as the sync views. The async
+    actions are the `alist` and `aretrieve` methods, the other actions of the async view are run in a thread.
+    The authentication, permissions and filters can query the database, so they are run in a thread as well.
+    The serializers of the async actions must not query the database, the queryset has to select and prefetch
+    all the serialized relations.
+    """
+
+    async_actions = ("list", "retrieve")
+    async_view = False
+
+    @classmethod
+    def as_view(
+        cls: type[Self],
+        actions: "dict[str, str | ViewSetAction[Any]] | None" = None,
+        **initkwargs: Any,  # noqa: ANN401
+    ) -> "AsView[GenericView]":
+        """Create the view, which is a coroutine function when the async views are enabled for the routed actions."""
+        async_view = settings.MGL_ASYNC_VIEWS and any(
+            action in cls.async_actions for action in (actions or {}).values()
+        )
+        if not async_view:
+            return super().as_view(actions, **initkwargs)
+        return markcoroutinefunction(super().as_view(actions, async_view=True, **initkwargs))
+
+    def dispatch(  # type: ignore[override]
+        self: Self,
+        request: HttpRequest,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase | Coroutine[Any, Any, HttpResponseBase]:
+        """Dispatch the request, returning a coroutine from the async view."""
+        if self.async_view:
+            return self.async_dispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def async_dispatch(
+        self: Self,
+        request: HttpRequest,
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> HttpResponseBase:
+        """Dispatch the request to the async action, or to the sync dispatch run in a thread."""
+        action = self.action_map.get((request.method or "").lower())
+        if action not in self.async_actions:
+            return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+        handler = getattr(self, f"a{action}")
+
+        # The same steps as in the `APIView.dispatch`.
+        self.args = args
+        self.kwargs = kwargs
+        drf_request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(drf_request, *args, **kwargs)
+            response = await handler(drf_request, *args, **kwargs)
+        except Exception as exc:  # noqa: BLE001
+            response = await sync_to_async(self.handle_exception)(exc)
+        self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+        return self.response
+
+    async def afilter_queryset(self: Self, queryset: QuerySet[_MT]) -> QuerySet[_MT]:
+        """Filter the queryset, the filter backends can validate the parameters against the database."""
+        return await sync_to_async(self.filter_queryset)(queryset)
+
+    async def apaginate_queryset(self: Self, queryset: QuerySet[_MT]) -> Sequence[_MT] | None:
+        """Get a single page of the results, None if the pagination is disabled."""
+        paginator = self.paginator
+        if paginator is None:
+            return None
+        if isinstance(paginator, AsyncPageNumberPagination):
+            return await paginator.apaginate_queryset(queryset, self.request, view=self)
+        return await sync_to_async(self.paginate_queryset)(queryset)
+
+    async def aget_object(self: Self) -> _MT:
+        """Get the object the view is displaying with the async ORM."""
+        queryset = await self.afilter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        try:
+            obj = await queryset.aget(**filter_kwargs)
+        except (ObjectDoesNotExist, TypeError, ValueError, ValidationError) as exc:
+            raise Http404 from exc
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def alist(
+        self: Self,
+        request: Request,  # noqa: ARG002
+        *args: Any,  # noqa: ANN401, ARG002
+        **kwargs: Any,  # noqa: ANN401, ARG002
+    ) -> Response:
+        """List the queryset."""
+        queryset = await self.afilter_queryset(self.get_queryset())
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer([obj async for obj in queryset], many=True)
+        return Response(serializer.data)
+
+    async def aretrieve(
+        self: Self,
+        request: Request,  # noqa: ARG002
+        *args: Any,  # noqa: ANN401, ARG002
+        **kwargs: Any,  # noqa: ANN401, ARG002
+    ) -> Response:
+        """Retrieve the model instance."""
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+
+class CompiledListMixin(GenericViewSet[_MT]):
+    """A mixin for ViewSets serializing the GET list actions by the `CompiledListSerializer`.
+
+    The list serializer represents the items by the fields of the serializer of the ViewSet compiled once per
+    request, with the same representation. When the serializer represents only the concrete model fields,
+    the filtered queryset is fetched by `QuerySet.values()` without building the model instances.
+    """
+
+    compiled_list_actions = ("list", "all_values")
+
+    def use_compiled_list(self: Self) -> bool:
+        """Whether the action lists the items read-only by the compiled serializer."""
+        return self.action in self.compiled_list_actions and self.request.method == "GET"
+
+    def get_serializer(self: Self, *args: Any, **kwargs: Any) -> BaseSerializer[_MT]:  # noqa: ANN401
+        """Get the serializer, the list of the items of the GET list action is serialized by the compiled serializer."""
+        if not kwargs.get("many") or not self.use_compiled_list():
+            return super().get_serializer(*args, **kwargs)
+        kwargs.pop("many")
+        kwargs.setdefault("context", self.get_serializer_context())
+        child = self.get_serializer_class()(context=kwargs["context"])
+        return CompiledListSerializer(*args, child=child, **kwargs)
+
+    def filter_queryset(self: Self, queryset: QuerySet[_MT]) -> QuerySet[_MT]:
+        """Filter the queryset, the GET list action fetches only the serialized model fields when it is possible."""
+        queryset = super().filter_queryset(queryset)
+        if self.use_compiled_list():
+            serializer = self.get_serializer_class()(context=self.get_serializer_context())
+            if (fields := get_values_fields(serializer)) is not None:
+                return cast("QuerySet[_MT]", queryset.values(*fields))
+        return queryset
@@ -31,3 +31,27 @@ class Meta(TypedModelMeta):
 
         abstract = True
         ordering = ("id",)
+
+
+class SlowQuery(models.Model):
+    """A database query exceeding the slow query threshold, captured by the `SlowQueryLog`."""
+
+    created_at = models.DateTimeField(_("creation time"), auto_now_add=True)
+    duration = models.FloatField(_("duration"), help_text=_("Duration of the query in seconds."))
+    sql = models.TextField(_("SQL"))
+    fingerprint = models.TextField(_("fingerprint"))
+    params = models.TextField(_("parameters"), blank=True)
+    view_name = models.CharField(_("view name"), max_length=255)
+    stack = models.TextField(_("stack summary"), blank=True)
+    explain = models.TextField(_("EXPLAIN (ANALYZE, BUFFERS) output"), blank=True)
+
+    class Meta(TypedModelMeta):
+        """Meta data for the slow query model."""
+
+        verbose_name = _("slow query")
+        verbose_name_plural = _("slow queries")
+        ordering = ("-id",)
+
+    def __str__(self: Self) -> str:
+        """String representation of the slow query model."""
+        return f"{self.view_name} - {self.duration:.3f}s"
@@ -0,0 +1,210 @@
+"""This module contains the custom paginators."""
+
+from typing import Any, Self, cast
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from my_game_list.my_game_list.db import get_estimated_count
+
+
+class EstimatedPage(Page[Any]):
+    """The page of the paginator with the estimated count, which knows if the next page has any objects."""
+
+    def __init__(self: Self, object_list: list[Any], number: int, paginator: Paginator[Any], *, has_next: bool) -> None:
+        """Initialize the page.
+
+        Args:
+            object_list (list[Any]): The objects on the page.
+            number (int): The number of the page.
+            paginator (Paginator[Any]): The paginator of the page.
+            has_next (bool): Whether any object follows the objects on the page.
+        """
+        super().__init__(object_list, number, paginator)
+        self.next_exists = has_next
+
+    def has_next(self: Self) -> bool:
+        """Check if any object follows the objects on the page, regardless of the estimated count."""
+        return self.next_exists
+
+    def end_index(self: Self) -> int:
+        """Get the 1-based index of the last object on the page."""
+        return self.start_index() + len(self.object_list) - 1
+
+
+class EstimatedCountPaginator(Paginator[Any]):
+    """The paginator counting the large querysets by the estimate of the PostgreSQL planner.
+
+    The exact count of the large table scans all of its rows, so the count estimated to be at least
+    `MGL_ESTIMATED_COUNT_THRESHOLD` is used as it is. The smaller querysets are counted exactly. The estimated count
+    can differ from the number of the rows, so it is only reported: every page with any objects is served and the
+    next page is detected by fetching one more object than the page size.
+    """
+
+    @cached_property
+    def estimate(self: Self) -> int | None:
+        """The estimated count of the queryset, None if it is counted exactly."""
+        return self.get_estimated_count()
+
+    @property
+    def estimated(self: Self) -> bool:
+        """Whether the count is estimated."""
+        return self.estimate is not None
+
+    @cached_property
+    def count(self: Self) -> int:
+        """The number of the objects, estimated for the large querysets."""
+        return self.estimate if self.estimate is not None else super().count
+
+    def get_estimated_count(self: Self) -> int | None:
+        """Get the estimated count of the queryset, None if it is below the threshold or it can not be estimated."""
+        if not isinstance(self.object_list, QuerySet):
+            return None
+        estimate = get_estimated_count(self.object_list)
+        return estimate if estimate is not None and estimate >= settings.MGL_ESTIMATED_COUNT_THRESHOLD else None
+
+    async def acount(self: Self) -> int:
+        """Count the objects with the async ORM, the count is cached by the paginator."""
+        self.estimate = await sync_to_async(self.get_estimated_count)()
+        if self.estimate is not None:
+            self.count = self.estimate
+        else:
+            self.count = await cast("QuerySet[Any]", self.object_list).acount()
+        return self.count
+
+    def validate_number(self: Self, number: int | float | str) -> int:  # noqa: PYI041
+        """Validate the 1-based page number, the page after the estimated pages can still have the objects."""
+        if not self.estimated:
+            return super().validate_number(number)
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError  # noqa: TRY301
+            number = int(number)
+        except (TypeError, ValueError) as exc:
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from exc
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self: Self, number: int | str) -> Page[Any]:
+        """Get the page of the objects, with the estimated count the page is fetched to find out if it is the last."""
+        if not self.estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        return self.get_estimated_page(list(self.get_page_slice(number)), number)
+
+    async def apage(self: Self, number: int | str) -> Page[Any]:
+        """Get the page of the objects by the async ORM, the count has to be counted by `acount` first.
+
+        The page of the exact count keeps the lazy slice of the queryset, which has to be fetched by the caller.
+        """
+        if not self.estimated:
+            return super().page(number)
+        number = self.validate_number(number)
+        return self.get_estimated_page([obj async for obj in self.get_page_slice(number)], number)
+
+    def get_page_slice(self: Self, number: int) -> QuerySet[Any]:
+        """Get the slice of the objects on the page and the first object of the next page."""
+        bottom = (number - 1) * self.per_page
+        return cast("QuerySet[Any]", self.object_list)[bottom : bottom + self.per_page + 1]
+
+    def get_estimated_page(self: Self, rows: list[Any], number: int) -> EstimatedPage:
+        """Get the page of the fetched rows, the page without any rows exists only as the first page."""
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        return EstimatedPage(rows[: self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+
+class AsyncPageNumberPagination(PageNumberPagination):
+    """The `PageNumberPagination` which can also paginate the queryset with the async ORM.
+
+    The synchronous pagination is unchanged, so the paginator can be used by both sync and async views.
+    """
+
+    async def apaginate_queryset(
+        self: Self,
+        queryset: QuerySet[Any],
+        request: Request,
+        view: APIView | None = None,  # noqa: ARG002
+    ) -> list[Any] | None:
+        """Paginate the queryset with the async ORM.
+
+        Args:
+            queryset (QuerySet[Any]): The queryset to paginate.
+            request (Request): The request with the page query parameters.
+            view (APIView | None): The view which paginates the queryset.
+
+        Returns:
+            list[Any] | None: The objects on the requested page, None if the pagination is disabled.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # The count is cached by the paginator, so it is not queried synchronously.
+        if isinstance(paginator, EstimatedCountPaginator):
+            await paginator.acount()
+        else:
+            paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            if isinstance(paginator, EstimatedCountPaginator):
+                self.page = await paginator.apage(page_number)
+            else:
+                self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg) from exc
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+
+        # The page of the exact count keeps the lazy slice of the queryset, which is fetched here.
+        if isinstance(self.page.object_list, QuerySet):
+            self.page.object_list = [obj async for obj in self.page.object_list]
+        return list(self.page.object_list)
+
+
+class EstimatedCountPagination(AsyncPageNumberPagination):
+    """The `AsyncPageNumberPagination` of the large tables, the response flags the estimated count.
+
+    See `EstimatedCountPaginator` for the estimation of the count.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self: Self, data: Any) -> Response:  # noqa: ANN401
+        """Get the response with the page and the flag of the estimated count."""
+        paginator = cast("EstimatedCountPaginator", cast("Page[Any]", self.page).paginator)
+        return Response(
+            {
+                "count": paginator.count,
+                "count_estimated": paginator.estimated,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            },
+        )
+
+    def get_paginated_response_schema(self: Self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Get the schema of the paginated response, with the flag of the estimated count."""
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["required"].append("count_estimated")
+        paginated_schema["properties"] = {
+            "count": paginated_schema["properties"]["count"],
+            "count_estimated": {"type": "boolean", "example": False},
+            **paginated_schema["properties"],
+        }
+        return paginated_schema
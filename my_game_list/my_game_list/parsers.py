@@ -0,0 +1,41 @@
+"""This module contains the JSON parser of the API requests based on orjson.
+
+The parser is enabled by the `MGL_ORJSON_ENABLED` setting, together with the `ORJSONRenderer`.
+"""
+
+import codecs
+from collections.abc import Mapping
+from typing import IO, Any, Self
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from my_game_list.my_game_list.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """The `JSONParser` parsing the data by orjson.
+
+    The orjson parses only UTF-8 and it rejects the NaN and infinite constants, so the requests in the other
+    encodings and the parsing with the `STRICT_JSON` setting disabled are left to the `JSONParser`.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self: Self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Parse the JSON request body."""
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if not self.strict or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            msg = f"JSON parse error - {exc}"
+            raise ParseError(msg) from exc
@@ -0,0 +1,60 @@
+"""This module contains the JSON renderer of the API responses based on orjson.
+
+The renderer is enabled by the `MGL_ORJSON_ENABLED` setting. The output is the same as the output of the
+`JSONRenderer` with the default settings of the REST framework, except for the floats: the floats in the exponent
+notation are written without the sign and the padding of the exponent (`1e16` instead of `1e+16`), and the NaN and
+infinite floats are written as null instead of raising the error.
+"""
+
+from collections.abc import Mapping
+from contextlib import suppress
+from typing import Any, Self
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# The datetimes in UTC end with `Z` and the dictionaries can have the integer keys, as with the `JSONEncoder`.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+# The line and paragraph separators are escaped, so the output is the strict subset of JavaScript.
+JAVASCRIPT_ESCAPES = (("\u2028".encode(), b"\\u2028"), ("\u2029".encode(), b"\\u2029"))
+
+
+class ORJSONRenderer(JSONRenderer):
+    """The `JSONRenderer` serializing the data by orjson.
+
+    The datetimes, dates, times and UUIDs are serialized natively by orjson, the other types (e.g. the decimals,
+    the lazy translations and the querysets) by the `default` of the `JSONEncoder`. The indented output, the output
+    with the escaped non-ASCII characters and the data which orjson cannot serialize (e.g. the integers larger than
+    64 bits) are rendered by the `JSONRenderer`.
+    """
+
+    default = staticmethod(JSONEncoder().default)
+
+    def dumps(self: Self, data: Any) -> bytes:  # noqa: ANN401
+        """Serialize the data into JSON by orjson.
+
+        Raises:
+            orjson.JSONEncodeError: The data cannot be serialized by orjson.
+        """
+        content = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        for separator, escaped in JAVASCRIPT_ESCAPES:
+            if separator in content:
+                content = content.replace(separator, escaped)
+        return content
+
+    def render(
+        self: Self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Render the data into JSON."""
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if not self.ensure_ascii and self.compact and not self.get_indent(accepted_media_type or "", renderer_context):
+            with suppress(orjson.JSONEncodeError):
+                return self.dumps(data)
+        content: bytes = super().render(data, accepted_media_type, renderer_context)
+        return content
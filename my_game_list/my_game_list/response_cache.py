@@ -0,0 +1,119 @@
+"""This module contains the cache of the rendered API responses.
+
+The rendered JSON responses are cached by the full path, the language, the media type and the versions of the models
+they are built from. A change of the model increments its version (`invalidate_cached_responses`), so the responses
+built from the old data are never served again and they expire by `MGL_RESPONSE_CACHE_TIMEOUT`. The compressed
+contents of the response are stored in the cache entry by the `CompressionMiddleware`, so the response is compressed
+only once per cache entry and encoding.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Self
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model
+from django.http import HttpResponse
+from django.utils import translation
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from my_game_list.my_game_list.compression import compress
+
+RESPONSE_KEY_PREFIX = "mgl_response"
+VERSION_KEY_PREFIX = "mgl_response_version"
+
+
+def get_version_key(model: type[Model]) -> str:
+    """Get the cache key of the version of the model."""
+    return f"{VERSION_KEY_PREFIX}:{model._meta.label_lower}"  # noqa: SLF001
+
+
+def invalidate_cached_responses(model: type[Model]) -> None:
+    """Invalidate the cached responses and the other data cached by the version of the model, by incrementing it."""
+    key = get_version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The version is missing, so there are no cached responses with the version either.
+        cache.set(key, 1, timeout=None)
+
+
+@dataclass
+class CachedResponse:
+    """The rendered response stored in the cache, with its compressed contents."""
+
+    key: str
+    """The cache key of the response."""
+    content: bytes
+    """The rendered content of the response."""
+    content_type: str
+    """The content type of the response."""
+    encoded: dict[str, bytes] = field(default_factory=dict)
+    """The compressed contents of the response by their encoding."""
+
+    @classmethod
+    def get(cls: type[Self], request: Request, models: Iterable[type[Model]]) -> "tuple[str, Self | None]":
+        """Get the cached response of the request.
+
+        Args:
+            request (Request): The request with the negotiated renderer.
+            models (Iterable[type[Model]]): The models the response is built from.
+
+        Returns:
+            tuple[str, CachedResponse | None]: The cache key of the response and the cached response, None if
+                the response is not cached.
+        """
+        version_keys = [get_version_key(model) for model in models]
+        versions = cache.get_many(version_keys)
+        parts = [
+            request.get_full_path(),
+            translation.get_language() or "",
+            request.accepted_media_type or "",
+            *(str(versions.get(version_key, 0)) for version_key in version_keys),
+        ]
+        key = f"{RESPONSE_KEY_PREFIX}:{hashlib.sha256('|'.join(parts).encode()).hexdigest()}"
+        cached_response: Self | None = cache.get(key)
+        return key, cached_response
+
+    def to_response(self: Self) -> HttpResponse:
+        """Create the response with the cached content, it keeps the cached response for the compression."""
+        response = HttpResponse(self.content, content_type=self.content_type)
+        response.cached_response = self  # type: ignore[attr-defined]
+        return response
+
+    def get_encoded(self: Self, encoding: str) -> bytes:
+        """Get the content compressed by the encoding, it is compressed and stored in the cache on the first use."""
+        if (content := self.encoded.get(encoding)) is None:
+            content = self.encoded[encoding] = compress(self.content, encoding)
+            cache.set(self.key, self, timeout=settings.MGL_RESPONSE_CACHE_TIMEOUT)
+        return content
+
+
+def is_cacheable(request: Request) -> bool:
+    """Whether the response to the request can be cached, only the JSON responses are cached."""
+    return settings.MGL_RESPONSE_CACHE_TIMEOUT > 0 and request.accepted_renderer.format == "json"
+
+
+def cache_response(key: str, response: Response) -> Response:
+    """Store the response in the cache after it is rendered, the responses with an error are not stored.
+
+    Args:
+        key (str): The cache key of the response, from `CachedResponse.get`.
+        response (Response): The response which is not rendered yet.
+
+    Returns:
+        Response: The same response.
+    """
+
+    def store(rendered: Response) -> None:
+        if rendered.status_code == status.HTTP_200_OK:
+            cached_response = CachedResponse(key, rendered.content, rendered["Content-Type"])
+            cache.set(key, cached_response, timeout=settings.MGL_RESPONSE_CACHE_TIMEOUT)
+            rendered.cached_response = cached_response  # type: ignore[attr-defined]
+
+    response.add_post_render_callback(store)
+    return response
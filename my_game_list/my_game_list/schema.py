@@ -0,0 +1,119 @@
+"""This module contains the cache of the rendered OpenAPI schema."""
+
+import gzip
+import hashlib
+import logging
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar, Self
+
+from django.conf import settings
+
+from my_game_list import __version__
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = ".".join(map(str, __version__))
+
+
+@dataclass(frozen=True)
+class RenderedSchema:
+    """The rendered OpenAPI schema with its gzipped content and ETag."""
+
+    content: bytes
+    """The rendered schema."""
+    gzipped: bytes
+    """The gzipped rendered schema."""
+    etag: str
+    """The ETag of the rendered schema, the gzipped content has the `-gzip` suffix."""
+
+    @classmethod
+    def from_content(cls: type[Self], content: bytes) -> Self:
+        """Create the schema from the rendered content.
+
+        Args:
+            content (bytes): The rendered schema.
+
+        Returns:
+            RenderedSchema: The schema with the gzipped content and ETag.
+        """
+        return cls(content, gzip.compress(content, mtime=0), f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+
+    def get_etag(self: Self, *, gzipped: bool) -> str:
+        """Get the ETag of the gzipped or the plain content."""
+        return f'{self.etag[:-1]}-gzip"' if gzipped else self.etag
+
+
+class SchemaCache:
+    """The rendered OpenAPI schemas by the format and the language, for the current application version.
+
+    The schemas are kept in the memory of the process and stored in `MGL_OPENAPI_SCHEMA_DIR`, so they are
+    generated only once for all the workers. The files are named by `__version__`, so a new version of
+    the application does not serve the old schema.
+    """
+
+    _schemas: ClassVar[dict[tuple[str, str], RenderedSchema]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def get_path(renderer_format: str, language: str) -> Path:
+        """Get the path of the stored schema file."""
+        return Path(settings.MGL_OPENAPI_SCHEMA_DIR) / f"schema-{SCHEMA_VERSION}-{language}.{renderer_format}"
+
+    @classmethod
+    def get(cls: type[Self], renderer_format: str, language: str) -> RenderedSchema | None:
+        """Get the rendered schema from the memory or the stored file.
+
+        Args:
+            renderer_format (str): The format of the schema, e.g. `json` or `yaml`.
+            language (str): The language of the schema descriptions.
+
+        Returns:
+            RenderedSchema | None: The rendered schema, None if it is not generated yet.
+        """
+        key = (renderer_format, language)
+        if (schema := cls._schemas.get(key)) is not None:
+            return schema
+        try:
+            content = cls.get_path(renderer_format, language).read_bytes()
+        except OSError:
+            return None
+        with cls._lock:
+            return cls._schemas.setdefault(key, RenderedSchema.from_content(content))
+
+    @classmethod
+    def set(cls: type[Self], renderer_format: str, language: str, content: bytes) -> RenderedSchema:
+        """Store the rendered schema in the memory and in the file, removing the schemas of the other versions.
+
+        Args:
+            renderer_format (str): The format of the schema, e.g. `json` or `yaml`.
+            language (str): The language of the schema descriptions.
+            content (bytes): The rendered schema.
+
+        Returns:
+            RenderedSchema: The stored schema.
+        """
+        schema = RenderedSchema.from_content(content)
+        with cls._lock:
+            cls._schemas[(renderer_format, language)] = schema
+        path = cls.get_path(renderer_format, language)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # The file is written under a temporary name first, so other workers never read a partial schema.
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=".schema-", delete=False) as file:
+                file.write(content)
+            Path(file.name).replace(path)
+            for old_path in path.parent.glob("schema-*"):
+                if not old_path.name.startswith(f"schema-{SCHEMA_VERSION}-"):
+                    old_path.unlink(missing_ok=True)
+        except OSError:
+            logger.exception("Unable to store the OpenAPI schema in %s.", path)
+        return schema
+
+    @classmethod
+    def clear(cls: type[Self]) -> None:
+        """Clear the schemas kept in the memory, the stored files are kept."""
+        with cls._lock:
+            cls._schemas.clear()
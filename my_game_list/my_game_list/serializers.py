@@ -1,9 +1,11 @@
-"""This module contains the base class for all dictionary serializers."""
+"""This module contains the base class for all dictionary serializers and the slow query serializer."""
 
 from typing import Any
 
 from rest_framework import serializers
 
+from my_game_list.my_game_list.models import SlowQuery
+
 
 class BaseDictionarySerializer(serializers.ModelSerializer[Any]):
     """A base serializer for dictionary models."""
@@ -12,3 +14,13 @@ class Meta:
         """Meta data for dictionary models."""
 
         fields: tuple[str, ...] = ("id", "name")
+
+
+class SlowQuerySerializer(serializers.ModelSerializer[SlowQuery]):
+    """A serializer for the slow query log."""
+
+    class Meta:
+        """Meta data for the slow query serializer."""
+
+        model = SlowQuery
+        fields = ("id", "created_at", "duration", "view_name", "sql", "fingerprint", "params", "stack", "explain")
@@ -0,0 +1,154 @@
+"""This module contains the profiling of the application startup.
+
+The module is run by the `profile_startup` command in a new interpreter with `-X importtime`, it sets up Django
+with the timings of the `django.setup()` phases and prints them as JSON. The import times written by the interpreter
+to the standard error are parsed into a tree by `parse_import_times`.
+"""
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Self
+
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<indent>\s*)(?P<name>\S+)$")
+
+
+@dataclass
+class PhaseTiming:
+    """The duration of a phase of the startup."""
+
+    name: str
+    """The name of the phase."""
+    seconds: float
+    """The duration of the phase in seconds."""
+
+
+@dataclass
+class ImportTiming:
+    """The import time of a module, reported by `python -X importtime`."""
+
+    name: str
+    """The name of the imported module."""
+    self_us: int
+    """The time of the module import without its nested imports in microseconds."""
+    cumulative_us: int
+    """The time of the module import including its nested imports in microseconds."""
+    children: list["ImportTiming"] = field(default_factory=list)
+    """The modules imported first by this module."""
+
+
+def parse_import_times(lines: Sequence[str]) -> list[ImportTiming]:
+    """Parse the output of `python -X importtime` into the tree of the imports.
+
+    The modules are reported after their nested imports, which are indented by two more spaces.
+
+    Args:
+        lines (Sequence[str]): The lines of the standard error, the lines without the import time are skipped.
+
+    Returns:
+        list[ImportTiming]: The top level imports, in the order of the import.
+    """
+    pending: dict[int, list[ImportTiming]] = {}
+    for line in lines:
+        if (match := IMPORT_TIME_RE.match(line.rstrip("\n"))) is None:
+            continue
+        level = len(match["indent"]) // 2
+        timing = ImportTiming(match["name"], int(match["self"]), int(match["cumulative"]), pending.pop(level + 1, []))
+        pending.setdefault(level, []).append(timing)
+    return pending.get(0, [])
+
+
+def iter_import_times(timings: Sequence[ImportTiming]) -> Iterator[ImportTiming]:
+    """Iterate over all the imports of the tree."""
+    for timing in timings:
+        yield timing
+        yield from iter_import_times(timing.children)
+
+
+class StartupProfiler:
+    """The profiler of the `django.setup()` phases: settings, logging, and app configs, models and ready per app."""
+
+    def __init__(self: Self) -> None:
+        """Initialize the profiler."""
+        self.phases: list[PhaseTiming] = []
+
+    @contextmanager
+    def measure(self: Self, name: str) -> Iterator[None]:
+        """Measure the duration of the phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(PhaseTiming(name, time.perf_counter() - start))
+
+    def timed(self: Self, name: str, function: Callable[[], None]) -> Callable[[], None]:
+        """Wrap the function, measuring its duration as the phase."""
+
+        def wrapper() -> None:
+            with self.measure(name):
+                function()
+
+        return wrapper
+
+    def setup(self: Self, *, urls: bool = True) -> list[PhaseTiming]:
+        """Set up Django in the same steps as `django.setup()`, measuring their durations.
+
+        Args:
+            urls (bool): Whether the URL configuration is loaded as well, as by the first request.
+
+        Returns:
+            list[PhaseTiming]: The durations of the phases, in the order of the startup.
+        """
+        from django.apps import AppConfig, apps
+        from django.conf import settings
+        from django.urls import get_resolver, set_script_prefix
+        from django.utils.log import configure_logging
+
+        with self.measure("settings"):
+            _ = settings.INSTALLED_APPS
+        with self.measure("logging"):
+            configure_logging(settings.LOGGING_CONFIG, settings.LOGGING)
+        set_script_prefix("/" if settings.FORCE_SCRIPT_NAME is None else settings.FORCE_SCRIPT_NAME)
+
+        original_create = AppConfig.__dict__["create"]
+        create = original_create.__func__
+
+        def timed_create(cls: type[AppConfig], entry: str) -> AppConfig:
+            with self.measure(f"app config {entry}"):
+                app_config: AppConfig = create(cls, entry)
+            app_config.import_models = self.timed(  # type: ignore[method-assign]
+                f"models {app_config.label}",
+                app_config.import_models,
+            )
+            app_config.ready = self.timed(f"ready {app_config.label}", app_config.ready)  # type: ignore[method-assign]
+            return app_config
+
+        AppConfig.create = classmethod(timed_create)  # type: ignore[method-assign,assignment]
+        try:
+            apps.populate(settings.INSTALLED_APPS)
+        finally:
+            AppConfig.create = original_create  # type: ignore[method-assign]
+        if urls:
+            with self.measure("urlconf"):
+                _ = get_resolver().url_patterns
+        return self.phases
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Set up Django and print the durations of the phases as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-urls", action="store_true", help="Do not load the URL configuration.")
+    arguments = parser.parse_args(argv)
+
+    phases = StartupProfiler().setup(urls=not arguments.no_urls)
+    result: list[dict[str, Any]] = [asdict(phase) for phase in phases]
+    print(json.dumps(result))  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
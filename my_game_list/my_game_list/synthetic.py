@@ -0,0 +1,484 @@
+"""This module contains the generator of the synthetic data for the benchmarks of the application.
+
+The data are reproducible for the seed and skewed like the real data: the games are picked by the Zipf distribution
+of their popularity and the numbers of the game lists, follows and friends of the users are Pareto distributed,
+so a few users and games have the most of the rows.
+
+The rows are built as plain tuples with explicit primary keys and written by `COPY` on PostgreSQL (psycopg 3)
+or by the batched `INSERT` statements on the other databases, the model instances are never created.
+"""
+
+import itertools
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property
+from typing import Any, Self
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.models import Max
+
+from my_game_list.friendships.models import Friendship, FriendshipRequest
+from my_game_list.games.models import (
+    Company,
+    Game,
+    GameFollow,
+    GameList,
+    GameListStatus,
+    GameMedia,
+    GameReview,
+    Genre,
+    Platform,
+)
+from my_game_list.users.models import Gender, User
+
+REFERENCE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+"""The time of the newest generated rows, the data do not depend on the time of the generation."""
+HISTORY_DAYS = 3 * 365
+FIRST_RELEASE_DATE = date(1980, 1, 1)
+IGDB_ID_OFFSET = 1_000_000_000
+"""The synthetic IGDB IDs are above the IDs of the real IGDB data."""
+PARETO_ALPHA = 1.5
+STATUS_WEIGHTS = {
+    GameListStatus.COMPLETED: 35,
+    GameListStatus.PLAN_TO_PLAY: 25,
+    GameListStatus.PLAYING: 20,
+    GameListStatus.DROPPED: 10,
+    GameListStatus.ON_HOLD: 10,
+}
+SCORED_RATE = 0.8
+OWNED_RATE = 0.5
+REJECTED_REQUEST_RATE = 0.3
+DEFAULT_PASSWORD = "synthetic"  # noqa: S105
+"""The password of the generated users, so the benchmarks can log in as any of them."""
+REVIEW_WORDS = (
+    "great story gameplay graphics music boring long short hard easy fun combat world characters ending "
+    "multiplayer puzzle open classic sequel remaster bugs performance controls recommended"
+).split()
+
+
+@dataclass(frozen=True)
+class SeedSize:
+    """The size of the generated data, the per user numbers are the means of the skewed distributions."""
+
+    users: int
+    games: int
+    companies: int
+    genres: int
+    platforms: int
+    game_lists_per_user: float
+    follows_per_user: float
+    friends_per_user: float
+    requests_per_user: float
+    review_rate: float = 0.1
+    """The fraction of the scored game lists with the review."""
+    zipf_exponent: float = 1.07
+    """The exponent of the Zipf distribution of the game and user popularity."""
+
+
+SIZE_PRESETS = {
+    "tiny": SeedSize(
+        users=50,
+        games=200,
+        companies=20,
+        genres=10,
+        platforms=10,
+        game_lists_per_user=10,
+        follows_per_user=2,
+        friends_per_user=3,
+        requests_per_user=1,
+    ),
+    "small": SeedSize(
+        users=1_000,
+        games=5_000,
+        companies=300,
+        genres=25,
+        platforms=40,
+        game_lists_per_user=40,
+        follows_per_user=5,
+        friends_per_user=8,
+        requests_per_user=1,
+    ),
+    "medium": SeedSize(
+        users=20_000,
+        games=30_000,
+        companies=2_000,
+        genres=25,
+        platforms=80,
+        game_lists_per_user=50,
+        follows_per_user=8,
+        friends_per_user=10,
+        requests_per_user=2,
+    ),
+    "large": SeedSize(
+        users=100_000,
+        games=150_000,
+        companies=10_000,
+        genres=25,
+        platforms=150,
+        game_lists_per_user=60,
+        follows_per_user=10,
+        friends_per_user=12,
+        requests_per_user=2,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Table:
+    """The table of the model with the written fields, in the order of the values of the rows."""
+
+    model: type[models.Model]
+    fields: tuple[str, ...]
+
+    @cached_property
+    def model_fields(self: Self) -> list[models.Field[Any, Any]]:
+        """The written fields of the model."""
+        return [self.model._meta.get_field(name) for name in self.fields]  # type: ignore[misc]  # noqa: SLF001
+
+    @property
+    def db_table(self: Self) -> str:
+        """The quoted name of the table."""
+        return connection.ops.quote_name(self.model._meta.db_table)  # noqa: SLF001
+
+    @property
+    def columns(self: Self) -> str:
+        """The quoted columns of the written fields."""
+        return ", ".join(connection.ops.quote_name(field.column) for field in self.model_fields)
+
+
+class RowWriter(ABC):
+    """The writer of the rows buffered per table, the full buffers are written in batches."""
+
+    def __init__(self: Self, batch_size: int) -> None:
+        """Initialize the writer.
+
+        Args:
+            batch_size (int): The number of the rows written at once.
+        """
+        self.batch_size = batch_size
+        self.buffers: defaultdict[Table, list[tuple[Any, ...]]] = defaultdict(list)
+        self.counts: Counter[str] = Counter()
+
+    def add(self: Self, table: Table, row: tuple[Any, ...]) -> None:
+        """Add the row of the table, the buffer of the table is written when it is full."""
+        buffer = self.buffers[table]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush(table)
+
+    def flush(self: Self, table: Table) -> None:
+        """Write the buffered rows of the table."""
+        if rows := self.buffers.pop(table, []):
+            self.write(table, rows)
+            self.counts[table.model._meta.db_table] += len(rows)  # noqa: SLF001
+
+    def flush_all(self: Self) -> None:
+        """Write the buffered rows of all tables."""
+        for table in list(self.buffers):
+            self.flush(table)
+
+    @abstractmethod
+    def write(self: Self, table: Table, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Write the rows of the table."""
+
+
+class CopyRowWriter(RowWriter):
+    """The writer of the rows by the `COPY` statement of PostgreSQL."""
+
+    def write(self: Self, table: Table, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Write the rows of the table by `COPY ... FROM STDIN`."""
+        sql = f"COPY {table.db_table} ({table.columns}) FROM STDIN"
+        with connection.cursor() as cursor, cursor.cursor.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+
+class InsertRowWriter(RowWriter):
+    """The writer of the rows by the batched `INSERT` statements, the values are adapted to the database first."""
+
+    def write(self: Self, table: Table, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Write the rows of the table by `INSERT` executed for the batch."""
+        adapters: list[Callable[[Any], Any] | None] = [
+            (
+                connection.ops.adapt_datetimefield_value
+                if isinstance(field, models.DateTimeField)
+                else connection.ops.adapt_datefield_value if isinstance(field, models.DateField) else None
+            )
+            for field in table.model_fields
+        ]
+        if any(adapters):
+            rows = [
+                tuple(
+                    value if adapter is None else adapter(value) for value, adapter in zip(row, adapters, strict=True)
+                )
+                for row in rows
+            ]
+        placeholders = ", ".join(["%s"] * len(table.fields))
+        # The table and the columns are quoted names of the model, the values are passed as the parameters.
+        sql = f"INSERT INTO {table.db_table} ({table.columns}) VALUES ({placeholders})"  # noqa: S608
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+
+
+def get_row_writer(batch_size: int) -> RowWriter:
+    """Get the fastest writer of the rows supported by the database."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            # The `COPY` of psycopg 2 is a different API, it is written by `INSERT` then.
+            if hasattr(cursor.cursor, "copy"):
+                return CopyRowWriter(batch_size)
+    return InsertRowWriter(batch_size)
+
+
+class ZipfSampler:
+    """The sampler of the items by the Zipf distribution, the first item is the most popular one."""
+
+    max_rounds = 8
+    """The number of the sampling rounds, the missing distinct items are then picked uniformly."""
+
+    def __init__(self: Self, items: Sequence[int], exponent: float, rng: random.Random) -> None:
+        """Initialize the sampler.
+
+        Args:
+            items (Sequence[int]): The items ordered by their popularity.
+            exponent (float): The exponent of the Zipf distribution.
+            rng (random.Random): The random generator.
+        """
+        self.items = items
+        self.rng = rng
+        self.cum_weights = list(itertools.accumulate(1 / rank**exponent for rank in range(1, len(items) + 1)))
+
+    def sample(self: Self, count: int) -> list[int]:
+        """Sample the distinct items, at most half of them."""
+        count = min(count, len(self.items) // 2)
+        sampled: dict[int, None] = {}
+        for _ in range(self.max_rounds):
+            if len(sampled) >= count:
+                return list(sampled)[:count]
+            sampled.update(dict.fromkeys(self.rng.choices(self.items, cum_weights=self.cum_weights, k=count)))
+        # The unpopular items of the long tail are rarely sampled, they complete the large samples uniformly.
+        missing = [item for item in self.items if item not in sampled]
+        return [*sampled, *self.rng.sample(missing, max(count - len(sampled), 0))][:count]
+
+
+class SyntheticDataGenerator:
+    """The generator of the users, games, game lists, reviews, follows and friendships."""
+
+    def __init__(
+        self: Self,
+        size: SeedSize,
+        writer: RowWriter,
+        *,
+        seed: int = 0,
+        password: str = DEFAULT_PASSWORD,
+    ) -> None:
+        """Initialize the generator.
+
+        Args:
+            size (SeedSize): The size of the generated data.
+            writer (RowWriter): The writer of the rows.
+            seed (int): The seed of the random generator, the same seed generates the same data.
+            password (str): The password of all the generated users.
+        """
+        self.size = size
+        self.writer = writer
+        self.rng = random.Random(seed)  # noqa: S311
+        self.password = password
+        self.next_ids: dict[type[models.Model], int] = {}
+
+    def allocate_ids(self: Self, model: type[models.Model], count: int) -> range:
+        """Allocate the primary keys of the new rows of the model, after the existing rows."""
+        if model not in self.next_ids:
+            max_id = model._default_manager.aggregate(max_id=Max("id"))["max_id"]  # noqa: SLF001
+            self.next_ids[model] = (max_id or 0) + 1
+        first_id = self.next_ids[model]
+        self.next_ids[model] += count
+        return range(first_id, first_id + count)
+
+    def random_time(self: Self, after: datetime | None = None) -> datetime:
+        """Get a random time of the history, after the given time."""
+        start = after or REFERENCE_TIME - timedelta(days=HISTORY_DAYS)
+        return start + (REFERENCE_TIME - start) * self.rng.random()
+
+    def skewed_count(self: Self, mean: float) -> int:
+        """Get the Pareto distributed count with the mean."""
+        return max(1, int(self.rng.paretovariate(PARETO_ALPHA) * mean * (PARETO_ALPHA - 1) / PARETO_ALPHA))
+
+    def popularity_sampler(self: Self, ids: Iterable[int]) -> ZipfSampler:
+        """Get the sampler of the IDs, the popularity of the IDs is in a random order."""
+        items = list(ids)
+        self.rng.shuffle(items)
+        return ZipfSampler(items, self.size.zipf_exponent, self.rng)
+
+    def generate_dictionary(self: Self, model: type[Company | Genre | Platform], count: int) -> ZipfSampler:
+        """Generate the rows of the dictionary model, returning the sampler of their IDs."""
+        extra_field = {Company: "company_logo_id", Platform: "abbreviation"}.get(model)
+        table = Table(model, ("id", "name", "igdb_id", *filter(None, (extra_field,))))
+        ids = self.allocate_ids(model, count)
+        for item_id in ids:
+            row = (item_id, f"Synthetic {model._meta.model_name} {item_id}", IGDB_ID_OFFSET + item_id)  # noqa: SLF001
+            self.writer.add(table, (*row, "") if extra_field else row)
+        return self.popularity_sampler(ids)
+
+    def generate_users(self: Self) -> ZipfSampler:
+        """Generate the users with the same password, returning the sampler of their IDs."""
+        fields = ("id", "password", "last_login", "is_superuser", "is_staff", "is_active", "date_joined")
+        table = Table(User, (*fields, "username", "email", "gender"))
+        password = make_password(self.password)
+        genders = list(Gender)
+        ids = self.allocate_ids(User, self.size.users)
+        for user_id in ids:
+            username = f"synthetic_user_{user_id}"
+            row = (user_id, password, None, False, False, True, self.random_time())
+            self.writer.add(table, (*row, username, f"{username}@example.com", self.rng.choice(genders)))
+        return self.popularity_sampler(ids)
+
+    def generate_games(self: Self) -> tuple[ZipfSampler, dict[int, float]]:
+        """Generate the games with their companies, genres and platforms.
+
+        Returns:
+            tuple[ZipfSampler, dict[int, float]]: The sampler of the game IDs and the mean score by the game ID.
+        """
+        companies = self.generate_dictionary(Company, self.size.companies)
+        genres = self.generate_dictionary(Genre, self.size.genres)
+        platforms = self.generate_dictionary(Platform, self.size.platforms)
+        fields = ("id", "igdb_id", "title", "created_at", "last_modified_at", "release_date")
+        table = Table(Game, (*fields, "cover_image_id", "summary", "publisher", "developer"))
+        genres_table = Table(Game.genres.through, ("game", "genre"))
+        platforms_table = Table(Game.platforms.through, ("game", "platform"))
+        release_days = (REFERENCE_TIME.date() - FIRST_RELEASE_DATE).days
+
+        mean_scores = {}
+        ids = self.allocate_ids(Game, self.size.games)
+        for game_id in ids:
+            created_at = self.random_time()
+            # The most of the released games are recent, a few of the games are not released yet.
+            release_date = FIRST_RELEASE_DATE + timedelta(days=int(self.rng.triangular(0, release_days, release_days)))
+            publisher, developer = companies.sample(2)
+            row = (game_id, IGDB_ID_OFFSET + game_id, f"Synthetic game {game_id}", created_at)
+            dates = (self.random_time(created_at), None if self.rng.random() < 0.05 else release_date)  # noqa: PLR2004
+            self.writer.add(table, (*row, *dates, "", "", publisher, developer))
+            for genre_id in genres.sample(self.rng.randint(1, 3)):
+                self.writer.add(genres_table, (game_id, genre_id))
+            for platform_id in platforms.sample(self.rng.randint(1, 4)):
+                self.writer.add(platforms_table, (game_id, platform_id))
+            mean_scores[game_id] = self.rng.gauss(7, 1.2)
+        return self.popularity_sampler(ids), mean_scores
+
+    def get_score(self: Self, status: GameListStatus, mean_score: float) -> int | None:
+        """Get the score of the game list, the planned and some other games are not scored."""
+        if status == GameListStatus.PLAN_TO_PLAY or self.rng.random() > SCORED_RATE:
+            return None
+        return min(10, max(1, round(self.rng.gauss(mean_score, 1.5))))
+
+    def generate_game_lists(self: Self, users: ZipfSampler, games: ZipfSampler, mean_scores: dict[int, float]) -> None:
+        """Generate the game lists of the users with the owned media and the reviews of the scored games."""
+        fields = ("id", "score", "status", "created_at", "last_modified_at", "game", "user")
+        table = Table(GameList, fields)
+        owned_on_table = Table(GameList.owned_on.through, ("gamelist", "gamemedia"))
+        review_table = Table(GameReview, ("id", "created_at", "review", "game", "user"))
+        media = list(GameMedia.objects.values_list("id", flat=True))
+        statuses, weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+
+        for user_id in users.items:
+            game_ids = games.sample(self.skewed_count(self.size.game_lists_per_user))
+            user_statuses = self.rng.choices(statuses, weights, k=len(game_ids))
+            ids = self.allocate_ids(GameList, len(game_ids))
+            for game_list_id, game_id, status in zip(ids, game_ids, user_statuses, strict=True):
+                created_at = self.random_time()
+                score = self.get_score(status, mean_scores[game_id])
+                row = (game_list_id, score, status, created_at, self.random_time(created_at), game_id, user_id)
+                self.writer.add(table, row)
+                if media and self.rng.random() < OWNED_RATE:
+                    self.writer.add(owned_on_table, (game_list_id, self.rng.choice(media)))
+                if score is not None and self.rng.random() < self.size.review_rate:
+                    review = " ".join(self.rng.choices(REVIEW_WORDS, k=self.rng.randint(10, 60)))
+                    review_id = self.allocate_ids(GameReview, 1)[0]
+                    self.writer.add(review_table, (review_id, self.random_time(created_at), review, game_id, user_id))
+
+    def generate_follows(self: Self, users: ZipfSampler, games: ZipfSampler) -> None:
+        """Generate the follows of the popular games."""
+        table = Table(GameFollow, ("id", "created_at", "game", "user"))
+        for user_id in users.items:
+            game_ids = games.sample(self.skewed_count(self.size.follows_per_user))
+            for follow_id, game_id in zip(self.allocate_ids(GameFollow, len(game_ids)), game_ids, strict=True):
+                self.writer.add(table, (follow_id, self.random_time(), game_id, user_id))
+
+    def generate_friendships(self: Self, users: ZipfSampler) -> None:
+        """Generate the friendship graph, the popular users have the most friends, and the friendship requests."""
+        pairs: dict[tuple[int, int], None] = {}
+        for user_id in users.items:
+            # Every pair is the friendship of both of the users.
+            for friend_id in users.sample(self.skewed_count(self.size.friends_per_user / 2)):
+                if friend_id != user_id:
+                    pairs[min(user_id, friend_id), max(user_id, friend_id)] = None
+        table = Table(Friendship, ("id", "created_at", "user", "friend"))
+        ids = iter(self.allocate_ids(Friendship, 2 * len(pairs)))
+        for user_id, friend_id in pairs:
+            created_at = self.random_time()
+            self.writer.add(table, (next(ids), created_at, user_id, friend_id))
+            self.writer.add(table, (next(ids), created_at, friend_id, user_id))
+
+        fields = ("id", "message", "rejected_at", "created_at", "last_modified_at", "sender", "receiver")
+        requests_table = Table(FriendshipRequest, fields)
+        requests: set[tuple[int, int]] = set()
+        for sender_id in users.items:
+            for receiver_id in users.sample(self.skewed_count(self.size.requests_per_user)):
+                pair = (min(sender_id, receiver_id), max(sender_id, receiver_id))
+                if sender_id == receiver_id or pair in pairs or pair in requests:
+                    continue
+                requests.add(pair)
+                created_at = self.random_time()
+                rejected_at = self.random_time(created_at) if self.rng.random() < REJECTED_REQUEST_RATE else None
+                row = (self.allocate_ids(FriendshipRequest, 1)[0], "", rejected_at, created_at)
+                self.writer.add(requests_table, (*row, rejected_at or created_at, sender_id, receiver_id))
+
+    def generate(self: Self) -> Counter[str]:
+        """Generate all the data in a single transaction.
+
+        Returns:
+            Counter[str]: The number of the written rows by the table.
+        """
+        with transaction.atomic():
+            users = self.generate_users()
+            games, mean_scores = self.generate_games()
+            self.generate_game_lists(users, games, mean_scores)
+            self.generate_follows(users, games)
+            self.generate_friendships(users)
+            self.writer.flush_all()
+            # The primary keys were written explicitly, so the sequences continue after them.
+            with connection.cursor() as cursor:
+                for statement in connection.ops.sequence_reset_sql(no_style(), list(self.next_ids)):
+                    cursor.execute(statement)
+        return self.writer.counts
+
+
+def seed_synthetic_data(
+    size: SeedSize,
+    *,
+    seed: int = 0,
+    batch_size: int = 10_000,
+    password: str = DEFAULT_PASSWORD,
+) -> tuple[Counter[str], float]:
+    """Generate the synthetic data by the fastest writer supported by the database.
+
+    Args:
+        size (SeedSize): The size of the generated data.
+        seed (int): The seed of the random generator.
+        batch_size (int): The number of the rows written at once.
+        password (str): The password of all the generated users.
+
+    Returns:
+        tuple[Counter[str], float]: The number of the written rows by the table and the duration in seconds.
+    """
+    start = time.perf_counter()
+    generator = SyntheticDataGenerator(size, get_row_writer(batch_size), seed=seed, password=password)
+    counts = generator.generate()
+    return counts, time.perf_counter() - start
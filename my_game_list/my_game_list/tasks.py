@@ -0,0 +1,29 @@
+"""This module contains the Celery tasks shared by all applications."""
+
+from django.conf import settings
+from django.core.management import call_command
+
+from my_game_list.my_game_list.celery import app
+from my_game_list.my_game_list.schema import SchemaCache
+
+
+@app.task
+def warm_openapi_schema_cache() -> bool:
+    """Render the OpenAPI schemas into the cache when any of them is missing (e.g. removed with the temporary files).
+
+    Returns:
+        bool: Whether the schemas were rendered.
+    """
+    if not settings.MGL_OPENAPI_SCHEMA_CACHE_ENABLED:
+        return False
+    from my_game_list.my_game_list.views import CachedSpectacularAPIView
+
+    renderer_formats = {renderer_class.format for renderer_class in CachedSpectacularAPIView.renderer_classes}
+    if all(
+        SchemaCache.get_path(renderer_format, language).exists()
+        for renderer_format in renderer_formats
+        for language, _ in settings.LANGUAGES
+    ):
+        return False
+    call_command("cache_openapi_schema")
+    return True
@@ -4,17 +4,21 @@
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path, re_path
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+from rest_framework import routers
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from my_game_list.my_game_list.metrics import custom_export_to_django_view
-from my_game_list.my_game_list.views import ApiVersion
+from my_game_list.my_game_list.views import ApiVersion, CachedSpectacularAPIView, SlowQueryViewSet
+
+router = routers.SimpleRouter()
+router.register("slow-queries", SlowQueryViewSet, basename="slow-queries")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("prometheus/metrics", custom_export_to_django_view, name="prometheus-django-metrics"),
     path("version/", ApiVersion.as_view(), name="api-version"),
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
     path(
         "api/schema/swagger-ui",
         SpectacularSwaggerView.as_view(url_name="schema"),
@@ -26,6 +30,7 @@
     path("api/user/", include("my_game_list.users.urls")),
     path("api/game/", include("my_game_list.games.urls")),
     path("api/friendship/", include("my_game_list.friendships.urls")),
+    path("api/", include(router.urls)),
 ]
 
 if "rosetta" in settings.INSTALLED_APPS:
@@ -1,15 +1,29 @@
-"""This module contains the view for api version."""
+"""This module contains the views for api version, the OpenAPI schema and the slow query log."""
 
 from collections.abc import Iterable, Mapping
 from typing import Any, Self
 
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBase, HttpResponseNotModified
+from django.utils import translation
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from drf_spectacular.utils import extend_schema, inline_serializer
-from rest_framework.permissions import AllowAny
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework.mixins import ListModelMixin, RetrieveModelMixin
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import CharField
 from rest_framework.views import APIView
+from rest_framework.viewsets import GenericViewSet
 
 from my_game_list import __version__
+from my_game_list.my_game_list.compression import parse_accept_encoding
+from my_game_list.my_game_list.filters import SlowQueryFilterSet
+from my_game_list.my_game_list.models import SlowQuery
+from my_game_list.my_game_list.schema import SchemaCache
+from my_game_list.my_game_list.serializers import SlowQuerySerializer
 
 
 class ApiVersion(APIView):
@@ -33,3 +47,55 @@ def get(self: Self, *args: Iterable[Any], **kwargs: Mapping[str, Any]) -> Respon
         """GET method for the version of the application."""
         version = ".".join(map(str, __version__))
         return Response({"version": version})
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """The OpenAPI schema view serving the schema rendered only once per format and language.
+
+    The rendered schema is kept in the `SchemaCache` for the current `__version__` and served with an ETag,
+    gzipped when the client accepts it. The schemas of the other API versions and unsupported languages are
+    generated on every request as by the `SpectacularAPIView`.
+    """
+
+    def _get_schema_response(self: Self, request: Request) -> HttpResponseBase:
+        """Get the response with the cached schema, rendering and caching it on the first request."""
+        version = self.api_version or request.version or self._get_version_parameter(request)  # type: ignore[no-untyped-call]
+        language = translation.get_language()
+        if not settings.MGL_OPENAPI_SCHEMA_CACHE_ENABLED or version or language not in dict(settings.LANGUAGES):
+            return super()._get_schema_response(request)  # type: ignore[no-any-return,no-untyped-call]
+
+        renderer = request.accepted_renderer
+        schema = SchemaCache.get(renderer.format, language)
+        if schema is None:
+            data = super()._get_schema_response(request).data  # type: ignore[no-untyped-call]
+            content = renderer.render(data, request.accepted_media_type, self.get_renderer_context())
+            schema = SchemaCache.set(renderer.format, language, content)
+
+        # The schema is cached only gzipped, which is served when the client accepts it with a non-zero quality.
+        qualities = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        gzipped = qualities.get("gzip", qualities.get("*", 0.0)) > 0
+        etag = schema.get_etag(gzipped=gzipped)
+        response: HttpResponseBase
+        if etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", "")):
+            response = HttpResponseNotModified()
+        else:
+            content_type = request.accepted_media_type
+            if renderer.charset:
+                content_type = f"{content_type}; charset={renderer.charset}"
+            response = HttpResponse(schema.gzipped if gzipped else schema.content, content_type=content_type)
+            filename = self._get_filename(request, version)  # type: ignore[no-untyped-call]
+            response["Content-Disposition"] = f'inline; filename="{filename}"'
+            if gzipped:
+                response["Content-Encoding"] = "gzip"
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept", "Accept-Encoding", "Accept-Language"))
+        return response
+
+
+class SlowQueryViewSet(ListModelMixin, RetrieveModelMixin, GenericViewSet[SlowQuery]):
+    """Admin only ViewSet for the queries captured by the slow query log."""
+
+    queryset = SlowQuery.objects.all()
+    serializer_class = SlowQuerySerializer
+    permission_classes = (IsAdminUser,)
+    filterset_class = SlowQueryFilterSet
@@ -0,0 +1,132 @@
+"""This module contains the warm up of the lazily initialized caches of the application.
+
+The gunicorn master with the preloaded application warms up the caches before it forks the workers, so the workers
+share their memory pages (copy-on-write) instead of building their own copies on the first requests.
+"""
+
+import logging
+import time
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import translation
+from rest_framework.serializers import BaseSerializer
+
+from my_game_list.games.models import Genre, Platform
+from my_game_list.my_game_list.filters import get_dictionary_ids
+from my_game_list.my_game_list.schema import SchemaCache
+
+logger = logging.getLogger(__name__)
+
+
+def iter_url_patterns(patterns: Sequence[URLPattern | URLResolver]) -> Iterator[URLPattern]:
+    """Iterate over the URL patterns, including the patterns of the included resolvers."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            # The reverse lookups of the included resolver are populated separately for every language.
+            _ = pattern.reverse_dict
+            yield from iter_url_patterns(pattern.url_patterns)
+        else:
+            yield pattern
+
+
+def build_serializer_fields(serializer_class: type[BaseSerializer[Any]]) -> bool:
+    """Build the fields of the serializer, returning whether they were built."""
+    try:
+        _ = serializer_class(context={}).fields  # type: ignore[attr-defined]
+    except Exception:  # noqa: BLE001
+        # The serializer requiring the request in the context is built by the first request instead.
+        logger.debug("Unable to build the fields of %s.", serializer_class.__name__, exc_info=True)
+        return False
+    return True
+
+
+def warm_up_urls() -> int:
+    """Populate the URL resolvers in every language and build the fields of the serializers of the routed views.
+
+    Returns:
+        int: The number of the serializers built.
+    """
+    resolver = get_resolver()
+    serializer_classes: set[type[BaseSerializer[Any]]] = set()
+    for language, _ in settings.LANGUAGES:
+        # The translation catalogs of the language are loaded by its activation.
+        with translation.override(language):
+            _ = resolver.reverse_dict
+            for pattern in iter_url_patterns(resolver.url_patterns):
+                view_class = getattr(pattern.callback, "cls", None)
+                if (serializer_class := getattr(view_class, "serializer_class", None)) is not None:
+                    serializer_classes.add(serializer_class)
+
+    return sum(build_serializer_fields(serializer_class) for serializer_class in serializer_classes)
+
+
+def warm_up_models() -> int:
+    """Populate the field caches of the models.
+
+    Returns:
+        int: The number of the models.
+    """
+    models = apps.get_models()
+    for model in models:
+        model._meta.get_fields()  # noqa: SLF001
+    return len(models)
+
+
+def warm_up_schemas() -> int:
+    """Load the cached OpenAPI schemas stored by the `cache_openapi_schema` command into the memory.
+
+    Returns:
+        int: The number of the loaded schemas.
+    """
+    if not settings.MGL_OPENAPI_SCHEMA_CACHE_ENABLED:
+        return 0
+    from my_game_list.my_game_list.views import CachedSpectacularAPIView
+
+    renderer_formats = {renderer_class.format for renderer_class in CachedSpectacularAPIView.renderer_classes}
+    return sum(
+        SchemaCache.get(renderer_format, language) is not None
+        for renderer_format in renderer_formats
+        for language, _ in settings.LANGUAGES
+    )
+
+
+def warm_up_dictionaries() -> int:
+    """Cache the IDs of the genres and the platforms by their names, which resolve the names of the games filters.
+
+    The IDs are cached in the memory cache of the master, inherited by the forked workers, or in the shared cache.
+    The IDs of the database which is not available yet (e.g. before the migrations) are cached by the first requests.
+
+    Returns:
+        int: The number of the cached IDs.
+    """
+    try:
+        return sum(len(get_dictionary_ids(model)) for model in (Genre, Platform))
+    except DatabaseError:
+        logger.warning("Unable to cache the IDs of the dictionaries.", exc_info=True)
+        return 0
+
+
+def warm_up() -> None:
+    """Warm up the caches of the application.
+
+    The connections opened by the dictionaries are closed, so the forked workers never share them.
+    """
+    start = time.perf_counter()
+    serializers = warm_up_urls()
+    models = warm_up_models()
+    schemas = warm_up_schemas()
+    dictionary_ids = warm_up_dictionaries()
+    connections.close_all()
+    logger.info(
+        "Warmed up %d serializers, %d models, %d OpenAPI schemas and %d dictionary IDs in %.3f seconds.",
+        serializers,
+        models,
+        schemas,
+        dictionary_ids,
+        time.perf_counter() - start,
+    )
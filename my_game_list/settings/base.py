@@ -1,6 +1,7 @@
 """This is a base configuration for MyGameList Django application."""
 
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -43,6 +44,8 @@
     "django_filters",
     "corsheaders",
     "django_prometheus",
+    "django_celery_results",
+    "django_celery_beat",
     # Internal apps
     f"{MAIN_APP}.{MAIN_APP}",
     f"{MAIN_APP}.users",
@@ -52,17 +55,31 @@
 
 MIDDLEWARE = [
     "django_prometheus.middleware.PrometheusBeforeMiddleware",
+    f"{MAIN_APP}.{MAIN_APP}.middleware.DatabaseMetricsMiddleware",
+    f"{MAIN_APP}.{MAIN_APP}.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
+    f"{MAIN_APP}.{MAIN_APP}.middleware.PathScopedMiddleware",
+    f"{MAIN_APP}.{MAIN_APP}.middleware.ReplicaRoutingMiddleware",
+    f"{MAIN_APP}.{MAIN_APP}.middleware.ProfilingMiddleware",
+    "django_prometheus.middleware.PrometheusAfterMiddleware",
+]
+
+# The session based middlewares run by the `PathScopedMiddleware` only for the paths with the prefixes,
+# the API authenticates with JWT and does not need them
+MGL_SESSION_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "django_prometheus.middleware.PrometheusAfterMiddleware",
 ]
+MGL_SESSION_PATH_PREFIXES = ["/admin/", "/rosetta/"]
+
+# The admin requires the session, authentication and messages middlewares, they are run by `PathScopedMiddleware`
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
 
 ROOT_URLCONF = f"{MAIN_APP}.{MAIN_APP}.urls"
 
@@ -83,6 +100,18 @@
 ]
 
 WSGI_APPLICATION = f"{MAIN_APP}.{MAIN_APP}.wsgi.application"
+# The list and retrieve actions of the games, game lists and users are async views, set by the ASGI worker mode
+# of the gunicorn (the async views would be run in a new event loop by every request of the WSGI application)
+MGL_ASYNC_VIEWS = oeg("MGL_ASYNC_VIEWS", "False").lower() == "true"
+
+# The psycopg 3 connection pool of every worker process (PostgreSQL only), it replaces the persistent connections
+DATABASE_POOL_ENABLED = oeg("DJANGO_DB_POOL", "False").lower() == "true"
+DATABASE_POOL_OPTIONS = {
+    "min_size": int(oeg("DJANGO_DB_POOL_MIN_SIZE", "2")),
+    "max_size": int(oeg("DJANGO_DB_POOL_MAX_SIZE", "10")),
+    # The number of seconds a request waits for a free connection before it fails
+    "timeout": float(oeg("DJANGO_DB_POOL_TIMEOUT", "10")),
+}
 
 DATABASES = {
     "default": {
@@ -92,6 +121,68 @@
         "PASSWORD": oeg("POSTGRES_PASSWORD", "my_game_list"),
         "HOST": oeg("POSTGRES_HOST", "localhost"),
         "PORT": oeg("POSTGRES_PORT", "5432"),
+        # The number of seconds the connection is reused by the next requests, 0 closes it after every request.
+        # The ASGI requests are run in different threads, each keeping its persistent connection, so the connections
+        # are closed after every request by default (the connection pool is recommended instead).
+        "CONN_MAX_AGE": (
+            0 if DATABASE_POOL_ENABLED else int(oeg("DJANGO_DB_CONN_MAX_AGE") or ("0" if MGL_ASYNC_VIEWS else "60"))
+        ),
+        # The reused connection is checked at the start of the request, so a broken connection does not fail it
+        "CONN_HEALTH_CHECKS": oeg("DJANGO_DB_CONN_HEALTH_CHECKS", "True").lower() == "true",
+        "OPTIONS": {"pool": DATABASE_POOL_OPTIONS} if DATABASE_POOL_ENABLED else {},
+    },
+}
+# The optional read replica of the default database, the reads of the safe requests are routed to it
+if oeg("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": oeg("POSTGRES_REPLICA_HOST"),
+        "PORT": oeg("POSTGRES_REPLICA_PORT", DATABASES["default"]["PORT"]),
+    }
+DATABASE_ROUTERS = [f"{MAIN_APP}.{MAIN_APP}.db.PrimaryReplicaRouter"]
+
+# The cache shared by the workers (e.g. `redis://redis:6379/0`), the local memory cache of every process by default
+CACHE_URL = oeg("DJANGO_CACHE_URL")
+CACHES = {
+    "default": (
+        {"BACKEND": "django_redis.cache.RedisCache", "LOCATION": CACHE_URL}
+        if CACHE_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    ),
+}
+
+# The background tasks are run by the Celery workers, the results are stored in the database
+CELERY_BROKER_URL = oeg("CELERY_BROKER_URL", "redis://localhost:6379/1")
+CELERY_RESULT_BACKEND = "django-db"
+CELERY_RESULT_EXTENDED = True
+CELERY_TIMEZONE = "UTC"
+CELERY_TASK_TRACK_STARTED = True
+CELERY_TASK_DEFAULT_QUEUE = "default"
+# The tasks are split by their priority, so the long running tasks (e.g. the IGDB import) never block the short ones
+CELERY_TASK_ROUTES = {
+    f"{MAIN_APP}.games.tasks.rebuild_game_statistics": {"queue": "high"},
+    f"{MAIN_APP}.{MAIN_APP}.tasks.warm_openapi_schema_cache": {"queue": "default"},
+    f"{MAIN_APP}.games.tasks.sync_igdb_data": {"queue": "low"},
+}
+# The workers reserve one task at a time, so a long task does not hold the queued tasks back
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ACKS_LATE = True
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# The statistics of the games relative to all games are rebuilt every this number of minutes, they expire after two
+# rebuild intervals, so the game detail falls back to its own annotations when the rebuilds stop
+MGL_GAME_STATISTICS_REBUILD_MINUTES = int(oeg("MGL_GAME_STATISTICS_REBUILD_MINUTES", "10"))
+CELERY_BEAT_SCHEDULE = {
+    "rebuild-game-statistics": {
+        "task": f"{MAIN_APP}.games.tasks.rebuild_game_statistics",
+        "schedule": timedelta(minutes=MGL_GAME_STATISTICS_REBUILD_MINUTES),
+    },
+    "warm-openapi-schema-cache": {
+        "task": f"{MAIN_APP}.{MAIN_APP}.tasks.warm_openapi_schema_cache",
+        "schedule": timedelta(hours=1),
+    },
+    "sync-igdb-data": {
+        "task": f"{MAIN_APP}.games.tasks.sync_igdb_data",
+        "schedule": timedelta(hours=int(oeg("MGL_IGDB_SYNC_HOURS", "24"))),
     },
 }
 
@@ -143,8 +234,8 @@
 CORS_ALLOWED_ORIGINS = oeg("DJANGO_CORS_ALLOWED_ORIGINS", "http://localhost:4200").split(",")
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_AUTHENTICATION_CLASSES": (f"{MAIN_APP}.users.authentication.ClaimsJWTAuthentication",),
+    "DEFAULT_PAGINATION_CLASS": f"{MAIN_APP}.{MAIN_APP}.pagination.AsyncPageNumberPagination",
     "PAGE_SIZE": 25,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
@@ -154,6 +245,9 @@
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
+    # The tokens carry the claims of the user, so the authentication does not query the user from the database
+    "TOKEN_OBTAIN_SERIALIZER": f"{MAIN_APP}.users.authentication.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": f"{MAIN_APP}.users.authentication.ClaimsTokenRefreshSerializer",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -171,6 +265,10 @@
 
 LOG_FILE_PATH = Path(MGL_LOG_DIR_PATH, MGL_LOG_FILENAME)
 LOGLEVEL = oeg("DJANGO_LOGLEVEL", "INFO").upper()
+# The records are written by a background thread, the records exceeding the size of the queue are dropped
+MGL_LOG_QUEUE_SIZE = int(oeg("MGL_LOG_QUEUE_SIZE", "10000"))
+# The fractions of the records below WARNING to log, e.g. "django.db.backends=0.1,django.request=0.5"
+MGL_LOG_SAMPLING_RATES = oeg("MGL_LOG_SAMPLING_RATES", "")
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -181,6 +279,10 @@
         "require_debug_true": {
             "()": "django.utils.log.RequireDebugTrue",
         },
+        "sampling": {
+            "()": f"{MAIN_APP}.{MAIN_APP}.log.SamplingFilter",
+            "rates": MGL_LOG_SAMPLING_RATES,
+        },
     },
     "formatters": {
         "color": {
@@ -196,6 +298,9 @@
                 "CRITICAL": "red,bg_white",
             },
         },
+        "json": {
+            "()": f"{MAIN_APP}.{MAIN_APP}.log.JSONFormatter",
+        },
     },
     "handlers": {
         "console": {
@@ -207,41 +312,108 @@
         "file": {
             "level": LOGLEVEL,
             "class": "logging.handlers.RotatingFileHandler",
-            "formatter": "color",
+            "formatter": "json",
             "backupCount": 5,
             "maxBytes": 5242880,  # 5*1024*1024 bytes (5MB)
             "filename": LOG_FILE_PATH,
             "encoding": "utf8",
         },
+        # The formatting and the I/O of the console and file handlers is done by a background thread.
+        "queue": {
+            "()": f"{MAIN_APP}.{MAIN_APP}.log.QueueListenerHandler",
+            "handlers": ["cfg://handlers.console", "cfg://handlers.file"],
+            "queue_size": MGL_LOG_QUEUE_SIZE,
+            "filters": ["sampling"],
+        },
     },
     "loggers": {
         "root": {
             "level": "DEBUG",
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
         },
         "django.db.backends": {
             "level": "DEBUG",
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "propagate": False,
         },
         "error": {
             "level": "DEBUG",
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "propagate": False,
         },
         "django": {
             "level": "INFO",
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "propagate": False,
         },
         "django.server": {
             "level": "INFO",
-            "handlers": ["console", "file"],
+            "handlers": ["queue"],
             "propagate": False,
         },
     },
 }
 
+# Requests exceeding any of these thresholds are logged with their most frequent SQL queries
+MGL_DB_SLOW_REQUEST_THRESHOLD = float(oeg("MGL_DB_SLOW_REQUEST_THRESHOLD", "0.5"))  # in seconds
+MGL_DB_HIGH_QUERY_COUNT_THRESHOLD = int(oeg("MGL_DB_HIGH_QUERY_COUNT_THRESHOLD", "50"))
+# The number of the queries and the database time of the request are returned in the `X-DB-Queries` and `X-DB-Time`
+# response headers, e.g. for the HTTP load benchmark
+MGL_DB_QUERY_HEADERS = oeg("MGL_DB_QUERY_HEADERS", "False").lower() == "true"
+# Queries slower than the threshold are stored in the slow query log, 0 disables the log
+MGL_SLOW_QUERY_THRESHOLD = float(oeg("MGL_SLOW_QUERY_THRESHOLD", "0.2"))  # in seconds
+MGL_SLOW_QUERY_LOG_SIZE = int(oeg("MGL_SLOW_QUERY_LOG_SIZE", "500"))
+MGL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(oeg("MGL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1"))
+MGL_SLOW_QUERY_EXPLAIN_TIMEOUT = float(oeg("MGL_SLOW_QUERY_EXPLAIN_TIMEOUT", "5"))  # in seconds
+
+# The database aliases of the read replicas, the reads of the safe requests are routed to them
+MGL_DB_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+# The number of seconds the requests of a client read from the primary database after the client wrote
+MGL_DB_PRIMARY_STICKY_SECONDS = int(oeg("MGL_DB_PRIMARY_STICKY_SECONDS", "5"))
+
+# The rendered OpenAPI schema is cached in the memory and in the directory, invalidated by the application version
+MGL_OPENAPI_SCHEMA_CACHE_ENABLED = oeg("MGL_OPENAPI_SCHEMA_CACHE_ENABLED", str(not DEBUG)).lower() == "true"
+MGL_OPENAPI_SCHEMA_DIR = Path(oeg("MGL_OPENAPI_SCHEMA_DIR", Path(tempfile.gettempdir()) / "my_game_list_openapi"))
+
+# Requests of the staff users with `X-Profile` header and a sampled fraction of all requests are profiled
+MGL_PROFILING_SAMPLE_RATE = float(oeg("MGL_PROFILING_SAMPLE_RATE", "0"))
+MGL_PROFILING_DIR = Path(oeg("MGL_PROFILING_DIR", Path(tempfile.gettempdir()) / "my_game_list_profiles"))
+MGL_PROFILING_MAX_FILES = int(oeg("MGL_PROFILING_MAX_FILES", "50"))
+
+# The number of seconds between the samples of the system metrics (CPU and memory usage) and the database pool
+# metrics, 0 disables the sampling
+MGL_SYSTEM_METRICS_INTERVAL = float(oeg("MGL_SYSTEM_METRICS_INTERVAL", "15"))
+
+# The responses of the paths with the prefixes larger than the size (in bytes) are compressed by brotli or gzip,
+# negotiated by the `Accept-Encoding` request header
+MGL_COMPRESSION_MIN_SIZE = int(oeg("MGL_COMPRESSION_MIN_SIZE", "1024"))
+MGL_COMPRESSION_PATH_PREFIXES = ["/api/"]
+# The number of seconds the rendered responses of the cached endpoints (the all values lists of the dictionaries)
+# are cached together with their compressed contents, 0 disables the cache. The changes invalidate the responses
+# only in the shared cache, so the responses are not cached by default without it (the memory cache of a process).
+MGL_RESPONSE_CACHE_TIMEOUT = int(oeg("MGL_RESPONSE_CACHE_TIMEOUT") or ("3600" if CACHE_URL else "0"))
+# The number of seconds the IDs of the genres and the platforms by their names (used by the games filters) are cached,
+# the changes of the dictionaries invalidate them earlier
+MGL_DICTIONARY_IDS_CACHE_TIMEOUT = int(oeg("MGL_DICTIONARY_IDS_CACHE_TIMEOUT", "3600"))
+
+# The paginated counts of the large tables (games, game lists, game reviews and users) estimated by PostgreSQL to have
+# at least this number of rows are not counted exactly
+MGL_ESTIMATED_COUNT_THRESHOLD = int(oeg("MGL_ESTIMATED_COUNT_THRESHOLD", "100000"))
+
+# The JSON responses are rendered and the JSON requests are parsed by orjson instead of the stdlib json module
+MGL_ORJSON_ENABLED = oeg("MGL_ORJSON_ENABLED", "False").lower() == "true"
+
+if MGL_ORJSON_ENABLED:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        f"{MAIN_APP}.{MAIN_APP}.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        f"{MAIN_APP}.{MAIN_APP}.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+
 MYPYPATH = BASE_DIR / "stubs"
 
 IGDB_CLIENT_ID = oeg("IGDB_CLIENT_ID", "client_id_to_change_on_production")
@@ -13,7 +13,7 @@
 
 REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"] = (
     "rest_framework.authentication.BasicAuthentication",
-    "rest_framework_simplejwt.authentication.JWTAuthentication",
+    f"{MAIN_APP}.users.authentication.ClaimsJWTAuthentication",
 )
 
 STATIC_URL = "/static/"
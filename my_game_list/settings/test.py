@@ -17,12 +17,20 @@
         "PORT": oeg("POSTGRES_PORT", "9999"),
     }
 }
+# The replica used by the tests of the database router, it mirrors the default test database
+DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
 
 REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"] = (
     "rest_framework.authentication.BasicAuthentication",
-    "rest_framework_simplejwt.authentication.JWTAuthentication",
+    f"{MAIN_APP}.users.authentication.ClaimsJWTAuthentication",
 )
 
+# The Celery tasks are run synchronously by the tests, without the broker and the workers
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+CELERY_BROKER_URL = "memory://"
+CELERY_RESULT_BACKEND = "cache+memory://"
+
 # Speed up the password hashing in tests
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
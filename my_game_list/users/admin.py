@@ -2,14 +2,16 @@
 
 from django.contrib import admin
 
+from my_game_list.my_game_list.admin import PerformanceModelAdmin
 from my_game_list.users.models import User
 
 
 @admin.register(User)
-class UserAdmin(admin.ModelAdmin[User]):
+class UserAdmin(PerformanceModelAdmin[User]):
     """Admin model for the User model."""
 
     readonly_fields = ("id", "gravatar_tag")
-    search_fields = ("id", "username", "email")
+    search_fields = ("=id", "username", "email")
     list_filter = ("is_superuser", "is_staff", "is_active", "date_joined")
-    list_display = (*search_fields, *list_filter, "gender", "last_login", "gravatar_tag")
+    # The gravatar is shown only on the change page, the changelist does not render the image of every row.
+    list_display = ("id", "username", "email", *list_filter, "gender", "last_login")
@@ -1,5 +1,7 @@
 """This module contains the configuration for user application."""
 
+from typing import Self
+
 from django.apps import AppConfig
 
 
@@ -8,3 +10,7 @@ class UsersConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "my_game_list.users"
+
+    def ready(self: Self) -> None:
+        """Connect the signal receivers of the application."""
+        from my_game_list.users import signals  # noqa: F401
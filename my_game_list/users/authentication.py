@@ -0,0 +1,150 @@
+"""This module contains the JWT authentication of the users from the claims of the access token.
+
+The access tokens carry the claims of the user (`USER_CLAIMS`), so the authenticated requests do not query the user
+from the database. When the user is changed, the snapshot of its claims is stored in the cache for the lifetime of
+the access token, it overrides the claims of the tokens issued before the change (e.g. a deactivated user).
+"""
+
+from contextlib import suppress
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Self, cast
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+if TYPE_CHECKING:
+    from rest_framework_simplejwt.tokens import Token
+
+    from my_game_list.users.models import User
+
+USER_CLAIMS = ("username", "is_staff", "is_superuser", "is_active")
+SNAPSHOT_KEY_PREFIX = "mgl_user_snapshot"
+
+
+def get_snapshot_key(user_id: Any) -> str:  # noqa: ANN401
+    """Get the cache key of the snapshot of the user claims."""
+    return f"{SNAPSHOT_KEY_PREFIX}:{user_id}"
+
+
+def get_user_claims(user_id: Any) -> dict[str, Any] | None:  # noqa: ANN401
+    """Get the current claims of the user from the database, None if the user does not exist."""
+    claims = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values(*USER_CLAIMS).first()
+    return cast("dict[str, Any] | None", claims)
+
+
+def store_user_snapshot(user: "User", *, deleted: bool = False) -> None:
+    """Store the snapshot of the user claims, it overrides the claims of the already issued access tokens.
+
+    Args:
+        user (User): The changed user.
+        deleted (bool): Whether the user is deleted, the deleted user is stored as inactive.
+    """
+    claims = {claim: getattr(user, claim) for claim in USER_CLAIMS}
+    if deleted:
+        claims["is_active"] = False
+    # The tokens issued after the change carry the current claims, so the snapshot is needed only until the tokens
+    # issued before the change expire.
+    cache.set(get_snapshot_key(user.pk), claims, timeout=api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+class ClaimsUser(TokenUser):
+    """The authenticated user built from the claims of the access token, without the database lookup.
+
+    The user has the `id`, `username`, `is_staff`, `is_superuser` and `is_active` attributes. The views which need
+    the full model load it with `instance`.
+    """
+
+    def __init__(self: Self, claims: dict[str, Any]) -> None:
+        """Create the user from the claims of the token, overridden by the snapshot of the user claims."""
+        super().__init__(claims)
+        self.is_active = bool(claims.get("is_active", True))
+
+    @cached_property
+    def instance(self: Self) -> "User":
+        """The user model instance, it is queried from the database on the first access."""
+        return get_user_model().objects.get(**{api_settings.USER_ID_FIELD: self.id})
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """The JWT authentication returning the user built from the token claims instead of the user model instance."""
+
+    def get_user(self: Self, validated_token: "Token") -> ClaimsUser:
+        """Get the user from the claims of the validated token, overridden by the snapshot of the user claims.
+
+        The tokens issued without the claims (before the claims were added) are completed from the database once,
+        the claims are stored as the snapshot then.
+
+        Args:
+            validated_token (Token): The validated access token.
+
+        Raises:
+            InvalidToken: The token has no user identifier.
+            AuthenticationFailed: The user does not exist or is inactive.
+
+        Returns:
+            ClaimsUser: The authenticated user.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from exc
+
+        snapshot_key = get_snapshot_key(user_id)
+        claims = cache.get(snapshot_key)
+        if claims is None and any(claim not in validated_token for claim in USER_CLAIMS):
+            claims = get_user_claims(user_id)
+            if claims is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(snapshot_key, claims, timeout=api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+        user = ClaimsUser({**validated_token.payload, **(claims or {})})
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """The serializer of the token pair, the tokens carry the claims of the user."""
+
+    @classmethod
+    def get_token(cls: type[Self], user: "User") -> "Token":  # type: ignore[override]
+        """Get the refresh token with the claims of the user, the access token copies them."""
+        token = super().get_token(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """The serializer of the refreshed access token, it carries the current claims of the user.
+
+    The claims of the refresh token are from the time of the login, so they are read from the database again.
+    """
+
+    def validate(self: Self, attrs: dict[str, Any]) -> dict[str, str]:
+        """Validate the refresh token and issue the access token with the current claims of the user."""
+        refresh = self.token_class(attrs["refresh"])
+        claims = get_user_claims(refresh.payload.get(api_settings.USER_ID_CLAIM))
+        if claims is None or not claims["is_active"]:
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+        for claim, value in claims.items():
+            refresh[claim] = value
+
+        data = {"access": str(refresh.access_token)}
+        # The same rotation as in the `TokenRefreshSerializer.validate`.
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                # The `blacklist` method is present only with the blacklist application installed.
+                with suppress(AttributeError):
+                    refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
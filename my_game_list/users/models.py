@@ -5,7 +5,9 @@
 
 from django.contrib import admin
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
@@ -34,6 +36,22 @@ class User(BaseModel, AbstractUser):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS: ClassVar[list[str]] = ["username"]
 
+    class Meta(BaseModel.Meta):
+        """Meta data for the user model."""
+
+        indexes: ClassVar[list[models.Index]] = [
+            # The `icontains` search of the username and the email (the admin search),
+            # `UPPER(column::text) LIKE UPPER(pattern)`
+            GinIndex(
+                OpClass(Upper(Cast("username", models.TextField())), name="gin_trgm_ops"),
+                name="user_username_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper(Cast("email", models.TextField())), name="gin_trgm_ops"),
+                name="user_email_trgm_idx",
+            ),
+        ]
+
     def __str__(self: Self) -> str:
         """Return a string representation for this model."""
         return f"{self.username} - {self.email}"
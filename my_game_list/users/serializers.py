@@ -5,13 +5,13 @@
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password as django_validate_password
-from django.db.models import Avg
+from django.db.models import Avg, Count, Prefetch, Q, QuerySet
 from drf_spectacular.helpers import lazy_serializer
 from drf_spectacular.utils import extend_schema_field, inline_serializer
 from rest_framework import serializers
 from rest_framework.utils.serializer_helpers import ReturnDict
 
-from my_game_list.games.models import GameListStatus
+from my_game_list.games.models import GameList, GameListStatus
 from my_game_list.users.models import User as UserModel
 
 User: type[UserModel] = get_user_model()
@@ -76,7 +76,14 @@ class Meta:
 
 
 class UserDetailSerializer(serializers.ModelSerializer[UserModel]):
-    """Detailed serializer for User model."""
+    """Detailed serializer for User model.
+
+    The serialized users have to be loaded with the `setup_eager_loading` queryset, so the serializer
+    does not query the database.
+    """
+
+    LATEST_GAME_LIST_UPDATES_LIMIT = 5
+    FRIENDS_LIMIT = 5
 
     gender = serializers.CharField(source="get_gender_display", read_only=True)
     game_list_statistics = serializers.SerializerMethodField()
@@ -100,6 +107,33 @@ class Meta:
             "latest_game_list_updates",
         )
 
+    @classmethod
+    def setup_eager_loading(cls: type[Self], queryset: QuerySet[UserModel]) -> QuerySet[UserModel]:
+        """Annotate the game list statistics and prefetch the friends and game lists of the users."""
+        from my_game_list.friendships.models import Friendship
+
+        return queryset.annotate(
+            **{
+                f"game_lists_{status.name.lower()}": Count("game_lists", filter=Q(game_lists__status=status))
+                for status in GameListStatus
+            },
+            game_lists_total=Count("game_lists"),
+            game_lists_mean_score=Avg("game_lists__score"),
+        ).prefetch_related(
+            Prefetch(
+                "friends",
+                queryset=Friendship.objects.select_related("friend")[: cls.FRIENDS_LIMIT],
+                to_attr="limited_friends",
+            ),
+            Prefetch(
+                "game_lists",
+                queryset=GameList.objects.select_related("game")
+                .prefetch_related("owned_on")
+                .order_by("last_modified_at")[: cls.LATEST_GAME_LIST_UPDATES_LIMIT],
+                to_attr="latest_game_list_updates",
+            ),
+        )
+
     @extend_schema_field(
         inline_serializer(
             name="GameListStatisticsSerializer",
@@ -116,21 +150,19 @@ class Meta:
     )
     def get_game_list_statistics(self: Self, instance: UserModel) -> dict[str, int | float]:
         """Get the game list statistics for the user."""
+        statistics = {
+            status.name.lower(): getattr(instance, f"game_lists_{status.name.lower()}") for status in GameListStatus
+        }
         return {
-            "completed": instance.game_lists.filter(status=GameListStatus.COMPLETED).count(),
-            "dropped": instance.game_lists.filter(status=GameListStatus.DROPPED).count(),
-            "plan_to_play": instance.game_lists.filter(status=GameListStatus.PLAN_TO_PLAY).count(),
-            "on_hold": instance.game_lists.filter(status=GameListStatus.ON_HOLD).count(),
-            "playing": instance.game_lists.filter(status=GameListStatus.PLAYING).count(),
-            "total": instance.game_lists.count(),
-            "mean_score": instance.game_lists.aggregate(mean_score=Avg("score"))["mean_score"],
+            **statistics,
+            "total": instance.game_lists_total,  # type: ignore[attr-defined]
+            "mean_score": instance.game_lists_mean_score,  # type: ignore[attr-defined]
         }
 
     @extend_schema_field(UserSimpleSerializer(many=True))
     def get_friends(self: Self, instance: UserModel) -> ReturnDict[Any, Any]:
         """Get the list of friends for the user limited to 5 friends."""
-        friendships = instance.friends.all()[:5]
-        friends = [friendship.friend for friendship in friendships]
+        friends = [friendship.friend for friendship in instance.limited_friends]  # type: ignore[attr-defined]
         return UserSimpleSerializer(friends, many=True, context=self.context).data
 
     @extend_schema_field(
@@ -141,7 +173,7 @@ def get_latest_game_list_updates(self: Self, instance: UserModel) -> ReturnDict[
         from my_game_list.games.serializers import GameListSerializer
 
         return GameListSerializer(
-            instance.game_lists.all().order_by("last_modified_at")[:5],
+            instance.latest_game_list_updates,  # type: ignore[attr-defined]
             many=True,
             context=self.context,
         ).data
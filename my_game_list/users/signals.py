@@ -0,0 +1,25 @@
+"""This module contains the signal receivers of the user application."""
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from my_game_list.users.models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid="store_user_snapshot_on_save")
+def store_user_snapshot_on_save(sender: type[User], instance: User, **kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Store the snapshot of the saved user claims, so the issued access tokens get the changed claims."""
+    # The authentication imports the REST framework serializers, which are not needed by the startup.
+    from my_game_list.users.authentication import store_user_snapshot
+
+    store_user_snapshot(instance)
+
+
+@receiver(post_delete, sender=User, dispatch_uid="store_user_snapshot_on_delete")
+def store_user_snapshot_on_delete(sender: type[User], instance: User, **kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Store the deleted user as inactive, so the issued access tokens are rejected."""
+    from my_game_list.users.authentication import store_user_snapshot
+
+    store_user_snapshot(instance, deleted=True)
@@ -3,10 +3,12 @@
 from typing import Self
 
 from django.contrib.auth import get_user_model
-from rest_framework.mixins import CreateModelMixin, ListModelMixin, RetrieveModelMixin
+from django.db.models import QuerySet
+from rest_framework.mixins import CreateModelMixin
 from rest_framework.permissions import AllowAny, BasePermission, IsAuthenticated
-from rest_framework.viewsets import GenericViewSet
 
+from my_game_list.my_game_list.mixins import AsyncReadModelMixin
+from my_game_list.my_game_list.pagination import EstimatedCountPagination
 from my_game_list.users.filters import UserFilterSet
 from my_game_list.users.models import User as UserModel
 from my_game_list.users.serializers import UserCreateSerializer, UserDetailSerializer, UserSerializer
@@ -14,12 +16,20 @@
 User: type[UserModel] = get_user_model()
 
 
-class UserViewSet(GenericViewSet[UserModel], ListModelMixin, RetrieveModelMixin, CreateModelMixin):
+class UserViewSet(AsyncReadModelMixin[UserModel], CreateModelMixin):
     """ViewSet is responsible for creating, listing, and retrieving user information."""
 
     queryset = User.objects.all()
+    pagination_class = EstimatedCountPagination
     filterset_class = UserFilterSet
 
+    def get_queryset(self: Self) -> QuerySet[UserModel]:
+        """Get the queryset, with the data of the detail serializer loaded for the retrieve action."""
+        queryset = super().get_queryset()
+        if self.action == "retrieve":
+            return UserDetailSerializer.setup_eager_loading(queryset)
+        return queryset
+
     def get_serializer_class(
         self: Self,
     ) -> type[UserCreateSerializer] | type[UserSerializer] | type[UserDetailSerializer]:
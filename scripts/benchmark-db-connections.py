@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""The task of this module is to measure the connection setup latency saved per request by the connection reuse.
+
+The requests are simulated against the PostgreSQL database configured in the environment variables (`POSTGRES_DB`,
+`POSTGRES_USER`, `POSTGRES_PASSWORD`, `POSTGRES_HOST`, `POSTGRES_PORT`) in the modes matching the settings:
+    * new - a new connection is opened for every request (`DJANGO_DB_CONN_MAX_AGE=0`),
+    * persistent - the connection is reused and checked at the start of every request
+      (`DJANGO_DB_CONN_MAX_AGE` with `DJANGO_DB_CONN_HEALTH_CHECKS`),
+    * pool - the connection is taken from the psycopg connection pool (`DJANGO_DB_POOL`).
+
+Example:
+    benchmark-db-connections.py --requests 1000 --queries 5
+"""
+
+import argparse
+import os
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Self
+
+import psycopg
+from psycopg_pool import ConnectionPool, PoolTimeout
+from python_colors import print_error, print_info, print_success, print_text
+
+HEALTH_CHECK_QUERY = "SELECT 1"
+
+
+@dataclass
+class BenchmarkResult:
+    """The result of the benchmark of a single connection mode."""
+
+    mode: str
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def mean(self: Self) -> float:
+        """The mean request latency in milliseconds."""
+        return statistics.fmean(self.latencies) * 1000 if self.latencies else 0.0
+
+    def percentile(self: Self, percent: int) -> float:
+        """The request latency percentile in milliseconds."""
+        if len(self.latencies) < 2:  # noqa: PLR2004
+            return 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1000
+
+
+def get_connection_info() -> str:
+    """Get the connection string from the environment variables."""
+    return psycopg.conninfo.make_conninfo(
+        dbname=os.environ.get("POSTGRES_DB", "my_game_list"),
+        user=os.environ.get("POSTGRES_USER", "my_game_list"),
+        password=os.environ.get("POSTGRES_PASSWORD", "my_game_list"),
+        host=os.environ.get("POSTGRES_HOST", "localhost"),
+        port=os.environ.get("POSTGRES_PORT", "5432"),
+    )
+
+
+def run_queries(connection: psycopg.Connection[tuple[int]], queries: int) -> None:
+    """Run the queries of a single request."""
+    for _ in range(queries):
+        connection.execute("SELECT 1").fetchone()
+
+
+def measure(mode: str, requests: int, run_request: Callable[[], None]) -> BenchmarkResult:
+    """Measure the latencies of the requests run by the function."""
+    result = BenchmarkResult(mode)
+    for _ in range(requests):
+        start = time.perf_counter()
+        run_request()
+        result.latencies.append(time.perf_counter() - start)
+    return result
+
+
+def benchmark_new(conninfo: str, requests: int, queries: int) -> BenchmarkResult:
+    """Open a new connection for every request."""
+
+    def run_request() -> None:
+        with psycopg.connect(conninfo) as connection:
+            run_queries(connection, queries)
+
+    return measure("new", requests, run_request)
+
+
+def benchmark_persistent(conninfo: str, requests: int, queries: int) -> BenchmarkResult:
+    """Reuse a single connection, checking it at the start of every request."""
+    with psycopg.connect(conninfo, autocommit=True) as connection:
+
+        def run_request() -> None:
+            connection.execute(HEALTH_CHECK_QUERY)
+            run_queries(connection, queries)
+
+        return measure("persistent", requests, run_request)
+
+
+def benchmark_pool(conninfo: str, requests: int, queries: int) -> BenchmarkResult:
+    """Take the connection from the pool for every request."""
+    with ConnectionPool(conninfo, min_size=1, max_size=1, open=True) as pool:
+        pool.wait(timeout=10)
+
+        def run_request() -> None:
+            with pool.connection() as connection:
+                run_queries(connection, queries)
+
+        return measure("pool", requests, run_request)
+
+
+BENCHMARKS = {"new": benchmark_new, "persistent": benchmark_persistent, "pool": benchmark_pool}
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    """Print the results of the benchmark as a table, with the latency saved compared to the new connections."""
+    baseline = next((result.mean for result in results if result.mode == "new"), None)
+    print_text(f"{'mode':<11} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'saved ms/request':>17}")
+    for result in results:
+        saved = f"{baseline - result.mean:.2f}" if baseline is not None else "-"
+        print_text(
+            f"{result.mode:<11} {result.mean:>8.2f} {result.percentile(50):>8.2f} {result.percentile(95):>8.2f} "
+            f"{result.percentile(99):>8.2f} {saved:>17}",
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark of the connection modes."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=tuple(BENCHMARKS), default=tuple(BENCHMARKS))
+    parser.add_argument("--requests", type=int, default=500, help="The number of the simulated requests.")
+    parser.add_argument("--queries", type=int, default=3, help="The number of the queries per request.")
+    arguments = parser.parse_args(argv)
+
+    conninfo = get_connection_info()
+    results = []
+    for mode in arguments.modes:
+        print_info(f"Benchmarking the {mode} connections ...")
+        try:
+            results.append(BENCHMARKS[mode](conninfo, arguments.requests, arguments.queries))
+        except (psycopg.OperationalError, PoolTimeout) as exc:
+            print_error(f"Cannot connect to the database: {exc}")
+            return 1
+    print_success("The benchmark is finished.")
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+"""The task of this module is to measure the throughput and the latency of the API endpoints under a mixed load.
+
+The application is loaded by the concurrent virtual users, every one of them logged in as a different synthetic user
+(`seed_synthetic_data`), sending the weighted mix of the read and the write requests:
+    * games - the pages of the games,
+    * game-lists - the completed games of a user,
+    * user - the details of a user,
+    * friendships - the friends of the virtual user,
+    * friendship-requests - the pending friendship requests received by the virtual user,
+    * game-list-update - the score update of a game list of the virtual user,
+    * friendship-request-create - a new friendship request sent by the virtual user.
+
+The p50/p95/p99 latency, the requests per second and the number of the database queries (`X-DB-Queries` header,
+returned with `MGL_DB_QUERY_HEADERS`) are reported per endpoint. The benchmark fails when any of the budgets
+(`http-load-budgets.json` by default) is exceeded.
+
+The database is configured in the environment as for the application, `--seed-size` migrates it and generates
+the synthetic data first, `--start-server` starts the gunicorn with `docker/app/gunicorn.conf.py`.
+
+Example:
+    benchmark-http-load.py --seed-size small --start-server --concurrency 16 --duration 60
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+import django
+import requests
+from python_colors import print_error, print_info, print_success, print_text
+
+GUNICORN_CONFIG_PATH = Path(__file__).resolve().parents[1] / "docker" / "app" / "gunicorn.conf.py"
+DEFAULT_BUDGETS_PATH = Path(__file__).resolve().parent / "http-load-budgets.json"
+STARTUP_TIMEOUT = 60
+
+
+@dataclass
+class VirtualUser:
+    """The synthetic user sending the requests, with the data of its requests."""
+
+    id: int
+    email: str
+    game_list_ids: list[int]
+    token: str = ""
+
+
+@dataclass
+class LoadContext:
+    """The data shared by all the virtual users."""
+
+    user_ids: list[int]
+    rng: random.Random
+    password: str
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """The request of the endpoint sent by the virtual users."""
+
+    name: str
+    method: str
+    weight: int
+    build: Callable[[VirtualUser, LoadContext], tuple[str, dict[str, Any] | None]]
+    """Build the path and the JSON body of the request."""
+    expected_statuses: frozenset[int] = frozenset({200})
+
+
+SCENARIOS = (
+    Scenario(
+        "games",
+        "GET",
+        30,
+        lambda _, context: (f"/api/game/games/?page={context.rng.randint(1, 5)}", None),
+    ),
+    Scenario(
+        "game-lists",
+        "GET",
+        20,
+        lambda _, context: (f"/api/game/game-lists/?user={context.rng.choice(context.user_ids)}&status=C", None),
+    ),
+    Scenario("user", "GET", 20, lambda _, context: (f"/api/user/users/{context.rng.choice(context.user_ids)}/", None)),
+    Scenario("friendships", "GET", 5, lambda user, _: (f"/api/friendship/friendships/?user={user.id}", None)),
+    Scenario(
+        "friendship-requests",
+        "GET",
+        10,
+        lambda user, _: (f"/api/friendship/friendship-requests/?receiver={user.id}&rejected=false", None),
+    ),
+    Scenario(
+        "game-list-update",
+        "PATCH",
+        10,
+        lambda user, context: (
+            f"/api/game/game-lists/{context.rng.choice(user.game_list_ids)}/",
+            {"score": context.rng.randint(1, 10)},
+        ),
+    ),
+    Scenario(
+        "friendship-request-create",
+        "POST",
+        5,
+        lambda user, context: (
+            "/api/friendship/friendship-requests/",
+            {"sender": user.id, "receiver": context.rng.choice(context.user_ids), "message": ""},
+        ),
+        # The request to a friend, to the user itself or a repeated request are rejected by the validation.
+        frozenset({201, 400}),
+    ),
+)
+
+
+@dataclass
+class EndpointResult:
+    """The result of the benchmark of a single endpoint."""
+
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+
+    def merge(self: Self, other: "EndpointResult") -> None:
+        """Add the measurements of the other result of the endpoint."""
+        self.latencies += other.latencies
+        self.queries += other.queries
+        self.errors += other.errors
+
+    def percentile(self: Self, percent: int) -> float:
+        """The latency percentile in milliseconds."""
+        if len(self.latencies) < 2:  # noqa: PLR2004
+            return 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1000
+
+    @property
+    def error_rate(self: Self) -> float:
+        """The fraction of the failed requests."""
+        total = len(self.latencies) + self.errors
+        return self.errors / total if total else 0.0
+
+    @property
+    def max_queries(self: Self) -> int:
+        """The maximal number of the database queries of a request, 0 if they are not reported by the server."""
+        return max(self.queries, default=0)
+
+
+def seed_database(size: str) -> None:
+    """Migrate the database and generate the synthetic data."""
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    call_command("seed_synthetic_data", size=size)
+
+
+def load_virtual_users(count: int, rng: random.Random) -> tuple[list[VirtualUser], list[int]]:
+    """Load the synthetic users with the game lists from the database.
+
+    Returns:
+        tuple[list[VirtualUser], list[int]]: The virtual users and the IDs of all the synthetic users.
+    """
+    from my_game_list.games.models import GameList
+    from my_game_list.users.models import User
+
+    users = User.objects.filter(username__startswith="synthetic_user_")
+    user_ids = list(users.values_list("id", flat=True))
+    candidates = list(users.filter(game_lists__isnull=False).distinct().values_list("id", "email"))
+    virtual_users = [
+        VirtualUser(user_id, email, list(GameList.objects.filter(user_id=user_id).values_list("id", flat=True)))
+        for user_id, email in rng.sample(candidates, min(count, len(candidates)))
+    ]
+    return virtual_users, user_ids
+
+
+def is_responding(base_url: str) -> bool:
+    """Check if the server responds."""
+    try:
+        requests.get(f"{base_url}/version/", timeout=1).raise_for_status()
+    except requests.RequestException:
+        return False
+    return True
+
+
+def start_server(port: int, workers: int, multiproc_dir: str) -> subprocess.Popen[bytes]:
+    """Start the gunicorn returning the database queries in the headers and wait until it responds."""
+    env = {
+        **os.environ,
+        "GUNICORN_WORKERS": str(workers),
+        "MGL_DB_QUERY_HEADERS": "True",
+        "PROMETHEUS_MULTIPROC_DIR": multiproc_dir,
+    }
+    server = subprocess.Popen(  # noqa: S603
+        ["gunicorn", "-c", str(GUNICORN_CONFIG_PATH), "-b", f"127.0.0.1:{port}"],  # noqa: S607
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_responding(f"http://127.0.0.1:{port}"):
+            return server
+        time.sleep(0.5)
+    server.terminate()
+    msg = f"The gunicorn did not start in {STARTUP_TIMEOUT} seconds."
+    raise RuntimeError(msg)
+
+
+def log_in(session: requests.Session, base_url: str, user: VirtualUser, password: str) -> None:
+    """Obtain the access token of the virtual user and authenticate the session with it."""
+    response = session.post(f"{base_url}/api/token/", json={"email": user.email, "password": password}, timeout=30)
+    response.raise_for_status()
+    user.token = response.json()["access"]
+    session.headers["Authorization"] = f"Bearer {user.token}"
+
+
+def send_request(
+    session: requests.Session,
+    base_url: str,
+    scenario: Scenario,
+    user: VirtualUser,
+    context: LoadContext,
+) -> requests.Response:
+    """Send the request of the scenario, logging in again when the access token expires."""
+    path, body = scenario.build(user, context)
+    response = session.request(scenario.method, f"{base_url}{path}", json=body, timeout=30)
+    if response.status_code == requests.codes.unauthorized:
+        log_in(session, base_url, user, context.password)
+        response = session.request(scenario.method, f"{base_url}{path}", json=body, timeout=30)
+    return response
+
+
+def run_client(
+    base_url: str,
+    user: VirtualUser,
+    context: LoadContext,
+    deadline: float,
+    results: dict[str, EndpointResult],
+) -> None:
+    """Send the weighted mix of the requests until the deadline, recording the results per endpoint."""
+    session = requests.Session()
+    log_in(session, base_url, user, context.password)
+    weights = [scenario.weight for scenario in SCENARIOS]
+    while time.monotonic() < deadline:
+        scenario = context.rng.choices(SCENARIOS, weights)[0]
+        result = results.setdefault(scenario.name, EndpointResult(scenario.name))
+        start = time.perf_counter()
+        try:
+            response = send_request(session, base_url, scenario, user, context)
+        except requests.RequestException:
+            result.errors += 1
+            continue
+        if response.status_code not in scenario.expected_statuses:
+            result.errors += 1
+            continue
+        result.latencies.append(time.perf_counter() - start)
+        if "X-DB-Queries" in response.headers:
+            result.queries.append(int(response.headers["X-DB-Queries"]))
+
+
+def run_load(
+    base_url: str,
+    users: Sequence[VirtualUser],
+    context: LoadContext,
+    duration: float,
+) -> dict[str, EndpointResult]:
+    """Run the virtual users concurrently for the duration, returning the merged results per endpoint."""
+    deadline = time.monotonic() + duration
+    client_results: list[dict[str, EndpointResult]] = [{} for _ in users]
+    threads = [
+        threading.Thread(target=run_client, args=(base_url, user, context, deadline, results))
+        for user, results in zip(users, client_results, strict=True)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    merged = {scenario.name: EndpointResult(scenario.name) for scenario in SCENARIOS}
+    for results in client_results:
+        for name, result in results.items():
+            merged[name].merge(result)
+    return merged
+
+
+def print_results(results: dict[str, EndpointResult], duration: float) -> None:
+    """Print the results of the benchmark as a table."""
+    print_text(
+        f"{'endpoint':<26} {'requests':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'queries':>8} {'max q':>6} {'errors':>7}",
+    )
+    for result in results.values():
+        queries = statistics.fmean(result.queries) if result.queries else 0.0
+        print_text(
+            f"{result.name:<26} {len(result.latencies):>8} {len(result.latencies) / duration:>8.1f} "
+            f"{result.percentile(50):>8.1f} {result.percentile(95):>8.1f} {result.percentile(99):>8.1f} "
+            f"{queries:>8.1f} {result.max_queries:>6} {result.errors:>7}",
+        )
+    total = sum(len(result.latencies) for result in results.values())
+    print_text(f"{'total':<26} {total:>8} {total / duration:>8.1f}")
+
+
+def check_budgets(results: dict[str, EndpointResult], budgets: dict[str, Any], duration: float) -> list[str]:
+    """Check the results against the budgets of the endpoints.
+
+    The budget of an endpoint may limit `p50_ms`, `p95_ms`, `p99_ms`, `max_queries` and `max_error_rate`
+    and require `min_rps`. The `total` budget requires `min_rps` of all the endpoints.
+
+    Returns:
+        list[str]: The descriptions of the exceeded budgets.
+    """
+    violations = []
+    for name, budget in budgets.items():
+        if name == "total":
+            rps = sum(len(result.latencies) for result in results.values()) / duration
+            if rps < budget.get("min_rps", 0):
+                violations.append(f"total: {rps:.1f} req/s < {budget['min_rps']} req/s")
+            continue
+        result = results[name]
+        measured = {
+            "p50_ms": result.percentile(50),
+            "p95_ms": result.percentile(95),
+            "p99_ms": result.percentile(99),
+            "max_queries": result.max_queries,
+            "max_error_rate": result.error_rate,
+        }
+        violations += [
+            f"{name}: {key} {measured[key]:.2f} > {limit}"
+            for key, limit in budget.items()
+            if key in measured and measured[key] > limit
+        ]
+        if (rps := len(result.latencies) / duration) < budget.get("min_rps", 0):
+            violations.append(f"{name}: {rps:.1f} req/s < {budget['min_rps']} req/s")
+    return violations
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the HTTP load benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed-size", default=None, help="Migrate and seed the database with the size preset.")
+    parser.add_argument("--start-server", action="store_true", help="Start the gunicorn for the benchmark.")
+    parser.add_argument("--workers", type=int, default=4, help="The number of the started gunicorn workers.")
+    parser.add_argument("--port", type=int, default=8001, help="The port of the started gunicorn.")
+    parser.add_argument("--base-url", default=None, help="The URL of the running server, without --start-server.")
+    parser.add_argument("--concurrency", type=int, default=16, help="The number of the virtual users.")
+    parser.add_argument("--duration", type=float, default=30, help="The duration of the load in seconds.")
+    parser.add_argument("--warmup", type=float, default=5, help="The duration of the warm up in seconds.")
+    parser.add_argument("--password", default="synthetic", help="The password of the synthetic users.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the random choices of the requests.")
+    parser.add_argument("--budgets", type=Path, default=DEFAULT_BUDGETS_PATH, help="The JSON file of the budgets.")
+    parser.add_argument("--no-budgets", action="store_true", help="Only report the results.")
+    arguments = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "my_game_list.settings.base")
+    django.setup()
+    if arguments.seed_size:
+        print_info(f"Seeding the database with the {arguments.seed_size} synthetic data ...")
+        seed_database(arguments.seed_size)
+
+    rng = random.Random(arguments.seed)  # noqa: S311
+    users, user_ids = load_virtual_users(arguments.concurrency, rng)
+    if not users:
+        print_error("There are no synthetic users with game lists, seed the database with --seed-size.")
+        return 1
+    context = LoadContext(user_ids, rng, arguments.password)
+
+    with ExitStack() as stack:
+        base_url = arguments.base_url or f"http://127.0.0.1:{arguments.port}"
+        if arguments.start_server:
+            multiproc_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            print_info(f"Starting the gunicorn with {arguments.workers} workers ...")
+            try:
+                server = start_server(arguments.port, arguments.workers, multiproc_dir)
+            except RuntimeError as exc:
+                print_error(str(exc))
+                return 1
+            stack.callback(server.wait)
+            stack.callback(server.terminate)
+
+        print_info(f"Warming up for {arguments.warmup} s ...")
+        run_load(base_url, users, context, arguments.warmup)
+        print_info(f"Loading the API by {len(users)} virtual users for {arguments.duration} s ...")
+        results = run_load(base_url, users, context, arguments.duration)
+
+    print_results(results, arguments.duration)
+    if arguments.no_budgets:
+        return 0
+    violations = check_budgets(results, json.loads(arguments.budgets.read_text()), arguments.duration)
+    if violations:
+        print_error(f"The benchmark exceeds the budgets ({arguments.budgets}):")
+        for violation in violations:
+            print_error(f"  {violation}")
+        return 1
+    print_success("The benchmark is within the budgets.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""The task of this module is to measure the per-request overhead of the session based middlewares on the API.
+
+The same API request is sent through the Django test client with two middleware stacks:
+    * flat - the `MGL_SESSION_MIDDLEWARE` are run for every request, as they were listed in the `MIDDLEWARE`,
+    * scoped - the `MGL_SESSION_MIDDLEWARE` are run by the `PathScopedMiddleware` only for the admin paths.
+
+With `--session-cookie` the requests send a session cookie (e.g. of a user logged in to the admin),
+so the flat stack loads the session from the database configured in the environment.
+
+Example:
+    benchmark-middleware.py --requests 5000 --path /version/
+"""
+
+import argparse
+import os
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Self
+
+import django
+from python_colors import print_info, print_success, print_text
+
+SCOPED_MIDDLEWARE = "my_game_list.my_game_list.middleware.PathScopedMiddleware"
+
+
+@dataclass
+class BenchmarkResult:
+    """The result of the benchmark of a single middleware stack."""
+
+    stack: str
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def mean(self: Self) -> float:
+        """The mean request latency in microseconds."""
+        return statistics.fmean(self.latencies) * 1_000_000 if self.latencies else 0.0
+
+    def percentile(self: Self, percent: int) -> float:
+        """The request latency percentile in microseconds."""
+        if len(self.latencies) < 2:  # noqa: PLR2004
+            return 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1_000_000
+
+
+def get_flat_middleware() -> list[str]:
+    """Get the middleware stack with the scoped middlewares run for every request."""
+    from django.conf import settings
+
+    index = settings.MIDDLEWARE.index(SCOPED_MIDDLEWARE)
+    return [*settings.MIDDLEWARE[:index], *settings.MGL_SESSION_MIDDLEWARE, *settings.MIDDLEWARE[index + 1 :]]
+
+
+def benchmark_stack(
+    middleware: list[str],
+    requests: int,
+    arguments: argparse.Namespace,
+    result: BenchmarkResult,
+) -> None:
+    """Send the requests through the middleware stack, recording their latencies."""
+    from django.test import Client, override_settings
+
+    with override_settings(MIDDLEWARE=middleware):
+        client = Client()
+        if arguments.session_cookie:
+            client.cookies["sessionid"] = "benchmark-session-key"
+        for _ in range(arguments.warmup):
+            client.get(arguments.path)
+
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.get(arguments.path)
+            result.latencies.append(time.perf_counter() - start)
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    """Print the results of the benchmark as a table, with the overhead removed by the scoped stack."""
+    print_text(f"{'stack':<7} {'mean us':>9} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}")
+    for result in results:
+        print_text(
+            f"{result.stack:<7} {result.mean:>9.1f} {result.percentile(50):>9.1f} "
+            f"{result.percentile(95):>9.1f} {result.percentile(99):>9.1f}",
+        )
+    # The median is compared, it is not skewed by the occasional slow requests (e.g. the garbage collection).
+    flat_median, scoped_median = (result.percentile(50) for result in results)
+    print_success(
+        f"The scoped stack removes {flat_median - scoped_median:.1f} us per request "
+        f"({(flat_median - scoped_median) / flat_median * 100 if flat_median else 0.0:.1f}% of the median).",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark of the middleware stacks."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default="/version/", help="The requested API path.")
+    parser.add_argument("--requests", type=int, default=2000, help="The number of the measured requests.")
+    parser.add_argument("--warmup", type=int, default=100, help="The number of the warm up requests per round.")
+    parser.add_argument("--rounds", type=int, default=10, help="The number of the alternating rounds.")
+    parser.add_argument("--session-cookie", action="store_true", help="Send a session cookie with the requests.")
+    arguments = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "my_game_list.settings.base")
+    django.setup()
+    from django.conf import settings
+
+    stacks = {"flat": get_flat_middleware(), "scoped": list(settings.MIDDLEWARE)}
+    results = {stack: BenchmarkResult(stack) for stack in stacks}
+    # The stacks are measured alternately in rounds, so a noisy period of the machine affects both of them.
+    for round_number in range(1, arguments.rounds + 1):
+        print_info(f"Benchmarking the middleware stacks, round {round_number}/{arguments.rounds} ...")
+        for stack, middleware in stacks.items():
+            benchmark_stack(middleware, arguments.requests // arguments.rounds, arguments, results[stack])
+    print_results(list(results.values()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
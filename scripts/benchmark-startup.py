@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""The task of this module is to measure the cold start time of the application.
+
+Every command is run in a new interpreter, as the gunicorn master and the management commands are started:
+    * setup - `django.setup()` only,
+    * wsgi - the WSGI application with the URL configuration loaded, as by the first request,
+    * manage - a management command (`version`) run by `my-game-list-manage.py`.
+
+The settings are taken from the environment (`DJANGO_SETTINGS_MODULE`), run `my-game-list-manage.py profile_startup`
+to see which imports and `django.setup()` phases dominate.
+
+Example:
+    benchmark-startup.py --runs 20 --max-seconds 1.5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from python_colors import print_error, print_info, print_success, print_text
+
+MANAGE_PATH = Path(__file__).resolve().parent / "my-game-list-manage.py"
+COMMANDS = {
+    "setup": [sys.executable, "-c", "import django; django.setup()"],
+    "wsgi": [
+        sys.executable,
+        "-c",
+        "from my_game_list.my_game_list.wsgi import application; "
+        "from django.urls import get_resolver; get_resolver().url_patterns",
+    ],
+    "manage": [sys.executable, str(MANAGE_PATH), "version"],
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """The result of the benchmark of a single startup command."""
+
+    name: str
+    durations: list[float] = field(default_factory=list)
+
+    @property
+    def median(self: Self) -> float:
+        """The median startup time in seconds."""
+        return statistics.median(self.durations) if self.durations else 0.0
+
+
+def run_command(command: Sequence[str]) -> float:
+    """Run the command, returning its duration in seconds."""
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)  # noqa: S603
+    return time.perf_counter() - start
+
+
+def benchmark_command(name: str, runs: int) -> BenchmarkResult:
+    """Run the command repeatedly, after a warm up run compiling the bytecode and filling the file system cache."""
+    result = BenchmarkResult(name)
+    run_command(COMMANDS[name])
+    for _ in range(runs):
+        result.durations.append(run_command(COMMANDS[name]))
+    return result
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    """Print the results of the benchmark as a table."""
+    print_text(f"{'command':<8} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for result in results:
+        print_text(
+            f"{result.name:<8} {result.median * 1000:>10.1f} {min(result.durations) * 1000:>8.1f} "
+            f"{max(result.durations) * 1000:>8.1f}",
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark of the startup commands."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", nargs="+", choices=tuple(COMMANDS), default=tuple(COMMANDS))
+    parser.add_argument("--runs", type=int, default=10, help="The number of the measured runs per command.")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="The budget of the median startup time, the benchmark fails when any command exceeds it.",
+    )
+    arguments = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "my_game_list.settings.base")
+    results = []
+    for name in arguments.commands:
+        print_info(f"Benchmarking the {name} startup ...")
+        try:
+            results.append(benchmark_command(name, arguments.runs))
+        except subprocess.CalledProcessError as exc:
+            print_error(f"The {name} startup failed: {exc.stderr.decode(errors='replace')[-2000:]}")
+            return 1
+    print_results(results)
+
+    over_budget = [result.name for result in results if arguments.max_seconds and result.median > arguments.max_seconds]
+    if over_budget:
+        print_error(f"The startup exceeds the budget of {arguments.max_seconds} s: {', '.join(over_budget)}.")
+        return 1
+    print_success("The benchmark is finished.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+"""The task of this module is to compare the sync and the ASGI (uvicorn) gunicorn worker modes under load.
+
+Both modes are started with the same number of workers from `docker/app/gunicorn.conf.py` against the database
+configured in the environment. Each mode is loaded by the concurrent clients for the same time, optionally together
+with the slow clients which send the request headers slowly and occupy the connections. The memory (USS) of
+the gunicorn processes is reported next to the throughput and the latency, so the modes can be compared at equal
+memory, e.g. by running the ASGI mode with fewer workers (`--asgi-workers`).
+
+Example:
+    MGL_BENCHMARK_TOKEN=<JWT access token> benchmark-worker-modes.py --concurrency 64 --slow-clients 16
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+import psutil
+import requests
+from python_colors import print_error, print_info, print_success, print_text
+
+GUNICORN_CONFIG_PATH = Path(__file__).resolve().parents[1] / "docker" / "app" / "gunicorn.conf.py"
+DEFAULT_PATHS = ("/api/game/games/", "/api/game/game-lists/", "/version/")
+STARTUP_TIMEOUT = 60
+
+
+@dataclass
+class BenchmarkResult:
+    """The result of the benchmark of a single worker mode."""
+
+    mode: str
+    workers: int
+    duration: float
+    memory: int = 0
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def throughput(self: Self) -> float:
+        """The number of successful requests per second."""
+        return len(self.latencies) / self.duration
+
+    def percentile(self: Self, percent: int) -> float:
+        """The latency percentile in milliseconds."""
+        if len(self.latencies) < 2:  # noqa: PLR2004
+            return 0.0
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1000
+
+
+def is_responding(port: int) -> bool:
+    """Check if the server responds on the port."""
+    try:
+        requests.get(f"http://127.0.0.1:{port}/version/", timeout=1).raise_for_status()
+    except requests.RequestException:
+        return False
+    return True
+
+
+def start_server(mode: str, workers: int, port: int, multiproc_dir: str) -> subprocess.Popen[bytes]:
+    """Start the gunicorn with the given worker mode and wait until it responds."""
+    env = {
+        **os.environ,
+        "GUNICORN_WORKER_MODE": mode,
+        "GUNICORN_WORKERS": str(workers),
+        "PROMETHEUS_MULTIPROC_DIR": multiproc_dir,
+    }
+    server = subprocess.Popen(  # noqa: S603
+        ["gunicorn", "-c", str(GUNICORN_CONFIG_PATH), "-b", f"127.0.0.1:{port}"],  # noqa: S607
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_responding(port):
+            return server
+        time.sleep(0.5)
+    server.terminate()
+    msg = f"The gunicorn in the {mode} mode did not start in {STARTUP_TIMEOUT} seconds."
+    raise RuntimeError(msg)
+
+
+def get_memory(server: subprocess.Popen[bytes]) -> int:
+    """Get the unique memory (USS) of the gunicorn master and its workers in bytes."""
+    master = psutil.Process(server.pid)
+    return sum(process.memory_full_info().uss for process in [master, *master.children(recursive=True)])
+
+
+def run_client(base_url: str, paths: Sequence[str], token: str, deadline: float, result: BenchmarkResult) -> None:
+    """Send the requests until the deadline, recording the latencies of the successful ones."""
+    session = requests.Session()
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    index = 0
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            response = session.get(f"{base_url}{paths[index % len(paths)]}", timeout=30)
+        except requests.RequestException:
+            result.errors += 1
+        else:
+            if response.ok:
+                result.latencies.append(time.perf_counter() - start)
+            else:
+                result.errors += 1
+        index += 1
+
+
+def run_slow_client(port: int, deadline: float) -> None:
+    """Keep a connection open, sending the request headers one byte per second until the deadline."""
+    request = b"GET /version/ HTTP/1.1\r\nHost: 127.0.0.1\r\n" + b"X-Padding: " + b"a" * 1000
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as connection:
+            for byte in request:
+                if time.monotonic() >= deadline:
+                    return
+                connection.sendall(bytes([byte]))
+                time.sleep(1)
+    except OSError:
+        return
+
+
+def benchmark_mode(mode: str, workers: int, arguments: argparse.Namespace) -> BenchmarkResult:
+    """Run the benchmark of a single worker mode."""
+    with tempfile.TemporaryDirectory() as multiproc_dir:
+        server = start_server(mode, workers, arguments.port, multiproc_dir)
+        try:
+            base_url = f"http://127.0.0.1:{arguments.port}"
+            # Warm up the workers, so the imports and the connections are not measured.
+            warmup = BenchmarkResult(mode, workers, arguments.warmup)
+            run_client(base_url, arguments.paths, arguments.token, time.monotonic() + arguments.warmup, warmup)
+
+            result = BenchmarkResult(mode, workers, arguments.duration)
+            deadline = time.monotonic() + arguments.duration
+            threads = [
+                threading.Thread(target=run_slow_client, args=(arguments.port, deadline))
+                for _ in range(arguments.slow_clients)
+            ]
+            threads += [
+                threading.Thread(target=run_client, args=(base_url, arguments.paths, arguments.token, deadline, result))
+                for _ in range(arguments.concurrency)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            result.memory = get_memory(server)
+        finally:
+            server.terminate()
+            server.wait()
+    return result
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    """Print the results of the benchmark as a table."""
+    print_text(
+        f"{'mode':<6} {'workers':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>7} {'USS MB':>8} {'req/s per 100 MB':>17}",
+    )
+    for result in results:
+        memory_mb = result.memory / 1024 / 1024
+        print_text(
+            f"{result.mode:<6} {result.workers:>7} {result.throughput:>9.1f} {result.percentile(50):>8.1f} "
+            f"{result.percentile(95):>8.1f} {result.percentile(99):>8.1f} {result.errors:>7} {memory_mb:>8.1f} "
+            f"{result.throughput / memory_mb * 100 if memory_mb else 0.0:>17.1f}",
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark of the worker modes."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", choices=("sync", "asgi"), default=("sync", "asgi"))
+    parser.add_argument("--sync-workers", type=int, default=4, help="The number of the sync workers.")
+    parser.add_argument("--asgi-workers", type=int, default=4, help="The number of the uvicorn workers.")
+    parser.add_argument("--concurrency", type=int, default=32, help="The number of the concurrent clients.")
+    parser.add_argument("--slow-clients", type=int, default=0, help="The number of the slow clients.")
+    parser.add_argument("--duration", type=float, default=30, help="The duration of the load in seconds.")
+    parser.add_argument("--warmup", type=float, default=5, help="The duration of the warm up in seconds.")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="The requested paths.")
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("MGL_BENCHMARK_TOKEN", ""),
+        help="The JWT access token used for the requests, by default from MGL_BENCHMARK_TOKEN.",
+    )
+    arguments = parser.parse_args(argv)
+
+    results = []
+    for mode in arguments.modes:
+        workers = arguments.sync_workers if mode == "sync" else arguments.asgi_workers
+        print_info(f"Benchmarking the {mode} mode with {workers} workers ...")
+        try:
+            results.append(benchmark_mode(mode, workers, arguments))
+        except RuntimeError as exc:
+            print_error(str(exc))
+            return 1
+    print_success("The benchmark is finished.")
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""The task of this module is to report the memory of the gunicorn master and its workers.
+
+The unique memory (USS) of a process is freed when the process exits, so it is the memory added by every
+additional worker. With the preloaded application (`GUNICORN_PRELOAD`) the workers share the memory of the master,
+the shared part is the resident memory (RSS) not unique to the process.
+
+Example:
+    report-worker-memory.py --pid $(pgrep -o gunicorn)
+"""
+
+import argparse
+from collections.abc import Sequence
+
+import psutil
+from python_colors import print_error, print_info, print_text
+
+MB = 1024 * 1024
+
+
+def print_process_memory(role: str, process: psutil.Process) -> int:
+    """Print the memory of the process, returning its unique memory in bytes."""
+    memory = process.memory_full_info()
+    print_text(
+        f"{role:<7} {process.pid:>8} {memory.rss / MB:>8.1f} {memory.pss / MB:>8.1f} {memory.uss / MB:>8.1f} "
+        f"{(memory.rss - memory.uss) / MB:>10.1f}",
+    )
+    return int(memory.uss)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Report the memory of the gunicorn processes."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pid", type=int, required=True, help="The process ID of the gunicorn master.")
+    arguments = parser.parse_args(argv)
+
+    try:
+        master = psutil.Process(arguments.pid)
+        workers = master.children()
+        print_text(f"{'process':<7} {'pid':>8} {'RSS MB':>8} {'PSS MB':>8} {'USS MB':>8} {'shared MB':>10}")
+        total = print_process_memory("master", master)
+        workers_total = sum(print_process_memory("worker", worker) for worker in workers)
+    except (psutil.NoSuchProcess, psutil.AccessDenied) as exc:
+        print_error(f"Cannot read the memory of the gunicorn processes: {exc}")
+        return 1
+
+    total += workers_total
+    print_info(f"Total USS: {total / MB:.1f} MB, workers: {len(workers)}.")
+    if workers:
+        print_info(f"Mean USS per worker: {workers_total / len(workers) / MB:.1f} MB.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,8 @@
+MODE_GENERIC: int
+MODE_TEXT: int
+MODE_FONT: int
+
+class error(Exception): ...  # noqa: N801
+
+def compress(string: bytes, mode: int = 0, quality: int = 11, lgwin: int = 22, lgblock: int = 0) -> bytes: ...
+def decompress(string: bytes) -> bytes: ...
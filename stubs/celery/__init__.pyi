@@ -0,0 +1,42 @@
+from collections.abc import Callable
+from typing import Any, Generic, ParamSpec, Self, TypeVar, overload
+
+from _typeshed import Incomplete
+
+from celery.result import AsyncResult
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+class Task(Generic[_P, _R]):
+    name: str
+    def __call__(self: Self, *args: _P.args, **kwargs: _P.kwargs) -> _R: ...
+    def delay(self: Self, *args: _P.args, **kwargs: _P.kwargs) -> AsyncResult: ...
+    def apply_async(
+        self: Self,
+        args: tuple[Any, ...] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        **options: Any,
+    ) -> AsyncResult: ...
+
+class Celery:
+    conf: Incomplete
+    tasks: dict[str, Task[..., Any]]
+    def __init__(self: Self, main: str | None = None, **kwargs: Any) -> None: ...
+    def config_from_object(
+        self: Self,
+        obj: Any,
+        silent: bool = False,
+        force: bool = False,
+        namespace: str | None = None,
+    ) -> None: ...
+    def autodiscover_tasks(
+        self: Self,
+        packages: Incomplete | None = None,
+        related_name: str = "tasks",
+        force: bool = False,
+    ) -> None: ...
+    @overload
+    def task(self: Self, fun: Callable[_P, _R]) -> Task[_P, _R]: ...
+    @overload
+    def task(self: Self, **options: Any) -> Callable[[Callable[_P, _R]], Task[_P, _R]]: ...
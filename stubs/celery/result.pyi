@@ -0,0 +1,6 @@
+from typing import Any, Self
+
+class AsyncResult:
+    id: str
+    def get(self: Self, timeout: float | None = None, propagate: bool = True, **kwargs: Any) -> Any: ...
+    def successful(self: Self) -> bool: ...
@@ -1,2 +1 @@
-import pip_prometheus as pip_prometheus
 from django_prometheus import middleware as middleware, models as models
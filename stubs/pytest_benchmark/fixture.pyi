@@ -0,0 +1,19 @@
+from collections.abc import Callable
+from typing import Any, Self, TypeVar
+
+_R = TypeVar("_R")
+
+class BenchmarkFixture:
+    disabled: bool
+    extra_info: dict[str, Any]
+    def __call__(self: Self, function_to_benchmark: Callable[..., _R], *args: Any, **kwargs: Any) -> _R: ...
+    def pedantic(
+        self: Self,
+        target: Callable[..., _R],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], Any] | None = None,
+        rounds: int = 1,
+        warmup_rounds: int = 0,
+        iterations: int = 1,
+    ) -> _R: ...
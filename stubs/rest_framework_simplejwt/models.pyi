@@ -6,10 +6,15 @@ class TokenUser:
     is_active: bool
     token: Incomplete
     def __init__(self, token: Incomplete) -> None: ...
+    @property
     def id(self) -> Incomplete: ...
+    @property
     def pk(self) -> Incomplete: ...
+    @property
     def username(self) -> Incomplete: ...
+    @property
     def is_staff(self) -> Incomplete: ...
+    @property
     def is_superuser(self) -> Incomplete: ...
     def __eq__(self, other: Incomplete) -> Incomplete: ...
     def __ne__(self, other: Incomplete) -> Incomplete: ...
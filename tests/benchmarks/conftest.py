@@ -0,0 +1,144 @@
+"""The fixtures of the benchmarks, the serialized instances are built in the memory without the database."""
+
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from _pytest.terminal import TerminalReporter
+from django.db.models import Model, QuerySet
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from my_game_list.friendships.models import Friendship, FriendshipRequest
+from my_game_list.games.models import Company, Game, GameList, GameListStatus, GameMedia, Genre, Platform
+from my_game_list.users.models import User
+
+PAGE_SIZES = (25, 100, 500)
+CREATED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
+peak_allocations: dict[str, int] = {}
+"""The peak memory allocated by the serialization in bytes per benchmark, reported at the end of the run."""
+
+
+def prefetched(instance: Model, related_name: str, objects: Iterable[Model]) -> None:
+    """Store the related objects of the many-to-many relation as they were prefetched."""
+    manager = getattr(instance, related_name)
+    queryset: QuerySet[Any] = manager.model.objects.all()
+    queryset._result_cache = list(objects)  # noqa: SLF001
+    queryset._prefetch_done = True  # type: ignore[attr-defined]  # noqa: SLF001
+    cache = getattr(instance, "_prefetched_objects_cache", {})
+    instance._prefetched_objects_cache = {**cache, related_name: queryset}  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+def make_user(user_id: int) -> User:
+    """Make the user."""
+    return User(id=user_id, username=f"user{user_id}", email=f"user{user_id}@example.com", date_joined=CREATED_AT)
+
+
+def make_game(game_id: int) -> Game:
+    """Make the game with its companies, genres and platforms and the annotated statistics."""
+    game = Game(
+        id=game_id,
+        igdb_id=game_id,
+        title=f"Game {game_id}",
+        created_at=CREATED_AT,
+        last_modified_at=CREATED_AT,
+        release_date=date(2020, 1, 1) + timedelta(days=game_id),
+        cover_image_id=f"co{game_id}",
+        summary="A summary of the game. " * 10,
+        publisher=Company(id=1, igdb_id=1, name="Publisher", company_logo_id="publisher"),
+        developer=Company(id=2, igdb_id=2, name="Developer", company_logo_id="developer"),
+    )
+    prefetched(game, "genres", [Genre(id=genre_id, igdb_id=genre_id, name=f"Genre {genre_id}") for genre_id in (1, 2)])
+    platforms = [Platform(id=number, igdb_id=number, name=f"Platform {number}") for number in (1, 2, 3)]
+    prefetched(game, "platforms", platforms)
+    game.average_score = Decimal("7.50")
+    game.scores_count = 100
+    game.rank_position = game_id
+    game.members_count = 200
+    game.popularity = game_id
+    return game
+
+
+def make_game_list(game_list_id: int, user: User) -> GameList:
+    """Make the game list of the user with the owned media."""
+    game_list = GameList(
+        id=game_list_id,
+        score=8,
+        status=GameListStatus.COMPLETED,
+        created_at=CREATED_AT,
+        last_modified_at=CREATED_AT,
+        game=make_game(game_list_id),
+        user=user,
+    )
+    prefetched(game_list, "owned_on", [GameMedia(id=1, name="Steam")])
+    return game_list
+
+
+def make_user_detail(user_id: int) -> User:
+    """Make the user with the game list statistics, the friends and the latest game list updates."""
+    user = make_user(user_id)
+    for status in GameListStatus:
+        setattr(user, f"game_lists_{status.name.lower()}", 10)
+    user.game_lists_total = 50  # type: ignore[attr-defined]
+    user.game_lists_mean_score = 7.5  # type: ignore[attr-defined]
+    user.limited_friends = [  # type: ignore[attr-defined]
+        Friendship(id=number, user=user, friend=make_user(user_id + number), created_at=CREATED_AT)
+        for number in range(1, 6)
+    ]
+    user.latest_game_list_updates = [make_game_list(number, user) for number in range(1, 6)]  # type: ignore[attr-defined]
+    return user
+
+
+def make_friendship_request(request_id: int) -> FriendshipRequest:
+    """Make the friendship request with its sender and receiver."""
+    return FriendshipRequest(
+        id=request_id,
+        message="Let's be friends!",
+        created_at=CREATED_AT,
+        last_modified_at=CREATED_AT,
+        sender=make_user(request_id),
+        receiver=make_user(request_id + 1),
+    )
+
+
+@pytest.fixture(params=PAGE_SIZES, ids=lambda page_size: f"page_size={page_size}")
+def page_size(request: pytest.FixtureRequest) -> int:
+    """The number of the serialized instances, as in a page of the API."""
+    page_size: int = request.param
+    return page_size
+
+
+@pytest.fixture
+def measure_serialization(
+    benchmark: BenchmarkFixture,
+    request: pytest.FixtureRequest,
+) -> Callable[[Callable[[], Any]], Any]:
+    """Fixture benchmarking the serialization, with the memory it allocates in the extra info of the benchmark.
+
+    The allocations are measured by `tracemalloc` in a separate run, so they do not slow down the measured rounds.
+    """
+
+    def measure(serialize: Callable[[], Any]) -> Any:  # noqa: ANN401
+        tracemalloc.start()
+        try:
+            serialize()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_allocated_bytes"] = peak
+        peak_allocations[request.node.name] = peak
+        return benchmark(serialize)
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+    """Report the peak memory allocated by the serialization of the benchmarks."""
+    if not peak_allocations:
+        return
+    terminalreporter.section("serialization peak allocations")
+    for name, peak in sorted(peak_allocations.items(), key=lambda item: item[1]):
+        terminalreporter.write_line(f"{name:<60} {peak / 1024:>12,.1f} KiB")
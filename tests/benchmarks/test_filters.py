@@ -0,0 +1,82 @@
+"""This module contains the benchmarks of the genres and platforms filters of the games on the seeded data.
+
+The filters by the `EXISTS` subqueries with the cached names are compared with the previous filters, which
+validated the names by a query of the dictionary and joined the many-to-many relation with `DISTINCT`.
+"""
+
+from dataclasses import replace
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.db.models import Count
+from django_filters import rest_framework as filters
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from my_game_list.games.filters import GameFilterSet
+from my_game_list.games.models import Genre, Platform
+from my_game_list.games.views import GameViewSet
+from my_game_list.my_game_list.synthetic import SIZE_PRESETS, seed_synthetic_data
+
+SEED_SIZE = replace(SIZE_PRESETS["tiny"], users=20, games=3000, genres=25, platforms=40, game_lists_per_user=5)
+PAGE_SIZE = 25
+
+
+class JoinGameFilterSet(GameFilterSet):
+    """The games filter set with the previous filters joining the many-to-many relations."""
+
+    genres = filters.ModelMultipleChoiceFilter(  # type: ignore[assignment]
+        field_name="genres__name",
+        to_field_name="name",
+        queryset=Genre.objects.all(),
+    )
+    platforms = filters.ModelMultipleChoiceFilter(  # type: ignore[assignment]
+        field_name="platforms__name",
+        to_field_name="name",
+        queryset=Platform.objects.all(),
+    )
+
+
+@pytest.fixture
+def filter_data() -> dict[str, list[str]]:
+    """Seed the games and get the names of the most popular genres and platforms to filter by."""
+    cache.clear()
+    seed_synthetic_data(SEED_SIZE)
+    genres = Genre.objects.annotate(games_count=Count("games")).order_by("-games_count").values_list("name", flat=True)
+    platforms = (
+        Platform.objects.annotate(games_count=Count("games")).order_by("-games_count").values_list("name", flat=True)
+    )
+    return {"genres": list(genres[:2]), "platforms": list(platforms[:3])}
+
+
+def filter_games(filterset_class: type[GameFilterSet], data: dict[str, list[str]]) -> tuple[int, list[Any]]:
+    """Filter the games as by the games list, returning the count and the first page."""
+    queryset = filterset_class(data, queryset=GameViewSet.queryset.order_by("id")).qs
+    return queryset.count(), list(queryset[:PAGE_SIZE])
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("filterset_class", "mode"),
+    [
+        pytest.param(JoinGameFilterSet, "", id="join-any"),
+        pytest.param(GameFilterSet, "", id="exists-any"),
+        pytest.param(GameFilterSet, "_all", id="exists-all"),
+    ],
+)
+def test_filter_games_by_genres_and_platforms(
+    benchmark: BenchmarkFixture,
+    filter_data: dict[str, list[str]],
+    filterset_class: type[GameFilterSet],
+    mode: str,
+) -> None:
+    """Benchmark the count and the first page of the games filtered by the genres and the platforms."""
+    data = {f"{name}{mode}": values for name, values in filter_data.items()}
+    # The names of the dictionaries are cached by the first request.
+    filter_games(filterset_class, data)
+
+    count, page = benchmark(filter_games, filterset_class, data)
+
+    assert len({game.id for game in page}) == len(page)
+    if mode == "":
+        assert count == filter_games(GameFilterSet, data)[0]
@@ -0,0 +1,33 @@
+"""This module contains the benchmarks of the JSON renderers of the API responses.
+
+The rendered data are the serialized pages of games, with the average scores as decimals, as they are annotated
+by `with_average_score`.
+"""
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from my_game_list.games.serializers import GameSerializer
+from my_game_list.my_game_list.renderers import ORJSONRenderer
+from tests.benchmarks.conftest import make_game
+
+
+@pytest.mark.parametrize("renderer_class", [JSONRenderer, ORJSONRenderer])
+def test_render_games(
+    measure_serialization: Callable[[Callable[[], Any]], Any],
+    page_size: int,
+    renderer_class: type[JSONRenderer],
+) -> None:
+    """Benchmark the rendering of the page of games to JSON."""
+    data = GameSerializer([make_game(game_id) for game_id in range(1, page_size + 1)], many=True).data
+    for game in data:
+        game["average_score"] = Decimal(game["average_score"])
+    response = {"count": page_size, "next": None, "previous": None, "results": data}
+
+    content = measure_serialization(lambda: renderer_class().render(response))
+
+    assert content == JSONRenderer().render(response)
@@ -0,0 +1,87 @@
+"""This module contains the benchmarks of the serializers of the API.
+
+The serialized instances are built in the memory with their related objects and annotations, as they are loaded
+by the views, so the benchmarks measure only the serialization. The benchmarks are disabled by default, they are run
+by `make benchmark_serializers`.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from my_game_list.friendships.serializers import FriendshipRequestSerializer
+from my_game_list.games.serializers import GameListSerializer, GameSerializer
+from my_game_list.my_game_list.compiled import CompiledListSerializer
+from my_game_list.users.serializers import UserDetailSerializer
+from tests.benchmarks.conftest import (
+    make_friendship_request,
+    make_game,
+    make_game_list,
+    make_user,
+    make_user_detail,
+)
+
+
+def test_game_serializer(measure_serialization: Callable[[Callable[[], Any]], Any], page_size: int) -> None:
+    """Benchmark the serialization of the page of games."""
+    games = [make_game(game_id) for game_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: GameSerializer(games, many=True).data)
+
+    assert len(data) == page_size
+    assert data[0]["genres"][0]["name"] == "Genre 1"
+
+
+def test_game_list_serializer(measure_serialization: Callable[[Callable[[], Any]], Any], page_size: int) -> None:
+    """Benchmark the serialization of the page of game lists."""
+    user = make_user(1)
+    game_lists = [make_game_list(game_list_id, user) for game_list_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: GameListSerializer(game_lists, many=True).data)
+
+    assert len(data) == page_size
+    assert data[0]["owned_on"] == [{"id": 1, "name": "Steam"}]
+
+
+def test_compiled_game_serializer(measure_serialization: Callable[[Callable[[], Any]], Any], page_size: int) -> None:
+    """Benchmark the compiled serialization of the page of games, as by the games list endpoint."""
+    games = [make_game(game_id) for game_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: CompiledListSerializer(games, child=GameSerializer()).data)
+
+    assert data == GameSerializer(games, many=True).data
+
+
+def test_compiled_game_list_serializer(
+    measure_serialization: Callable[[Callable[[], Any]], Any],
+    page_size: int,
+) -> None:
+    """Benchmark the compiled serialization of the page of game lists, as by the game lists list endpoint."""
+    user = make_user(1)
+    game_lists = [make_game_list(game_list_id, user) for game_list_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: CompiledListSerializer(game_lists, child=GameListSerializer()).data)
+
+    assert data == GameListSerializer(game_lists, many=True).data
+
+
+def test_user_detail_serializer(measure_serialization: Callable[[Callable[[], Any]], Any], page_size: int) -> None:
+    """Benchmark the serialization of the page of detailed users."""
+    users = [make_user_detail(user_id) for user_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: UserDetailSerializer(users, many=True).data)
+
+    assert len(data) == page_size
+    assert data[0]["game_list_statistics"]["total"] == 50  # noqa: PLR2004
+
+
+def test_friendship_request_serializer(
+    measure_serialization: Callable[[Callable[[], Any]], Any],
+    page_size: int,
+) -> None:
+    """Benchmark the serialization of the page of friendship requests."""
+    friendship_requests = [make_friendship_request(request_id) for request_id in range(1, page_size + 1)]
+
+    data = measure_serialization(lambda: FriendshipRequestSerializer(friendship_requests, many=True).data)
+
+    assert len(data) == page_size
+    assert data[0]["receiver"]["id"] == 2  # noqa: PLR2004
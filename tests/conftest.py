@@ -1,16 +1,35 @@
 """Includes global scope fixtures. They can be used in all tests."""
 
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import QuerySet
 from freezegun import freeze_time
 from model_bakery import baker
 from rest_framework.test import APIClient
 
+from my_game_list.games.models import Company, Game, Genre, Platform
 from my_game_list.users.models import User as UserModel
 
 User: type[UserModel] = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    """Clear the cache before and after every test.
+
+    The cached dictionary IDs, claims of the users and responses are not rolled back with the database, so a test
+    would read the values cached by the other tests.
+    """
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 @freeze_time("2023-05-25 12:01:12")
 def user_fixture() -> UserModel:
@@ -45,6 +64,64 @@ def admin_user_fixture() -> UserModel:
     )
 
 
+@pytest.fixture
+def admin_user(admin_user_fixture: UserModel) -> UserModel:
+    """The superuser of the pytest-django `admin_client`, its own superuser is created without the required username."""
+    return admin_user_fixture
+
+
+@pytest.fixture
+def games_fixture() -> list[Game]:
+    """Create the games with the companies, genres and platforms.
+
+    The first game has all of the genres and platforms filtered together, the second game has two genres containing
+    the same search term and the last game has no companies and no release date.
+
+    Returns:
+        list[Game]: The created games.
+    """
+    publisher, developer = (baker.make(Company, name=name, company_logo_id="logo") for name in ("Valve", "Bethesda"))
+    shooter, tactical_shooter, rpg, puzzle = (
+        baker.make(Genre, name=name) for name in ("Shooter", "Tactical shooter", "RPG", "Puzzle")
+    )
+    pc, console = (baker.make(Platform, name=name) for name in ("PC", "Console"))
+    return [
+        baker.make(
+            Game,
+            title="Borderlands",
+            genres=[shooter, rpg],
+            platforms=[pc, console],
+            publisher=publisher,
+            developer=developer,
+        ),
+        baker.make(
+            Game,
+            title="Counter-Strike",
+            genres=[shooter, tactical_shooter],
+            platforms=[pc],
+            publisher=publisher,
+            developer=developer,
+        ),
+        baker.make(
+            Game,
+            title="Skyrim",
+            genres=[rpg],
+            platforms=[console],
+            publisher=publisher,
+            developer=developer,
+        ),
+        baker.make(
+            Game,
+            title="Tetris",
+            genres=[puzzle],
+            platforms=[console],
+            publisher=None,
+            developer=None,
+            release_date=None,
+        ),
+    ]
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """Fixture providing the API client."""
@@ -65,3 +142,37 @@ def admin_authenticated_api_client(admin_user_fixture: UserModel, api_client: AP
     api_client.force_authenticate(admin_user_fixture)
 
     return api_client
+
+
+def _analyze(table: str) -> None:
+    """Update the planner statistics of the table, so the plan reflects the seeded data."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+
+@pytest.fixture
+def index_query_plans() -> Callable[[QuerySet[Any]], tuple[str, str]]:
+    """Fixture providing the `EXPLAIN` plans of the query without the indexes of the model and with them.
+
+    The indexes of the model (`Meta.indexes`) are dropped and created again by the schema editor, so the plan without
+    them shows the scan of the table having only its primary key, unique constraints and foreign key indexes. The test
+    has to run outside of the transaction (`django_db(transaction=True)`).
+    """
+
+    def get_plans(queryset: QuerySet[Any]) -> tuple[str, str]:
+        model = queryset.model
+        indexes = model._meta.indexes  # noqa: SLF001
+        with connection.schema_editor() as schema_editor:
+            for index in indexes:
+                schema_editor.remove_index(model, index)
+        try:
+            _analyze(model._meta.db_table)  # noqa: SLF001
+            plan_without_index = queryset.explain()
+        finally:
+            with connection.schema_editor() as schema_editor:
+                for index in indexes:
+                    schema_editor.add_index(model, index)
+        _analyze(model._meta.db_table)  # noqa: SLF001
+        return plan_without_index, queryset.explain()
+
+    return get_plans
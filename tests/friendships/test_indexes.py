@@ -0,0 +1,59 @@
+"""Tests for the indexes of the friendship request model, the queries of the API use them on the seeded data."""
+
+import re
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import QuerySet
+
+from my_game_list.friendships.models import FriendshipRequest
+from my_game_list.users.models import User as UserModel
+
+User: type[UserModel] = get_user_model()
+
+USERS_COUNT = 60
+
+
+@pytest.fixture
+def seeded_friendship_requests() -> UserModel:
+    """Seed the friendship requests between all the users, every other of them rejected, returning one user."""
+    users = User.objects.bulk_create(
+        User(username=f"user{number}", email=f"user{number}@email.com") for number in range(USERS_COUNT)
+    )
+    rejected_at = datetime(2024, 1, 1, tzinfo=UTC)
+    FriendshipRequest.objects.bulk_create(
+        FriendshipRequest(sender=sender, receiver=receiver, rejected_at=rejected_at if number % 2 else None)
+        for number, sender in enumerate(users)
+        for receiver in users
+        if sender != receiver
+    )
+    return users[0]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="The plans are PostgreSQL specific.")
+@pytest.mark.parametrize(
+    ("index_name", "get_queryset"),
+    [
+        pytest.param(
+            "friend_request_receiver_idx",
+            lambda user: FriendshipRequest.objects.filter(receiver=user, rejected_at__isnull=True),
+            id="pending requests received by the user",
+        ),
+    ],
+)
+def test_query_uses_index(
+    index_name: str,
+    get_queryset: Callable[[UserModel], QuerySet[Any]],
+    seeded_friendship_requests: UserModel,
+    index_query_plans: Callable[[QuerySet[Any]], tuple[str, str]],
+) -> None:
+    """Test that the query is planned with the scan of the index instead of the sequential scan without it."""
+    plan_without_index, plan = index_query_plans(get_queryset(seeded_friendship_requests))
+
+    assert "Seq Scan" in plan_without_index
+    assert re.search(rf"Index (?:Only )?Scan (?:Backward )?(?:using|on) {index_name}\b", plan)
@@ -2,6 +2,7 @@
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from freezegun import freeze_time
 from model_bakery import baker
 from rest_framework import status
@@ -70,3 +71,23 @@ def test_custom_action_reject(admin_authenticated_api_client: APIClient) -> None
     assert response.json() == {"detail": "Success"}
     friendship_request.refresh_from_db()
     assert str(friendship_request.rejected_at) == "2023-06-23 18:21:41+00:00"
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(("rejected", "expected_messages"), [("false", ["pending"]), ("true", ["rejected"])])
+def test_filter_rejected(
+    rejected: str,
+    expected_messages: list[str],
+    admin_user_fixture: UserModel,
+    admin_authenticated_api_client: APIClient,
+) -> None:
+    """Check that the received friendship requests are filtered by the rejection."""
+    baker.make(FriendshipRequest, receiver=admin_user_fixture, message="pending")
+    baker.make(FriendshipRequest, receiver=admin_user_fixture, message="rejected", rejected_at=timezone.now())
+    response = admin_authenticated_api_client.get(
+        reverse("friendships:friendship-requests-list"),
+        {"receiver": str(admin_user_fixture.pk), "rejected": rejected},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [result["message"] for result in response.json()["results"]] == expected_messages
@@ -0,0 +1,102 @@
+"""Tests for the filters of the game related data."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from drf_spectacular.generators import SchemaGenerator
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from my_game_list.games.models import Game, Genre
+
+GAMES_URL = reverse("games:games-list")
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("query", "titles"),
+    [
+        pytest.param(
+            {"genres": ["Shooter", "RPG"]},
+            ["Borderlands", "Counter-Strike", "Skyrim"],
+            id="Any of the genres.",
+        ),
+        pytest.param({"genres_all": ["Shooter", "RPG"]}, ["Borderlands"], id="All of the genres."),
+        pytest.param({"platforms": ["PC"]}, ["Borderlands", "Counter-Strike"], id="Any of the platforms."),
+        pytest.param({"platforms_all": ["PC", "Console"]}, ["Borderlands"], id="All of the platforms."),
+        pytest.param(
+            {"genres": ["RPG"], "platforms": ["Console"]},
+            ["Borderlands", "Skyrim"],
+            id="Genres and platforms.",
+        ),
+        pytest.param({"genres_all": ["Puzzle", "PC"]}, None, id="Platform as the genre."),
+    ],
+)
+@pytest.mark.usefixtures("games_fixture")
+def test_game_filter_genres_and_platforms(
+    query: dict[str, list[str]],
+    titles: list[str] | None,
+    authenticated_api_client: APIClient,
+) -> None:
+    """Test that the games are filtered by the names of the genres and the platforms, without the duplicates."""
+    response = authenticated_api_client.get(GAMES_URL, query)
+
+    if titles is None:
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        return
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert sorted(game["title"] for game in results) == titles
+    assert response.json()["count"] == len(titles)
+    # The rank positions are not shifted by the duplicated rows of the join.
+    assert sorted(game["rank_position"] for game in results) == list(range(1, len(titles) + 1))
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_game_filter_cached_names(authenticated_api_client: APIClient) -> None:
+    """Test that the names are resolved by the cached map, which is invalidated by the change of the dictionary."""
+    authenticated_api_client.get(GAMES_URL, {"genres": ["Shooter"]})
+
+    with CaptureQueriesContext(connection) as context:
+        authenticated_api_client.get(GAMES_URL, {"genres": ["Shooter"]})
+    # The genres of the games are still prefetched, by the join with the through table.
+    genre_queries = [query["sql"] for query in context.captured_queries if 'FROM "games_genre"' in query["sql"]]
+    assert all("JOIN" in sql for sql in genre_queries)
+
+    baker.make(Genre, name="Racing")
+    response = authenticated_api_client.get(GAMES_URL, {"genres": ["Racing"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == 0
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_game_filter_name_missing_from_cached_map(authenticated_api_client: APIClient) -> None:
+    """Test that the name created after the map was cached (by another process) is looked up in the database."""
+    authenticated_api_client.get(GAMES_URL, {"genres": ["Shooter"]})
+    # The bulk create does not send the signals, as the change made by another process does not reach this cache.
+    (racing,) = Genre.objects.bulk_create([Genre(name="Racing", igdb_id=1000)])
+    Game.objects.get(title="Skyrim").genres.add(racing)
+
+    response = authenticated_api_client.get(GAMES_URL, {"genres_all": ["Racing", "RPG"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert [game["title"] for game in response.json()["results"]] == ["Skyrim"]
+
+    response = authenticated_api_client.get(GAMES_URL, {"genres": ["Racing", "Flight"]})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "Flight" in response.json()["genres"][0]
+
+
+def test_game_filter_names_not_in_schema() -> None:
+    """Test that the names of the dictionaries are documented as the strings, without listing them in the schema."""
+    generator = SchemaGenerator()  # type: ignore[no-untyped-call]
+    schema = generator.get_schema(request=None, public=True)  # type: ignore[no-untyped-call]
+
+    parameters = {
+        parameter["name"]: parameter for parameter in schema["paths"]["/api/game/games/"]["get"]["parameters"]
+    }
+    assert parameters["genres"]["schema"] == {"type": "array", "items": {"type": "string"}}
+    assert parameters["platforms_all"]["description"] == "All of the platforms"
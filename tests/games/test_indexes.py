@@ -0,0 +1,74 @@
+"""Tests for the indexes of the game related models, the queries of the API use them on the seeded data."""
+
+import re
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import QuerySet
+
+from my_game_list.games.models import Game, GameList, GameListStatus
+from my_game_list.users.models import User as UserModel
+
+User: type[UserModel] = get_user_model()
+
+GAMES_COUNT = 2000
+USERS_COUNT = 30
+GAMES_PER_USER = 200
+
+
+@pytest.fixture
+def seeded_game_lists() -> UserModel:
+    """Seed the games and the game lists of the users, returning one of the users."""
+    games = Game.objects.bulk_create(
+        Game(title=f"Game {number}", igdb_id=number, release_date=date(2000, 1, 1) + timedelta(days=number))
+        for number in range(GAMES_COUNT)
+    )
+    users = User.objects.bulk_create(
+        User(username=f"user{number}", email=f"user{number}@email.com") for number in range(USERS_COUNT)
+    )
+    statuses = list(GameListStatus)
+    GameList.objects.bulk_create(
+        GameList(game=game, user=user, status=statuses[number % len(statuses)])
+        for user in users
+        for number, game in enumerate(games[:GAMES_PER_USER])
+    )
+    return users[0]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="The plans are PostgreSQL specific.")
+@pytest.mark.parametrize(
+    ("index_name", "get_queryset"),
+    [
+        pytest.param(
+            "game_list_user_status_idx",
+            lambda user: GameList.objects.filter(user=user, status=GameListStatus.COMPLETED),
+            id="game lists of the user filtered by the status",
+        ),
+        pytest.param(
+            "game_list_user_modified_idx",
+            lambda user: GameList.objects.filter(user=user).order_by("last_modified_at")[:5],
+            id="latest game list updates of the user",
+        ),
+        pytest.param(
+            "game_release_date_idx",
+            lambda _: Game.objects.order_by("release_date")[:25],
+            id="games ordered by the release date",
+        ),
+    ],
+)
+def test_query_uses_index(
+    index_name: str,
+    get_queryset: Callable[[UserModel], QuerySet[Any]],
+    seeded_game_lists: UserModel,
+    index_query_plans: Callable[[QuerySet[Any]], tuple[str, str]],
+) -> None:
+    """Test that the query is planned with the scan of the index instead of the sequential scan without it."""
+    plan_without_index, plan = index_query_plans(get_queryset(seeded_game_lists))
+
+    assert "Seq Scan" in plan_without_index
+    assert re.search(rf"Index (?:Only )?Scan (?:Backward )?(?:using|on) {index_name}\b", plan)
@@ -0,0 +1,115 @@
+"""Tests for the IGDB import metrics."""
+
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+import requests
+from django.core.management import CommandError
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from prometheus_client import REGISTRY
+
+from my_game_list.games.management.commands._igdb_wrapper import IGDBEndpoints, IGDBWrapper
+from my_game_list.games.management.commands.import_data_from_igdb import Command
+from my_game_list.games.metrics import IGDBImportMetrics
+from my_game_list.games.models import Game, GameList, Genre
+from my_game_list.my_game_list.models import SlowQuery
+
+
+def _get_sample_value(name: str, labels: dict[str, str]) -> float:
+    """Get the current value of the sample, 0 if the sample does not exist yet."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_observe_response() -> None:
+    """Test that the response from IGDB is recorded in the metrics."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"[]"  # noqa: SLF001
+    response.elapsed = timedelta(milliseconds=300)
+    requests_labels = {"endpoint": "genres", "status_code": "200"}
+    requests_before = _get_sample_value("igdb_requests_total", requests_labels)
+    bytes_before = _get_sample_value("igdb_response_bytes_total", {"endpoint": "genres"})
+    latency_before = _get_sample_value("igdb_request_duration_seconds_sum", {"endpoint": "genres"})
+
+    IGDBWrapper._observe_response(IGDBEndpoints.GENRES, response)  # noqa: SLF001
+
+    assert _get_sample_value("igdb_requests_total", requests_labels) == requests_before + 1
+    assert _get_sample_value("igdb_response_bytes_total", {"endpoint": "genres"}) == bytes_before + 2
+    assert _get_sample_value("igdb_request_duration_seconds_sum", {"endpoint": "genres"}) == pytest.approx(
+        latency_before + 0.3,
+    )
+
+
+@pytest.mark.django_db()
+def test_bulk_create_records_inserted_and_skipped_rows() -> None:
+    """Test that the rows ignored because of the conflicts are recorded as skipped."""
+    existing_genre = baker.make(Genre, name="Existing", igdb_id=1)
+    inserted_labels = {"model": "Genre", "result": "inserted"}
+    skipped_labels = {"model": "Genre", "result": "skipped"}
+    inserted_before = _get_sample_value("igdb_import_rows_total", inserted_labels)
+    skipped_before = _get_sample_value("igdb_import_rows_total", skipped_labels)
+
+    with CaptureQueriesContext(connection) as context:
+        Command._bulk_create(  # noqa: SLF001
+            Genre.objects,
+            [Genre(name=existing_genre.name, igdb_id=existing_genre.igdb_id), Genre(name="New", igdb_id=2)],
+        )
+
+    assert not any("COUNT(" in query["sql"] for query in context.captured_queries)
+    assert Genre.objects.count() == 2  # noqa: PLR2004
+    assert _get_sample_value("igdb_import_rows_total", inserted_labels) == inserted_before + 1
+    assert _get_sample_value("igdb_import_rows_total", skipped_labels) == skipped_before + 1
+
+
+def test_write_to_textfile(tmp_path: Path) -> None:
+    """Test that only the import metrics are written to the textfile."""
+    textfile = tmp_path / "igdb_import.prom"
+    IGDBImportMetrics.requests_total.labels("games", "200").inc()
+
+    IGDBImportMetrics.write_to_textfile(textfile)
+
+    content = textfile.read_text()
+    assert "igdb_requests_total" in content
+    assert "igdb_import_stage_duration_seconds" in content
+    assert "process_" not in content
+
+
+@pytest.mark.django_db()
+def test_bulk_create_records_inserted_relations() -> None:
+    """Test that the relations of the through table are counted by their unique relation."""
+    game = baker.make(Game)
+    genres = baker.make(Genre, _quantity=2)
+    game.genres.add(genres[0])
+    inserted_labels = {"model": "Game_genres", "result": "inserted"}
+    inserted_before = _get_sample_value("igdb_import_rows_total", inserted_labels)
+
+    Command._bulk_create(  # noqa: SLF001
+        Game.genres.through.objects,
+        [Game.genres.through(game_id=game.id, genre_id=genre.id) for genre in genres],
+    )
+
+    assert game.genres.count() == 2  # noqa: PLR2004
+    assert _get_sample_value("igdb_import_rows_total", inserted_labels) == inserted_before + 1
+
+
+@pytest.mark.parametrize(
+    ("model", "key_fields"),
+    [
+        pytest.param(Game, ("igdb_id",), id="IGDB ID."),
+        pytest.param(Game.genres.through, ("game_id", "genre_id"), id="Unique relation of the through table."),
+        pytest.param(GameList, ("game_id", "user_id"), id="Unique constraint."),
+    ],
+)
+def test_get_key_fields(model: type[Model], key_fields: tuple[str, ...]) -> None:
+    """Test that the imported rows are identified by the IGDB ID or by the unique key."""
+    assert Command._get_key_fields(model) == key_fields  # noqa: SLF001
+
+
+def test_get_key_fields_without_unique_key() -> None:
+    """Test that the model without the IGDB ID and any unique key can not be imported."""
+    with pytest.raises(CommandError, match="SlowQuery"):
+        Command._get_key_fields(SlowQuery)  # noqa: SLF001
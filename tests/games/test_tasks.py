@@ -0,0 +1,82 @@
+"""Tests for the Celery tasks of the game application."""
+
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from freezegun import freeze_time
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from my_game_list.games.models import Game, GameListStatus
+from my_game_list.games.stats import get_game_statistics
+from my_game_list.games.tasks import IGDB_SYNC_ITEMS, rebuild_game_statistics, sync_igdb_data
+
+
+@pytest.mark.django_db()
+def test_rebuild_game_statistics() -> None:
+    """Test that the statistics of all games are rebuilt into the cache."""
+    cache.clear()
+    popular_game, rated_game = baker.make(Game, _quantity=2)
+    baker.make("games.GameList", game=popular_game, status=GameListStatus.PLAN_TO_PLAY, _quantity=2)
+    baker.make("games.GameList", game=rated_game, status=GameListStatus.COMPLETED, score=8)
+    assert get_game_statistics(rated_game.id) is None
+
+    assert rebuild_game_statistics.delay().get() == 2  # noqa: PLR2004
+
+    rated_statistics = get_game_statistics(rated_game.id)
+    popular_statistics = get_game_statistics(popular_game.id)
+    assert rated_statistics is not None
+    assert popular_statistics is not None
+    assert rated_statistics["average_score"] == 8  # noqa: PLR2004
+    assert rated_statistics["rank_position"] == 1
+    assert rated_statistics["scores_count"] == 1
+    assert popular_statistics["members_count"] == 2  # noqa: PLR2004
+    assert popular_statistics["popularity"] == 1
+    cache.clear()
+
+
+@pytest.mark.django_db()
+def test_game_detail_reads_rebuilt_statistics(authenticated_api_client: APIClient) -> None:
+    """Test that the game detail has the rank position and popularity relative to all games, once they are rebuilt.
+
+    The average score and the counts of the game are calculated by the request, so they are up to date.
+    """
+    popular_game, rated_game = baker.make(Game, _quantity=2)
+    baker.make("games.GameList", game=popular_game, status=GameListStatus.PLAN_TO_PLAY, _quantity=2)
+    baker.make("games.GameList", game=rated_game, status=GameListStatus.COMPLETED, score=8)
+    rebuild_game_statistics.delay()
+    baker.make("games.GameList", game=rated_game, status=GameListStatus.COMPLETED, score=6)
+
+    response = authenticated_api_client.get(reverse("games:games-detail", (rated_game.id,)))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["rank_position"] == 1
+    assert response.data["popularity"] == 2  # noqa: PLR2004
+    assert response.data["average_score"] == 7  # noqa: PLR2004
+    assert response.data["scores_count"] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_GAME_STATISTICS_REBUILD_MINUTES=10)
+def test_rebuilt_statistics_expire() -> None:
+    """Test that the statistics expire after two rebuild intervals, when they are not rebuilt."""
+    game = baker.make(Game)
+    with freeze_time("2026-10-19 12:00:00") as frozen_time:
+        rebuild_game_statistics.delay()
+        frozen_time.tick(timedelta(minutes=19))
+        assert get_game_statistics(game.id) is not None
+        frozen_time.tick(timedelta(minutes=2))
+        assert get_game_statistics(game.id) is None
+
+
+def test_sync_igdb_data() -> None:
+    """Test that the IGDB data are imported by the command, the dictionaries first."""
+    with mock.patch("my_game_list.games.tasks.call_command") as call_command_mock:
+        sync_igdb_data.delay()
+
+    call_command_mock.assert_called_once_with("import_data_from_igdb", *IGDB_SYNC_ITEMS)
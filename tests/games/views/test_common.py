@@ -203,6 +203,7 @@ def test_unauthorized_access_detail(viewname: str, api_client: APIClient) -> Non
             "game_list_fixture",
             {
                 "count": 1,
+                "count_estimated": False,
                 "next": None,
                 "previous": None,
                 "results": [
@@ -228,6 +229,7 @@ def test_unauthorized_access_detail(viewname: str, api_client: APIClient) -> Non
             "game_review_fixture",
             {
                 "count": 1,
+                "count_estimated": False,
                 "next": None,
                 "previous": None,
                 "results": [
@@ -248,6 +250,7 @@ def test_unauthorized_access_detail(viewname: str, api_client: APIClient) -> Non
             "game_fixture",
             {
                 "count": 1,
+                "count_estimated": False,
                 "next": None,
                 "previous": None,
                 "results": [
@@ -0,0 +1,146 @@
+"""Tests for the base admin models."""
+
+import pytest
+from django.contrib import admin
+from django.db import connection
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+
+from my_game_list.games.models import Game
+from my_game_list.my_game_list.admin import get_search_terms
+from my_game_list.users.admin import UserAdmin
+from my_game_list.users.models import User
+
+GAME_CHANGELIST_URL = reverse("admin:games_game_changelist")
+
+
+def test_get_search_terms() -> None:
+    """Test that the quoted terms keep their spaces."""
+    assert get_search_terms("shooter \"tactical shooter\" 'PC'") == ["shooter", "tactical shooter", "PC"]
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("search_term", "titles"),
+    [
+        pytest.param("shooter", ["Borderlands", "Counter-Strike"], id="Genre matched by two genres of the game."),
+        pytest.param("puzzle console", ["Tetris"], id="Every term matched by any field."),
+        pytest.param("skyrim", ["Skyrim"], id="Title."),
+        pytest.param('"tactical shooter"', ["Counter-Strike"], id="Quoted term."),
+        pytest.param("racing", [], id="Nothing matched."),
+    ],
+)
+@pytest.mark.usefixtures("games_fixture")
+def test_game_admin_search(search_term: str, titles: list[str], admin_client: Client) -> None:
+    """Test that the games are searched by the many-to-many relations without the joins and the duplicates."""
+    with CaptureQueriesContext(connection) as context:
+        response = admin_client.get(GAME_CHANGELIST_URL, {"q": search_term})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sorted(game.title for game in response.context["cl"].result_list) == titles
+    assert not any("DISTINCT" in query["sql"] for query in context.captured_queries)
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_game_admin_changelist_counts_once(admin_client: Client) -> None:
+    """Test that the changelist does not count all the games besides the count of the filtered games."""
+    with CaptureQueriesContext(connection) as context:
+        response = admin_client.get(GAME_CHANGELIST_URL, {"q": "pc"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.context["cl"].result_count == 2  # noqa: PLR2004
+    assert response.context["cl"].full_result_count is None
+    assert sum("COUNT(" in query["sql"] for query in context.captured_queries) == 1
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    "model_name",
+    [
+        "games_gamelist",
+        "games_gamereview",
+        "games_gamefollow",
+        "users_user",
+        "friendships_friendship",
+        "friendships_friendshiprequest",
+    ],
+)
+def test_performance_admin_changelist(model_name: str, admin_client: Client) -> None:
+    """Test that the changelists of the large tables are searched without the full count."""
+    response = admin_client.get(reverse(f"admin:{model_name}_changelist"), {"q": "test"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.context["cl"].full_result_count is None
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_game_admin_search_by_id(admin_client: Client) -> None:
+    """Test that the games are searched by the exact ID and IGDB ID, the term containing the ID does not match."""
+    game = Game.objects.get(title="Skyrim")
+    Game.objects.filter(pk=game.pk).update(igdb_id=987654)
+
+    def search(term: str | int) -> list[str]:
+        return [item.title for item in admin_client.get(GAME_CHANGELIST_URL, {"q": term}).context["cl"].result_list]
+
+    assert search(game.pk) == ["Skyrim"]
+    assert search("987654") == ["Skyrim"]
+    assert not search("98765")
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("search_field", "term", "expected_lookup"),
+    [
+        pytest.param("username", "test", "username__icontains", id="Contained text."),
+        pytest.param("^username", "test", "username__istartswith", id="Text starting with the term."),
+        pytest.param("=username", "test", "username__iexact", id="Exact text."),
+        pytest.param("=id", "12", "id", id="Exact number."),
+        pytest.param("@username", "test", "username__search", id="Full-text search."),
+    ],
+)
+def test_search_condition(search_field: str, term: str, expected_lookup: str) -> None:
+    """Test that the search condition honors the prefix of the search field."""
+    condition = UserAdmin(User, admin.site).get_search_condition(search_field, term)
+
+    assert condition is not None
+    assert [lookup for lookup, _ in condition.children] == [expected_lookup]  # type: ignore[misc]
+
+
+def test_search_condition_invalid_value() -> None:
+    """Test that the field searched by the exact value is skipped, when the term is not its valid value."""
+    assert UserAdmin(User, admin.site).get_search_condition("=id", "test") is None
+
+
+@pytest.mark.django_db()
+def test_search_without_any_valid_condition(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the term not matching any search field finds nothing, instead of everything."""
+    baker.make(User)
+    user_admin = UserAdmin(User, admin.site)
+    monkeypatch.setattr(user_admin, "search_fields", ("=id",))
+
+    queryset, _ = user_admin.get_search_results(RequestFactory().get("/"), User.objects.all(), "test")
+
+    assert not queryset.exists()
+
+
+@pytest.mark.django_db()
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="The trigram indexes are PostgreSQL specific.")
+def test_user_admin_search_uses_indexes() -> None:
+    """Test that the admin search of the users combines the primary key and the trigram indexes by `BitmapOr`."""
+    User.objects.bulk_create(User(username=f"user{index}", email=f"user{index}@email.com") for index in range(1000))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE users_user")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    queryset, _ = UserAdmin(User, admin.site).get_search_results(RequestFactory().get("/"), User.objects.all(), "99")
+    plan = queryset.explain()
+
+    assert "BitmapOr" in plan
+    assert "users_user_pkey" in plan
+    assert "user_username_trgm_idx" in plan
+    assert "user_email_trgm_idx" in plan
@@ -0,0 +1,109 @@
+"""Tests for the compiled read-only serialization of the list endpoints."""
+
+from typing import Any
+from unittest.mock import ANY, patch
+
+import pytest
+from django.db.models import QuerySet
+from model_bakery import baker
+from rest_framework import serializers, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from my_game_list.games.models import Company, Game, GameList, GameListStatus, Genre
+from my_game_list.games.serializers import CompanySerializer, GameListSerializer, GameSerializer, GenreSerializer
+from my_game_list.games.views import GameListViewSet, GameViewSet
+from my_game_list.my_game_list.compiled import CompiledListSerializer, get_values_fields
+from my_game_list.users.models import User as UserModel
+
+
+def render(data: Any) -> bytes:  # noqa: ANN401
+    """Render the data to JSON as by the API."""
+    content: bytes = JSONRenderer().render(data)
+    return content
+
+
+@pytest.mark.django_db()
+def test_compiled_game_serializer(games_fixture: list[Game]) -> None:
+    """Test that the compiled games serializer renders the same JSON as the games serializer."""
+    items = list(GameViewSet.queryset.order_by("id"))
+
+    data = CompiledListSerializer(items, child=GameSerializer()).data
+
+    assert len(data) == len(games_fixture)
+    assert render(data) == render(GameSerializer(items, many=True).data)
+
+
+@pytest.mark.django_db()
+def test_compiled_game_list_serializer(games_fixture: list[Game], user_fixture: UserModel) -> None:
+    """Test that the compiled game lists serializer renders the same JSON as the game lists serializer."""
+    for game in games_fixture:
+        baker.make(GameList, game=game, user=user_fixture, status=GameListStatus.PLAYING, make_m2m=True)
+    items = list(GameListViewSet.queryset.order_by("id"))
+
+    data = CompiledListSerializer(items, child=GameListSerializer()).data
+
+    assert data[0]["status"] == GameListStatus.PLAYING.label
+    assert data[0]["user"] == user_fixture.id
+    assert render(data) == render(GameListSerializer(items, many=True).data)
+
+
+@pytest.mark.parametrize(
+    ("serializer_class", "queryset"),
+    [
+        pytest.param(CompanySerializer, Company.objects.order_by("id"), id="Companies."),
+        pytest.param(GenreSerializer, Genre.objects.order_by("id"), id="Genres."),
+    ],
+)
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_compiled_values_serializer(
+    serializer_class: type[serializers.ModelSerializer[Any]],
+    queryset: QuerySet[Any],
+) -> None:
+    """Test that the rows of the `values()` render the same JSON as the serialized model instances."""
+    fields = get_values_fields(serializer_class())
+    assert fields is not None
+
+    data = CompiledListSerializer(list(queryset.values(*fields)), child=serializer_class()).data
+
+    assert render(data) == render(serializer_class(queryset, many=True).data)
+
+
+def test_values_fields_of_nested_serializer() -> None:
+    """Test that the serializer with the nested serializers does not serialize the rows of `values()`."""
+    assert get_values_fields(GenreSerializer()) == ("id", "name", "igdb_id")
+    assert get_values_fields(GameSerializer()) is None
+
+
+def test_compiled_serializer_skipped_field() -> None:
+    """Test that the field without the attribute falls back to its `get_attribute`, as by the serializer."""
+
+    class CompanyDefaultSerializer(serializers.ModelSerializer[Company]):
+        logo = serializers.CharField(source="publisher.company_logo_id", default="none")
+        year = serializers.IntegerField(source="missing", required=False)
+
+        class Meta:
+            model = Company
+            fields = ("id", "logo", "year")
+
+    company = Company(id=1)
+
+    data = CompiledListSerializer([company], child=CompanyDefaultSerializer()).data
+
+    assert data == [{"id": 1, "logo": "none"}]
+    assert render(data) == render(CompanyDefaultSerializer([company], many=True).data)
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("games_fixture")
+def test_dictionary_list_serializes_values(authenticated_api_client: APIClient) -> None:
+    """Test that the list of the dictionary serializes the rows of `values()` instead of the model instances."""
+    with patch.object(CompiledListSerializer, "compile", wraps=CompiledListSerializer.compile) as compile_mock:
+        response = authenticated_api_client.get(reverse("games:genres-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == Genre.objects.count()
+    compile_mock.assert_called_once_with(ANY, values=True)
+    assert render(response.json()["results"]) == render(GenreSerializer(Genre.objects.all(), many=True).data)
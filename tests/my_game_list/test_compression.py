@@ -0,0 +1,48 @@
+"""Tests for the negotiation and the compression of the response content."""
+
+import gzip
+from collections.abc import Callable
+
+import brotli
+import pytest
+
+from my_game_list.my_game_list.compression import compress, get_accepted_encoding, parse_accept_encoding
+
+
+def test_parse_accept_encoding() -> None:
+    """Test that the encodings are parsed with their quality values."""
+    assert parse_accept_encoding("gzip;q=0.5, BR , deflate;q=invalid, ") == {"gzip": 0.5, "br": 1.0, "deflate": 0.0}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        pytest.param("", None, id="No encoding accepted."),
+        pytest.param("identity", None, id="Identity only."),
+        pytest.param("gzip, deflate, br", "br", id="Brotli preferred on the equal quality."),
+        pytest.param("br;q=0.1, gzip;q=0.9", "gzip", id="Higher quality."),
+        pytest.param("*", "br", id="Any encoding."),
+        pytest.param("*, br;q=0", "gzip", id="Any encoding except brotli."),
+        pytest.param("deflate", None, id="Unsupported encoding."),
+    ],
+)
+def test_get_accepted_encoding(accept_encoding: str, encoding: str | None) -> None:
+    """Test the negotiation of the encoding of the response."""
+    assert get_accepted_encoding(accept_encoding) == encoding
+
+
+@pytest.mark.parametrize(
+    ("encoding", "decompress"),
+    [
+        pytest.param("br", brotli.decompress, id="Brotli."),
+        pytest.param("gzip", gzip.decompress, id="Gzip."),
+    ],
+)
+def test_compress(encoding: str, decompress: Callable[[bytes], bytes]) -> None:
+    """Test that the compressed content is decompressed to the original content."""
+    content = b'{"results": []}' * 100
+
+    compressed = compress(content, encoding)
+
+    assert len(compressed) < len(content)
+    assert decompress(compressed) == content
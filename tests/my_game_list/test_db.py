@@ -0,0 +1,233 @@
+"""Tests for the database related helpers."""
+
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.test import override_settings
+
+from my_game_list.games.models import Game, Genre
+from my_game_list.my_game_list.db import (
+    PrimaryReplicaRouter,
+    SlowQueryEntry,
+    SlowQueryLog,
+    fingerprint_sql,
+    get_estimated_count,
+    is_explainable,
+    is_unfiltered,
+    read_from_replicas,
+)
+from my_game_list.my_game_list.models import SlowQuery
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected_fingerprint"),
+    [
+        pytest.param(
+            'SELECT "games_game"."id" FROM "games_game" WHERE "games_game"."id" = %s LIMIT 21',
+            'SELECT "games_game"."id" FROM "games_game" WHERE "games_game"."id" = ? LIMIT ?',
+            id="Placeholders and numbers are replaced.",
+        ),
+        pytest.param(
+            "SELECT * FROM games_genre WHERE name = 'Shooter' OR name = 'It''s'",
+            "SELECT * FROM games_genre WHERE name = ? OR name = ?",
+            id="String literals are replaced.",
+        ),
+        pytest.param(
+            "SELECT * FROM games_genre WHERE id IN (%s, %s,\n %s)",
+            "SELECT * FROM games_genre WHERE id IN (...)",
+            id="Lists of placeholders are collapsed.",
+        ),
+    ],
+)
+def test_fingerprint_sql(sql: str, expected_fingerprint: str) -> None:
+    """Test the normalization of the SQL queries."""
+    assert fingerprint_sql(sql) == expected_fingerprint
+
+
+def test_fingerprint_sql_same_for_different_parameters() -> None:
+    """Test that the queries differing only in the parameters have the same fingerprint."""
+    assert fingerprint_sql("SELECT 1 FROM t WHERE id IN (%s, %s)") == fingerprint_sql(
+        "SELECT 1 FROM t WHERE id IN (%s, %s, %s, %s)",
+    )
+
+
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        pytest.param('SELECT "games_game"."id" FROM "games_game"', True, id="Select is explainable."),
+        pytest.param('UPDATE "games_game" SET "title" = %s', False, id="Update is not explainable."),
+        pytest.param("SELECT * FROM games_game FOR UPDATE", False, id="Select for update is not explainable."),
+        pytest.param("SELECT * FROM games_game FOR NO KEY UPDATE", False, id="Select for no key update."),
+        pytest.param("SELECT * FROM games_game FOR KEY  SHARE", False, id="Select for key share."),
+        pytest.param("SELECT * FROM games_game for share", False, id="Lowercase select for share."),
+        pytest.param("SELECT 'FORUPDATE' FROM games_game", True, id="Select without the row lock."),
+    ],
+)
+def test_is_explainable(sql: str, *, expected: bool) -> None:
+    """Test that only the queries without side effects are run with `EXPLAIN ANALYZE`."""
+    assert is_explainable(sql) is expected
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_SLOW_QUERY_LOG_SIZE=2)
+def test_slow_query_log_record_is_bounded() -> None:
+    """Test that the slow query log keeps only the most recent queries."""
+    log = SlowQueryLog()
+    for duration in (1.0, 2.0, 3.0):
+        log.record(
+            SlowQueryEntry(
+                sql="SELECT * FROM games_game WHERE id = %s",
+                params=(1,),
+                duration=duration,
+                view_name="games:games-list",
+                using="default",
+            ),
+        )
+
+    assert list(SlowQuery.objects.values_list("duration", flat=True)) == [3.0, 2.0]
+    slow_query = SlowQuery.objects.first()
+    assert slow_query is not None
+    assert slow_query.fingerprint == "SELECT * FROM games_game WHERE id = ?"
+    assert slow_query.params == "(1,)"
+    # Only the frames from the application code are included in the stack summary
+    assert slow_query.stack == ""
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("sql", "params"),
+    [
+        pytest.param('INSERT INTO "users_user" ("password", "email") VALUES (%s, %s)', "", id="Insert."),
+        pytest.param('UPDATE "users_user" SET "password" = %s WHERE "id" = %s', "", id="Update."),
+        pytest.param('SELECT "id" FROM "users_user" WHERE "email" = %s', "('hash', 'user@email.com')", id="Select."),
+    ],
+)
+def test_slow_query_log_record_params(sql: str, params: str) -> None:
+    """Test that only the parameters of the `SELECT` queries are stored, the writes would store the written values."""
+    SlowQueryLog().record(
+        SlowQueryEntry(
+            sql=sql,
+            params=("hash", "user@email.com"),
+            duration=1.0,
+            view_name="users:user-detail",
+            using="default",
+        ),
+    )
+
+    assert SlowQuery.objects.get().params == params
+
+
+@override_settings(MGL_SLOW_QUERY_EXPLAIN_SAMPLE_RATE=1.0)
+def test_slow_query_log_capture_samples_explain() -> None:
+    """Test that the captured query is queued for the background thread with the explain flag."""
+    log = SlowQueryLog()
+    entry = SlowQueryEntry(sql="SELECT 1", params=None, duration=1.0, view_name="view", using="default")
+    with mock.patch.object(log, "_ensure_worker_started") as ensure_worker_started_mock:
+        log.capture(entry)
+
+    ensure_worker_started_mock.assert_called_once()
+    assert log._queue.get_nowait() is entry  # noqa: SLF001
+    assert entry.explain is True
+
+
+@pytest.mark.django_db()
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN (ANALYZE, BUFFERS) is PostgreSQL specific.")
+def test_slow_query_log_explain() -> None:
+    """Test that the query plan is stored for the sampled slow query."""
+    entry = SlowQueryEntry(
+        sql='SELECT "games_game"."id" FROM "games_game" WHERE "games_game"."id" = %s',
+        params=(1,),
+        duration=1.0,
+        view_name="games:games-detail",
+        using="default",
+        explain=True,
+    )
+    SlowQueryLog().record(entry)
+
+    slow_query = SlowQuery.objects.get()
+    assert "actual time" in slow_query.explain
+    assert "Buffers" in slow_query.explain or "Planning" in slow_query.explain
+
+
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_router_reads_from_primary_outside_of_replica_context() -> None:
+    """Test that the reads outside of the requests (e.g. in the management commands) go to the primary."""
+    assert PrimaryReplicaRouter().db_for_read(Genre) == "default"
+
+
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_router_reads_from_primary_after_write() -> None:
+    """Test that the reads go to the replica until the context writes."""
+    router = PrimaryReplicaRouter()
+
+    with read_from_replicas() as routing:
+        assert router.db_for_read(Genre) == "replica"
+        assert router.db_for_write(Genre) == "default"
+        assert router.db_for_read(Genre) == "default"
+
+    assert routing.wrote
+
+
+@pytest.mark.parametrize(
+    ("replicas", "enabled"),
+    [
+        pytest.param([], True, id="No replicas configured."),
+        pytest.param(["replica"], False, id="Context pinned to the primary."),
+    ],
+)
+def test_router_reads_from_primary(replicas: list[str], *, enabled: bool) -> None:
+    """Test that the reads go to the primary when the replicas are not used."""
+    with override_settings(MGL_DB_REPLICAS=replicas), read_from_replicas(enabled=enabled):
+        assert PrimaryReplicaRouter().db_for_read(Genre) == "default"
+
+
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_router_does_not_migrate_replicas() -> None:
+    """Test that the migrations are run only on the primary."""
+    router = PrimaryReplicaRouter()
+
+    assert router.allow_migrate("default", "games")
+    assert not router.allow_migrate("replica", "games")
+
+
+def test_is_unfiltered() -> None:
+    """Test that only the queryset of every row of the table is unfiltered, the annotations do not filter rows."""
+    assert is_unfiltered(Game.objects.all().with_rank_position().select_related("publisher").query)
+    assert not is_unfiltered(Game.objects.filter(title="Game").query)
+    assert not is_unfiltered(Game.objects.filter(genres__name="Shooter").distinct().query)
+    assert not is_unfiltered(Game.objects.values("publisher").annotate(Count("id")).query)
+    assert not is_unfiltered(Game.objects.all()[:10].query)
+
+
+@pytest.mark.django_db()
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="The count is estimated on PostgreSQL.")
+def test_estimated_count_not_postgresql() -> None:
+    """Test that the count is not estimated by the other databases."""
+    assert get_estimated_count(Genre.objects.all()) is None
+
+
+@pytest.mark.django_db()
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="The planner estimates are PostgreSQL specific.")
+def test_estimated_count() -> None:
+    """Test that only the count of the unfiltered query is estimated, by the statistics of the table."""
+    Genre.objects.bulk_create(Genre(name=f"Genre {index}") for index in range(100))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE games_genre")
+
+    assert get_estimated_count(Genre.objects.all()) == 100  # noqa: PLR2004
+    assert get_estimated_count(Genre.objects.filter(name__startswith="Genre")) is None
+    assert get_estimated_count(Genre.objects.all()[:10]) is None
+
+
+@pytest.mark.django_db()
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="The trigram indexes are PostgreSQL specific.")
+def test_trigram_index_used_by_icontains() -> None:
+    """Test that the `icontains` lookup is planned with the trigram index."""
+    Game.objects.bulk_create(Game(title=f"Game {index}", igdb_id=index) for index in range(1000))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE games_game")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    assert "game_title_trgm_idx" in Game.objects.filter(title__icontains="game 99").explain()
@@ -0,0 +1,159 @@
+"""Tests for the logging handlers, filters and formatters."""
+
+import json
+import logging
+import queue
+import sys
+from unittest import mock
+
+import pytest
+
+from my_game_list.my_game_list.log import (
+    JSONFormatter,
+    QueueListenerHandler,
+    SamplingFilter,
+    parse_sampling_rates,
+    start_queue_listeners,
+    stop_queue_listeners,
+)
+
+
+def _make_record(name: str = "test", level: int = logging.INFO) -> logging.LogRecord:
+    """Make a log record with the message arguments."""
+    return logging.LogRecord(name, level, __file__, 1, "Hello %s", ("world",), None)
+
+
+class _ListHandler(logging.Handler):
+    """Handler collecting the handled records."""
+
+    def __init__(self: "_ListHandler") -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self: "_ListHandler", record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_json_formatter() -> None:
+    """Test that the record is formatted as a single line JSON with the extra attributes."""
+    record = _make_record()
+    record.duration = 0.5
+
+    data = json.loads(JSONFormatter().format(record))
+
+    assert data["level"] == "INFO"
+    assert data["logger"] == "test"
+    assert data["message"] == "Hello world"
+    assert data["duration"] == 0.5  # noqa: PLR2004
+    assert "args" not in data
+
+
+def test_json_formatter_exception() -> None:
+    """Test that the exception is formatted into the JSON."""
+    try:
+        raise RuntimeError("Boom")  # noqa: TRY301, EM101
+    except RuntimeError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "Failed", None, exc_info=sys.exc_info())
+
+    output = JSONFormatter().format(record)
+
+    assert "\n" not in output
+    assert "RuntimeError: Boom" in json.loads(output)["exc_info"]
+
+
+def test_parse_sampling_rates() -> None:
+    """Test the parsing of the sample rates."""
+    assert parse_sampling_rates("django.db.backends=0.1, django.request=0.5,") == {
+        "django.db.backends": 0.1,
+        "django.request": 0.5,
+    }
+
+
+@pytest.mark.parametrize(
+    ("logger_name", "expected_rate"),
+    [
+        pytest.param("django.db.backends", 0.1, id="Parent logger rate is used."),
+        pytest.param("django.db.backends.schema", 1.0, id="The most specific logger rate is used."),
+        pytest.param("django.request", 1.0, id="Not sampled logger."),
+    ],
+)
+def test_sampling_filter_rate(logger_name: str, expected_rate: float) -> None:
+    """Test that the rate of the most specific logger is used."""
+    sampling_filter = SamplingFilter({"django.db": 0.1, "django.db.backends.schema": 1.0})
+
+    assert sampling_filter.get_rate(logger_name) == expected_rate
+
+
+def test_sampling_filter() -> None:
+    """Test that only the records below WARNING are sampled."""
+    sampling_filter = SamplingFilter("django.db.backends=0.1")
+
+    with mock.patch("my_game_list.my_game_list.log.random.random", return_value=0.5):
+        assert not sampling_filter.filter(_make_record("django.db.backends"))
+        assert sampling_filter.filter(_make_record("django.db.backends", logging.WARNING))
+        assert sampling_filter.filter(_make_record("django.request"))
+
+
+def test_queue_listener_handler() -> None:
+    """Test that the records are handled by the target handlers with the merged message arguments."""
+    target_handler = _ListHandler()
+    handler = QueueListenerHandler([target_handler])
+
+    handler.handle(_make_record())
+    handler.start_listener()
+    handler.stop_listener()
+
+    assert [record.getMessage() for record in target_handler.records] == ["Hello world"]
+    assert target_handler.records[0].args is None
+
+
+def test_queue_listener_handler_drops_records_when_full() -> None:
+    """Test that the records exceeding the queue are dropped and their number is reported."""
+    target_handler = _ListHandler()
+    handler = QueueListenerHandler([target_handler], queue_size=1)
+
+    handler.handle(_make_record())
+    handler.handle(_make_record())
+    handler.handle(_make_record())
+    assert handler.dropped == 2  # noqa: PLR2004
+
+    assert isinstance(handler.queue, queue.Queue)
+    handler.queue.get_nowait()
+    handler.handle(_make_record())
+
+    assert "Dropped 2 log records" in handler.queue.get_nowait().getMessage()
+    assert handler.dropped == 1
+
+
+def test_queue_listener_handler_not_configured_target() -> None:
+    """Test that the listener cannot be started when its targets are not configured handlers."""
+    handler = QueueListenerHandler(["cfg://handlers.file"])
+
+    with pytest.raises(TypeError, match="not a configured handler"):
+        handler.start_listener()
+    handler.close()
+
+
+def test_start_and_stop_queue_listeners() -> None:
+    """Test that the listeners of the queue handlers are started and stopped together."""
+    target_handler = _ListHandler()
+    handler = QueueListenerHandler([target_handler])
+
+    start_queue_listeners()
+    assert handler.listener is not None
+    handler.handle(_make_record())
+    stop_queue_listeners()
+
+    assert handler.listener is None
+    assert [record.getMessage() for record in target_handler.records] == ["Hello world"]
+
+
+def test_queue_listener_handler_close() -> None:
+    """Test that the closed handler stops its listener and is not started again."""
+    handler = QueueListenerHandler([_ListHandler()])
+    handler.start_listener()
+
+    handler.close()
+    start_queue_listeners()
+
+    assert handler.listener is None
@@ -0,0 +1,97 @@
+"""Tests for the custom Prometheus metrics."""
+
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from prometheus_client import REGISTRY
+
+from my_game_list.my_game_list.metrics import SystemMetricsSampler
+
+
+@pytest.fixture
+def sampler_reset() -> Iterator[None]:
+    """Stop the sampler started by the test and forget it."""
+    yield
+    if SystemMetricsSampler._instance is not None:  # noqa: SLF001
+        SystemMetricsSampler._instance.stop()  # noqa: SLF001
+        SystemMetricsSampler._instance.join()  # noqa: SLF001
+    SystemMetricsSampler._instance = None  # noqa: SLF001
+
+
+class _FakeConnections:
+    """The database connections handler with a connection pool of the `default` database."""
+
+    def __init__(self: "_FakeConnections", pool: mock.Mock) -> None:
+        self.settings = {"default": {"OPTIONS": {"pool": {"max_size": 4}}}, "other": {"OPTIONS": {}}}
+        self.connection = SimpleNamespace(pool=pool)
+
+    def __iter__(self: "_FakeConnections") -> Iterator[str]:
+        return iter(self.settings)
+
+    def __getitem__(self: "_FakeConnections", alias: str) -> SimpleNamespace:
+        assert alias == "default"
+        return self.connection
+
+
+def test_sample_sets_system_metrics() -> None:
+    """Test that the sampler sets the CPU and memory usage metrics."""
+    with (
+        mock.patch("psutil.cpu_percent", return_value=12.5),
+        mock.patch("psutil.virtual_memory", return_value=SimpleNamespace(percent=42.0)),
+        mock.patch("psutil.Process", return_value=mock.Mock(**{"memory_full_info.return_value.uss": 1024})),
+    ):
+        SystemMetricsSampler.sample()
+
+    assert REGISTRY.get_sample_value("cpu_usage_percent") == 12.5  # noqa: PLR2004
+    assert REGISTRY.get_sample_value("memory_usage_percent") == 42.0  # noqa: PLR2004
+    assert REGISTRY.get_sample_value("worker_unique_memory_bytes") == 1024  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("sampler_reset")
+@override_settings(MGL_SYSTEM_METRICS_INTERVAL=60)
+def test_ensure_started_starts_single_sampler() -> None:
+    """Test that only one sampler is running in the process."""
+    SystemMetricsSampler.ensure_started()
+    sampler = SystemMetricsSampler._instance  # noqa: SLF001
+    SystemMetricsSampler.ensure_started()
+
+    assert sampler is not None
+    assert sampler.is_alive()
+    assert SystemMetricsSampler._instance is sampler  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("sampler_reset")
+@override_settings(MGL_SYSTEM_METRICS_INTERVAL=0)
+def test_ensure_started_disabled() -> None:
+    """Test that the sampler is not started when the sampling is disabled."""
+    SystemMetricsSampler._instance = None  # noqa: SLF001
+    SystemMetricsSampler.ensure_started()
+
+    assert SystemMetricsSampler._instance is None  # noqa: SLF001
+
+
+def test_sample_database_pools() -> None:
+    """Test that the pool measures are set and the popped pool counters are added to the metrics."""
+    pool = mock.Mock()
+    pool.pop_stats.return_value = {
+        "pool_size": 4,
+        "pool_available": 1,
+        "requests_waiting": 2,
+        "requests_num": 10,
+        "requests_wait_ms": 1500,
+        "requests_errors": 1,
+    }
+    labels = {"alias": "default"}
+    wait_before = REGISTRY.get_sample_value("django_db_pool_wait_seconds_total", labels) or 0
+
+    with mock.patch("my_game_list.my_game_list.metrics.connections", _FakeConnections(pool)):
+        SystemMetricsSampler.sample_database_pools()
+
+    assert REGISTRY.get_sample_value("django_db_pool_size", labels) == 4  # noqa: PLR2004
+    assert REGISTRY.get_sample_value("django_db_pool_connections_in_use", labels) == 3  # noqa: PLR2004
+    assert REGISTRY.get_sample_value("django_db_pool_requests_waiting", labels) == 2  # noqa: PLR2004
+    assert REGISTRY.get_sample_value("django_db_pool_wait_seconds_total", labels) == wait_before + 1.5
+    assert REGISTRY.get_sample_value("django_db_pool_connections_opened_total", labels) is not None
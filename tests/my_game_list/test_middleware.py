@@ -0,0 +1,306 @@
+"""Tests for the custom middlewares."""
+
+import gzip
+import logging
+from pathlib import Path
+from unittest import mock
+
+import brotli
+import pytest
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from prometheus_client import REGISTRY
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from my_game_list.games.models import Genre
+from my_game_list.users.models import User as UserModel
+
+
+def _profile(api_client: APIClient, user: UserModel, profile: str = "1") -> HttpResponse:
+    """Send the request with the `X-Profile` header, authenticated with the JWT token of the user."""
+    return api_client.get(
+        reverse("games:genres-list"),
+        HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}",
+        HTTP_X_PROFILE=profile,
+    )
+
+
+@pytest.mark.django_db()
+def test_database_metrics_are_labelled_by_view(authenticated_api_client: APIClient) -> None:
+    """Test that the number of queries and the database time are recorded for the resolved view."""
+    labels = {"view": "games:genres-list", "method": "GET"}
+    requests_before = REGISTRY.get_sample_value("django_http_db_queries_by_view_method_count", labels) or 0.0
+    queries_before = REGISTRY.get_sample_value("django_http_db_queries_by_view_method_sum", labels) or 0.0
+
+    authenticated_api_client.get(reverse("games:genres-list"))
+
+    assert REGISTRY.get_sample_value("django_http_db_queries_by_view_method_count", labels) == requests_before + 1
+    assert (REGISTRY.get_sample_value("django_http_db_queries_by_view_method_sum", labels) or 0.0) > queries_before
+    assert REGISTRY.get_sample_value("django_http_db_duration_seconds_by_view_method_count", labels) is not None
+
+
+@pytest.mark.django_db()
+def test_expensive_request_is_logged(authenticated_api_client: APIClient, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the request exceeding the query count threshold is logged with the SQL fingerprints."""
+    with (
+        override_settings(MGL_DB_HIGH_QUERY_COUNT_THRESHOLD=1),
+        caplog.at_level(logging.WARNING, logger="my_game_list.my_game_list.middleware"),
+    ):
+        authenticated_api_client.get(reverse("games:genres-list"))
+
+    assert "Expensive database usage in GET /api/game/genres/ (games:genres-list)" in caplog.text
+    assert 'FROM "games_genre"' in caplog.text
+
+
+@pytest.mark.django_db()
+def test_cheap_request_is_not_logged(authenticated_api_client: APIClient, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the request below the thresholds is not logged."""
+    with caplog.at_level(logging.WARNING, logger="my_game_list.my_game_list.middleware"):
+        authenticated_api_client.get(reverse("games:genres-list"))
+
+    assert "Expensive database usage" not in caplog.text
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("enabled", [True, False])
+def test_database_query_headers(enabled: bool, authenticated_api_client: APIClient) -> None:  # noqa: FBT001
+    """Test that the number of queries and the database time are returned in the headers only when enabled."""
+    with override_settings(MGL_DB_QUERY_HEADERS=enabled):
+        response = authenticated_api_client.get(reverse("games:genres-list"))
+
+    assert ("X-DB-Queries" in response) is enabled
+    assert ("X-DB-Time" in response) is enabled
+    if enabled:
+        assert int(response["X-DB-Queries"]) > 0
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_SLOW_QUERY_THRESHOLD=1e-9)
+def test_slow_query_is_captured(authenticated_api_client: APIClient) -> None:
+    """Test that the query exceeding the slow query threshold is captured with the calling view."""
+    with mock.patch("my_game_list.my_game_list.middleware.slow_query_log") as slow_query_log_mock:
+        authenticated_api_client.get(reverse("games:genres-list"))
+
+    entries = [call.args[0] for call in slow_query_log_mock.capture.call_args_list]
+    assert any('FROM "games_genre"' in entry.sql and entry.view_name == "games:genres-list" for entry in entries)
+
+
+@pytest.mark.django_db()
+def test_profiling_requested_by_staff_user(
+    api_client: APIClient,
+    admin_user_fixture: UserModel,
+    tmp_path: Path,
+) -> None:
+    """Test that the request of the staff user is profiled and the profile is stored."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path):
+        response = _profile(api_client, admin_user_fixture)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    profile_id = response["X-Profile-Id"]
+    assert (tmp_path / f"{profile_id}.prof").exists()
+    assert "SQL time:" in (tmp_path / f"{profile_id}.txt").read_text()
+    assert float(response["X-Profile-Total-Time"]) >= float(response["X-Profile-SQL-Time"])
+    assert int(response["X-Profile-SQL-Queries"]) > 0
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize("profile", ["0", "false", "yes"])
+def test_profiling_ignores_other_header_values(
+    profile: str,
+    api_client: APIClient,
+    admin_user_fixture: UserModel,
+    tmp_path: Path,
+) -> None:
+    """Test that only the documented values of the `X-Profile` header request the profile."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path):
+        response = _profile(api_client, admin_user_fixture, profile)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert "X-Profile-Id" not in response
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.django_db()
+def test_profiling_is_ignored_for_non_staff_user(
+    api_client: APIClient,
+    user_fixture: UserModel,
+    tmp_path: Path,
+) -> None:
+    """Test that the `X-Profile` header of the regular user is ignored."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path):
+        response = _profile(api_client, user_fixture)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert "X-Profile-Id" not in response
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.django_db()
+def test_profiling_text_report(api_client: APIClient, admin_user_fixture: UserModel, tmp_path: Path) -> None:
+    """Test that the text report is returned instead of the response."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path):
+        response = _profile(api_client, admin_user_fixture, profile="text")
+
+    assert response["Content-Type"] == "text/plain; charset=utf-8"
+    report = response.content.decode()
+    assert "GET /api/game/genres/ (games:genres-list)" in report
+    assert 'FROM "games_genre"' in report
+    assert "cumulative" in report
+
+
+@pytest.mark.django_db()
+def test_profiling_keeps_limited_number_of_profiles(
+    api_client: APIClient,
+    admin_user_fixture: UserModel,
+    tmp_path: Path,
+) -> None:
+    """Test that only the most recent profiles are kept."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path, MGL_PROFILING_MAX_FILES=2):
+        profile_ids = [_profile(api_client, admin_user_fixture)["X-Profile-Id"] for _ in range(3)]
+
+    assert sorted(path.stem for path in tmp_path.glob("*.prof")) == sorted(profile_ids[1:])
+    assert len(list(tmp_path.glob("*.txt"))) == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_profiling_sampled_request(api_client: APIClient, tmp_path: Path) -> None:
+    """Test that the sampled request is profiled without exposing the profile in the response."""
+    with override_settings(MGL_PROFILING_DIR=tmp_path, MGL_PROFILING_SAMPLE_RATE=1.0):
+        response = api_client.get(reverse("games:genres-list"))
+
+    assert "X-Profile-Id" not in response
+    assert len(list(tmp_path.glob("*.prof"))) == 1
+
+
+def _replica_queries(api_client: APIClient, token: str) -> int:
+    """Get the genres with the JWT token, returning the number of queries run on the replica."""
+    with CaptureQueriesContext(connections["replica"]) as context:
+        response = api_client.get(reverse("games:genres-list"), HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == 200  # noqa: PLR2004
+    return len(context)
+
+
+def _create_genre(api_client: APIClient, token: str) -> HttpResponse:
+    """Create a genre with the JWT token."""
+    return api_client.post(
+        reverse("games:genres-list"),
+        {"name": "Shooter", "igdb_id": 1},
+        HTTP_AUTHORIZATION=f"Bearer {token}",
+    )
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_safe_request_reads_from_replica(api_client: APIClient, user_fixture: UserModel) -> None:
+    """Test that the reads of the safe request are routed to the replica."""
+    assert _replica_queries(api_client, str(AccessToken.for_user(user_fixture))) > 0
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_requests_after_write_read_from_primary(api_client: APIClient, admin_user_fixture: UserModel) -> None:
+    """Test that the client reads from the primary after it wrote, tracked by the cookie."""
+    response = _create_genre(api_client, str(AccessToken.for_user(admin_user_fixture)))
+
+    assert response.status_code == 201  # noqa: PLR2004
+    assert response.cookies["mgl_use_primary"]["max-age"] == 5  # noqa: PLR2004
+    assert _replica_queries(api_client, str(AccessToken.for_user(admin_user_fixture))) == 0
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@override_settings(MGL_DB_REPLICAS=["replica"])
+def test_requests_after_write_read_from_primary_without_cookie(
+    api_client: APIClient,
+    admin_user_fixture: UserModel,
+) -> None:
+    """Test that the client ignoring the cookies reads from the primary after it wrote, tracked by the cache."""
+    token = str(AccessToken.for_user(admin_user_fixture))
+    cache.clear()
+    _create_genre(api_client, token)
+    api_client.cookies.clear()
+
+    assert _replica_queries(api_client, token) == 0
+    cache.clear()
+    assert _replica_queries(api_client, token) > 0
+
+
+@pytest.mark.django_db()
+def test_session_middleware_runs_for_admin(client: Client, admin_user_fixture: UserModel) -> None:
+    """Test that the admin is served with the session based middlewares."""
+    client.force_login(admin_user_fixture)
+
+    response = client.get("/admin/")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response["X-Frame-Options"] == "DENY"
+    assert response.wsgi_request.user.is_staff
+
+
+@pytest.mark.django_db()
+def test_csrf_check_runs_for_admin() -> None:
+    """Test that the view hook of the `CsrfViewMiddleware` is run for the admin."""
+    response = Client(enforce_csrf_checks=True).post("/admin/login/", {"username": "admin", "password": "admin"})
+
+    assert response.status_code == 403  # noqa: PLR2004
+
+
+def test_session_middleware_does_not_run_for_api(client: Client) -> None:
+    """Test that the API requests skip the session based middlewares."""
+    response = client.get(reverse("api-version"))
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert not response.has_header("X-Frame-Options")
+    assert not hasattr(response.wsgi_request, "session")
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("accept_encoding", "encoding"),
+    [
+        pytest.param("gzip, deflate, br", "br", id="Brotli preferred to gzip."),
+        pytest.param("gzip", "gzip", id="Only gzip accepted."),
+        pytest.param("br;q=0.5, gzip", "gzip", id="Gzip with the higher quality."),
+    ],
+)
+@override_settings(MGL_COMPRESSION_MIN_SIZE=10)
+def test_compression_middleware(accept_encoding: str, encoding: str, authenticated_api_client: APIClient) -> None:
+    """Test that the API response is compressed by the encoding accepted by the client."""
+    baker.make(Genre, _quantity=5)
+    content = authenticated_api_client.get(reverse("games:genres-list")).content
+
+    response = authenticated_api_client.get(reverse("games:genres-list"), HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    assert response["Content-Encoding"] == encoding
+    assert int(response["Content-Length"]) == len(response.content)
+    assert "Accept-Encoding" in response["Vary"]
+    decompress = brotli.decompress if encoding == "br" else gzip.decompress
+    assert decompress(response.content) == content
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("path", "min_size", "accept_encoding"),
+    [
+        pytest.param(reverse("games:genres-list"), 10, "identity", id="Encoding not accepted."),
+        pytest.param(reverse("games:genres-list"), 10**6, "gzip", id="Response smaller than the minimum size."),
+        pytest.param(reverse("api-version"), 10, "gzip", id="Path without the prefix."),
+    ],
+)
+def test_compression_middleware_skips_response(
+    path: str,
+    min_size: int,
+    accept_encoding: str,
+    authenticated_api_client: APIClient,
+) -> None:
+    """Test that the response is not compressed."""
+    with override_settings(MGL_COMPRESSION_MIN_SIZE=min_size):
+        response = authenticated_api_client.get(path, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert not response.has_header("Content-Encoding")
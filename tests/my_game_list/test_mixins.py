@@ -0,0 +1,118 @@
+"""Tests for the mixins shared by the ViewSets."""
+
+from typing import Any, cast
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.test import AsyncRequestFactory, override_settings
+from django.urls import resolve
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework_simplejwt.tokens import AccessToken
+
+from my_game_list.games.models import Game
+from my_game_list.games.views import GameListViewSet, GameViewSet
+from my_game_list.users.models import User as UserModel
+
+
+def _auth_headers(user: UserModel) -> dict[str, str]:
+    """Get the headers authenticating the user with the JWT token."""
+    return {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+
+def _call_async_view(
+    view_set: type[GameViewSet | GameListViewSet],
+    method: str,
+    pk: int | None = None,
+    data: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Call the async view of the ViewSet routed as the list or the detail route and render its response."""
+    actions: dict[str, Any] = {"get": "list", "post": "create"} if pk is None else {"get": "retrieve"}
+    with override_settings(MGL_ASYNC_VIEWS=True):
+        view = view_set.as_view(actions)
+    assert iscoroutinefunction(view)
+    request = getattr(AsyncRequestFactory(), method)("/", data or {}, headers=headers or {})
+    response = async_to_sync(view)(request, **({} if pk is None else {"pk": pk}))
+    assert isinstance(response, Response)
+    return cast("Response", response.render())
+
+
+@pytest.mark.parametrize(
+    ("actions", "async_views", "is_async"),
+    [
+        pytest.param({"get": "list"}, True, True, id="Async list action."),
+        pytest.param({"get": "retrieve"}, True, True, id="Async retrieve action."),
+        pytest.param({"post": "create"}, True, False, id="View without the async actions."),
+        pytest.param({"get": "list"}, False, False, id="Async views disabled."),
+    ],
+)
+def test_async_view_is_coroutine_function(
+    actions: dict[str, Any],
+    async_views: bool,  # noqa: FBT001
+    is_async: bool,  # noqa: FBT001
+) -> None:
+    """Test that only the views with the async actions are coroutine functions, when the async views are enabled."""
+    with override_settings(MGL_ASYNC_VIEWS=async_views):
+        view = GameViewSet.as_view(actions)
+
+    assert iscoroutinefunction(view) is is_async
+
+
+def test_sync_views_by_default() -> None:
+    """Test that the routes of the async actions are the sync views of the WSGI application."""
+    assert not iscoroutinefunction(resolve("/api/game/games/").func)
+
+
+@pytest.mark.django_db()
+def test_async_list(user_fixture: UserModel) -> None:
+    """Test that the async list action is paginated with the async ORM."""
+    baker.make(Game, _quantity=26)
+    response = _call_async_view(GameViewSet, "get", data={"page": 2}, headers=_auth_headers(user_fixture))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 26  # noqa: PLR2004
+    assert len(response.data["results"]) == 1
+
+
+@pytest.mark.django_db()
+def test_async_list_invalid_page(user_fixture: UserModel) -> None:
+    """Test that the invalid page is not found."""
+    response = _call_async_view(GameViewSet, "get", data={"page": 2}, headers=_auth_headers(user_fixture))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_async_retrieve(user_fixture: UserModel) -> None:
+    """Test that the async retrieve action gets the object with the async ORM."""
+    game = baker.make(Game, title="The Witcher 3")
+    response = _call_async_view(GameViewSet, "get", pk=game.pk, headers=_auth_headers(user_fixture))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["title"] == "The Witcher 3"
+
+
+@pytest.mark.django_db()
+def test_async_retrieve_not_found(user_fixture: UserModel) -> None:
+    """Test that the missing object is not found."""
+    response = _call_async_view(GameViewSet, "get", pk=1, headers=_auth_headers(user_fixture))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db()
+def test_async_view_runs_sync_action(user_fixture: UserModel) -> None:
+    """Test that the sync action of the async view is run, checking the permissions."""
+    response = _call_async_view(GameViewSet, "post", headers=_auth_headers(user_fixture))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db()
+def test_async_view_requires_authentication() -> None:
+    """Test that the permissions of the async action are checked."""
+    response = _call_async_view(GameListViewSet, "get")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,138 @@
+"""Tests for the custom paginators."""
+
+from unittest import mock
+
+import pytest
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.test import override_settings
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from my_game_list.games.models import Game, GameReview, Genre
+from my_game_list.my_game_list.pagination import EstimatedCountPaginator
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("estimate", "count", "estimated"),
+    [
+        pytest.param(1000, 1000, True, id="Estimate above the threshold."),
+        pytest.param(99, 3, False, id="Estimate below the threshold."),
+        pytest.param(None, 3, False, id="Count not estimated."),
+    ],
+)
+@override_settings(MGL_ESTIMATED_COUNT_THRESHOLD=100)
+def test_estimated_count_paginator(estimate: int | None, count: int, *, estimated: bool) -> None:
+    """Test that only the large estimates are used as the count."""
+    baker.make(Genre, _quantity=3)
+    paginator = EstimatedCountPaginator(Genre.objects.order_by("id"), 2)
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count", return_value=estimate):
+        assert paginator.count == count
+
+    assert paginator.estimated is estimated
+    assert paginator.num_pages == (count + 1) // 2
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("estimate", "number", "titles", "has_next"),
+    [
+        pytest.param(2, 2, [3, 4], True, id="Underestimated, the page after the estimated pages."),
+        pytest.param(2, 3, [5], False, id="Underestimated, the last page."),
+        pytest.param(1000, 3, [5], False, id="Overestimated, the last page."),
+        pytest.param(1000, 1, [1, 2], True, id="Overestimated, the first page."),
+    ],
+)
+@override_settings(MGL_ESTIMATED_COUNT_THRESHOLD=1)
+def test_estimated_count_paginator_pages(estimate: int, number: int, titles: list[int], *, has_next: bool) -> None:
+    """Test that every page with the objects is served and the next page does not follow the estimated count."""
+    for index in range(1, 6):
+        baker.make(Genre, name=str(index))
+    paginator = EstimatedCountPaginator(Genre.objects.order_by("id"), 2)
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count", return_value=estimate):
+        page = paginator.page(number)
+
+    assert [int(genre.name) for genre in page] == titles
+    assert page.has_next() is has_next
+    assert page.end_index() == titles[-1]
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_ESTIMATED_COUNT_THRESHOLD=100)
+def test_estimated_count_paginator_empty_page() -> None:
+    """Test that the page after the objects is empty, even if it is within the estimated count."""
+    baker.make(Genre, _quantity=3)
+    paginator = EstimatedCountPaginator(Genre.objects.order_by("id"), 2)
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count", return_value=1000):
+        with pytest.raises(EmptyPage):
+            paginator.page(3)
+        with pytest.raises(EmptyPage):
+            paginator.page(0)
+        with pytest.raises(PageNotAnInteger):
+            paginator.page("last")
+
+
+def test_estimated_count_paginator_list() -> None:
+    """Test that the list of the objects is counted exactly."""
+    paginator = EstimatedCountPaginator([1, 2, 3], 2)
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count") as get_estimated_count_mock:
+        assert paginator.count == 3  # noqa: PLR2004
+
+    get_estimated_count_mock.assert_not_called()
+    assert not paginator.estimated
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("viewname", "model"),
+    [
+        pytest.param("games:games-list", Game, id="Async list of the games."),
+        pytest.param("games:game-reviews-list", GameReview, id="Sync list of the game reviews."),
+    ],
+)
+@override_settings(MGL_ESTIMATED_COUNT_THRESHOLD=100)
+def test_estimated_count_response(viewname: str, model: type[Game | GameReview], api_client: APIClient) -> None:
+    """Test that the response flags the estimated count and the page links follow the fetched rows."""
+    baker.make(model, _quantity=2)
+    api_client.force_authenticate(baker.make("users.User"))
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count", return_value=1000) as estimate_mock:
+        response = api_client.get(reverse(viewname))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == 1000  # noqa: PLR2004
+    assert response.json()["count_estimated"] is True
+    assert response.json()["next"] is None
+    assert len(response.json()["results"]) == 2  # noqa: PLR2004
+    estimate_mock.assert_called_once()
+
+
+@pytest.mark.django_db()
+@pytest.mark.parametrize(
+    ("viewname", "model"),
+    [
+        pytest.param("games:games-list", Game, id="Async list of the games."),
+        pytest.param("games:game-reviews-list", GameReview, id="Sync list of the game reviews."),
+    ],
+)
+@override_settings(MGL_ESTIMATED_COUNT_THRESHOLD=1)
+def test_underestimated_count_response(viewname: str, model: type[Game | GameReview], api_client: APIClient) -> None:
+    """Test that the page after the underestimated count is served with its rows."""
+    baker.make(model, _quantity=27)
+    api_client.force_authenticate(baker.make("users.User"))
+
+    with mock.patch("my_game_list.my_game_list.pagination.get_estimated_count", return_value=25):
+        first_page = api_client.get(reverse(viewname))
+        second_page = api_client.get(reverse(viewname), {"page": 2})
+
+    assert first_page.json()["count"] == 25  # noqa: PLR2004
+    assert first_page.json()["next"] is not None
+    assert second_page.status_code == status.HTTP_200_OK
+    assert len(second_page.json()["results"]) == 2  # noqa: PLR2004
+    assert second_page.json()["next"] is None
@@ -0,0 +1,93 @@
+"""Tests for the JSON renderer and parser based on orjson."""
+
+import io
+import uuid
+from datetime import UTC, date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from my_game_list.my_game_list.parsers import ORJSONParser
+from my_game_list.my_game_list.renderers import ORJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"id": 1, "title": "Zażółć gęślą jaźń", "tags": ["a", "b"], "score": None}, id="Dictionary."),
+        pytest.param([{"nested": {"list": [1, 2.5, True]}}], id="Nested list."),
+        pytest.param({"text": "line\u2028paragraph\u2029end"}, id="JavaScript line separators."),
+        pytest.param(
+            {
+                "utc": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+                "offset": datetime(2024, 1, 2, 3, 4, 5, 6789, tzinfo=timezone(timedelta(hours=2))),
+                "naive": datetime(2024, 1, 2, 3, 4, 5, 600000),  # noqa: DTZ001
+                "date": date(2024, 1, 2),
+                "time": time(3, 4, 5, 6),
+            },
+            id="Dates and times.",
+        ),
+        pytest.param({"average_score": Decimal("7.25"), "duration": timedelta(minutes=1)}, id="Decimal and timedelta."),
+        pytest.param({"id": uuid.UUID("12345678-1234-5678-1234-567812345678")}, id="UUID."),
+        pytest.param({"detail": _("Not found.")}, id="Lazy translation."),
+        pytest.param({1: "integer key"}, id="Integer key."),
+        pytest.param({"large": 2**70}, id="Integer larger than 64 bits."),
+    ],
+)
+def test_orjson_renderer_output(data: Any) -> None:  # noqa: ANN401
+    """Test that the data is rendered the same as by the `JSONRenderer`."""
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize(
+    ("accepted_media_type", "renderer_context"),
+    [
+        pytest.param("application/json; indent=4", None, id="Indent in the media type."),
+        pytest.param(None, {"indent": 2}, id="Indent in the context."),
+    ],
+)
+def test_orjson_renderer_indent(accepted_media_type: str | None, renderer_context: dict[str, Any] | None) -> None:
+    """Test that the indented data is rendered the same as by the `JSONRenderer`."""
+    data = {"id": 1, "genres": [{"name": "RPG"}]}
+
+    content = ORJSONRenderer().render(data, accepted_media_type, renderer_context)
+
+    assert content == JSONRenderer().render(data, accepted_media_type, renderer_context)
+    assert b"\n" in content
+
+
+def test_orjson_renderer_none() -> None:
+    """Test that None is rendered as the empty content."""
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_orjson_parser() -> None:
+    """Test that the request body is parsed the same as by the `JSONParser`."""
+    body = '{"message": "Cześć", "score": 7.5, "owned_on": [1, 2], "rejected": null}'.encode()
+
+    assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        pytest.param(b'{"message": ', id="Invalid JSON."),
+        pytest.param(b'{"score": NaN}', id="NaN constant."),
+    ],
+)
+def test_orjson_parser_error(body: bytes) -> None:
+    """Test that the invalid request body raises the parse error."""
+    with pytest.raises(ParseError, match="JSON parse error"):
+        ORJSONParser().parse(io.BytesIO(body))
+
+
+def test_orjson_parser_encoding() -> None:
+    """Test that the request body in the other encoding than UTF-8 is parsed by the `JSONParser`."""
+    body = '{"message": "Zażółć"}'.encode("utf-16")
+
+    assert ORJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "utf-16"}) == {"message": "Zażółć"}
@@ -0,0 +1,94 @@
+"""Tests for the cache of the rendered API responses."""
+
+import gzip
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from my_game_list.games.models import Genre
+from my_game_list.my_game_list import middleware, response_cache
+from my_game_list.my_game_list.compression import compress
+
+GENRES_URL = reverse("games:genres-all-values")
+
+
+@pytest.fixture(autouse=True)
+def _enable_response_cache() -> Iterator[None]:
+    """Enable the response cache, disabled by default without the shared cache."""
+    with override_settings(MGL_RESPONSE_CACHE_TIMEOUT=3600):
+        yield
+
+
+def genre_queries(context: CaptureQueriesContext) -> list[str]:
+    """Get the queries of the genres table."""
+    return [query["sql"] for query in context.captured_queries if Genre._meta.db_table in query["sql"]]  # noqa: SLF001
+
+
+@pytest.mark.django_db()
+def test_response_cached(authenticated_api_client: APIClient) -> None:
+    """Test that the response is served from the cache without querying the genres."""
+    baker.make(Genre, _quantity=3)
+    first_response = authenticated_api_client.get(GENRES_URL)
+
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_api_client.get(GENRES_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == first_response.content
+    assert len(response.json()) == 3  # noqa: PLR2004
+    assert not genre_queries(context)
+
+
+@pytest.mark.django_db()
+def test_response_cache_invalidated(authenticated_api_client: APIClient) -> None:
+    """Test that the change of the model invalidates the cached responses built from it."""
+    baker.make(Genre, _quantity=3)
+    authenticated_api_client.get(GENRES_URL)
+
+    baker.make(Genre)
+    with CaptureQueriesContext(connection) as context:
+        response = authenticated_api_client.get(GENRES_URL)
+
+    assert len(response.json()) == 4  # noqa: PLR2004
+    assert genre_queries(context)
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_RESPONSE_CACHE_TIMEOUT=0)
+def test_response_cache_disabled(authenticated_api_client: APIClient) -> None:
+    """Test that the responses are not cached with the zero timeout."""
+    baker.make(Genre)
+    authenticated_api_client.get(GENRES_URL)
+
+    with CaptureQueriesContext(connection) as context:
+        authenticated_api_client.get(GENRES_URL)
+
+    assert genre_queries(context)
+
+
+@pytest.mark.django_db()
+@override_settings(MGL_COMPRESSION_MIN_SIZE=10)
+def test_compressed_response_cached(authenticated_api_client: APIClient) -> None:
+    """Test that the compressed content is stored in the cache entry, so it is compressed only once."""
+    baker.make(Genre, _quantity=5)
+    content = authenticated_api_client.get(GENRES_URL).content
+
+    with (
+        patch.object(response_cache, "compress", wraps=compress) as compress_mock,
+        patch.object(middleware, "compress") as middleware_compress_mock,
+    ):
+        responses = [authenticated_api_client.get(GENRES_URL, HTTP_ACCEPT_ENCODING="gzip") for _ in range(3)]
+
+    compress_mock.assert_called_once_with(content, "gzip")
+    middleware_compress_mock.assert_not_called()
+    for response in responses:
+        assert response["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content) == content
@@ -0,0 +1,49 @@
+"""Tests for the profiling of the application startup."""
+
+from io import StringIO
+
+from django.core.management import call_command
+
+from my_game_list.my_game_list.startup import iter_import_times, parse_import_times
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     leaf
+import time:        50 |        150 |   child
+import time:        20 |         20 |   other_child
+import time:        30 |        200 | parent
+import time:        10 |         10 | second
+The line of the application output.
+"""
+
+
+def test_parse_import_times() -> None:
+    """Test that the nested imports reported before their parent are parsed into the tree."""
+    imports = parse_import_times(IMPORT_TIME_OUTPUT.splitlines())
+
+    assert [timing.name for timing in imports] == ["parent", "second"]
+    parent = imports[0]
+    assert (parent.self_us, parent.cumulative_us) == (30, 200)
+    assert [timing.name for timing in parent.children] == ["child", "other_child"]
+    assert [timing.name for timing in parent.children[0].children] == ["leaf"]
+    assert [timing.name for timing in iter_import_times(imports)] == [
+        "parent",
+        "child",
+        "leaf",
+        "other_child",
+        "second",
+    ]
+
+
+def test_profile_startup_command() -> None:
+    """Test that the command reports the import tree and the setup phases of a new interpreter."""
+    stdout = StringIO()
+
+    call_command("profile_startup", "--min-ms", "0", "--depth", "1", stdout=stdout)
+
+    output = stdout.getvalue()
+    assert "Import time tree" in output
+    assert "django.setup() phases:" in output
+    assert "models users" in output
+    assert "ready users" in output
+    assert "urlconf" in output
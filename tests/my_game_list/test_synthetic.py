@@ -0,0 +1,81 @@
+"""Tests for the generator of the synthetic data."""
+
+import random
+from collections import Counter
+from collections.abc import Sequence
+from io import StringIO
+from typing import Any, Self
+
+import pytest
+from django.core.management import call_command
+
+from my_game_list.friendships.models import Friendship
+from my_game_list.games.models import Game, GameList
+from my_game_list.my_game_list.synthetic import (
+    DEFAULT_PASSWORD,
+    SIZE_PRESETS,
+    RowWriter,
+    SyntheticDataGenerator,
+    Table,
+    ZipfSampler,
+)
+from my_game_list.users.models import User
+
+
+class RecordingRowWriter(RowWriter):
+    """The writer recording the rows instead of writing them."""
+
+    def __init__(self: Self) -> None:
+        """Initialize the writer."""
+        super().__init__(batch_size=100)
+        self.rows: list[tuple[str, tuple[Any, ...]]] = []
+
+    def write(self: Self, table: Table, rows: Sequence[tuple[Any, ...]]) -> None:
+        """Record the rows of the table."""
+        self.rows.extend((table.model._meta.db_table, row) for row in rows)  # noqa: SLF001
+
+
+def test_zipf_sampler() -> None:
+    """Test that the sampled items are distinct and the popular items are sampled the most."""
+    sampler = ZipfSampler(list(range(100)), 1.07, random.Random(0))  # noqa: S311
+    counts: Counter[int] = Counter()
+    for _ in range(500):
+        sample = sampler.sample(10)
+        assert len(set(sample)) == len(sample) == 10  # noqa: PLR2004
+        counts.update(sample)
+
+    assert counts.most_common(1)[0][0] == 0
+    assert len(sampler.sample(80)) == 50  # noqa: PLR2004
+
+
+@pytest.mark.django_db()
+def test_generated_data_are_reproducible() -> None:
+    """Test that the same seed generates the same data and another seed different data."""
+
+    def generate(seed: int) -> list[tuple[str, tuple[Any, ...]]]:
+        writer = RecordingRowWriter()
+        SyntheticDataGenerator(SIZE_PRESETS["tiny"], writer, seed=seed).generate()
+        # The password hash has a random salt.
+        return [(table, row) for table, row in writer.rows if table != User._meta.db_table]  # noqa: SLF001
+
+    assert generate(1) == generate(1)
+    assert generate(1) != generate(2)
+
+
+@pytest.mark.django_db()
+def test_seed_synthetic_data_command() -> None:
+    """Test that the data are written to the database and appended to the existing data."""
+    size = SIZE_PRESETS["tiny"]
+    stdout = StringIO()
+
+    call_command("seed_synthetic_data", size="tiny", users=20, stdout=stdout)
+    call_command("seed_synthetic_data", size="tiny", users=20, seed=1, stdout=stdout)
+
+    assert User.objects.count() == 40  # noqa: PLR2004
+    assert Game.objects.count() == 2 * size.games
+    assert GameList.objects.exists()
+    assert Friendship.objects.exists()
+    assert User.objects.first().check_password(DEFAULT_PASSWORD)  # type: ignore[union-attr]
+    # The sequences continue after the generated primary keys.
+    assert Game.objects.create(title="New game", igdb_id=1).id == 2 * size.games + 1
+    assert "rows/minute" in stdout.getvalue()
@@ -0,0 +1,42 @@
+"""Tests for the shared Celery tasks and the Celery application."""
+
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import override_settings
+
+from my_game_list.my_game_list.celery import app
+from my_game_list.my_game_list.schema import SchemaCache
+from my_game_list.my_game_list.tasks import warm_openapi_schema_cache
+from my_game_list.my_game_list.views import CachedSpectacularAPIView
+
+
+def test_celery_configuration() -> None:
+    """Test that the tasks are routed by their priority and run eagerly by the tests."""
+    assert app.conf.task_always_eager is True
+    assert {route["queue"] for route in settings.CELERY_TASK_ROUTES.values()} == {"high", "default", "low"}
+    assert {entry["task"] for entry in settings.CELERY_BEAT_SCHEDULE.values()} <= set(app.tasks)
+
+
+def test_warm_openapi_schema_cache(tmp_path: Path) -> None:
+    """Test that the schemas are rendered only when any of them is missing."""
+    with (
+        override_settings(MGL_OPENAPI_SCHEMA_CACHE_ENABLED=True, MGL_OPENAPI_SCHEMA_DIR=tmp_path),
+        mock.patch("my_game_list.my_game_list.tasks.call_command") as call_command_mock,
+    ):
+        assert warm_openapi_schema_cache.delay().get() is True
+        call_command_mock.assert_called_once_with("cache_openapi_schema")
+
+        for renderer_class in CachedSpectacularAPIView.renderer_classes:
+            for language, _ in settings.LANGUAGES:
+                SchemaCache.get_path(renderer_class.format, language).write_bytes(b"{}")
+        assert warm_openapi_schema_cache.delay().get() is False
+        call_command_mock.assert_called_once()
+    SchemaCache.clear()
+
+
+@override_settings(MGL_OPENAPI_SCHEMA_CACHE_ENABLED=False)
+def test_warm_openapi_schema_cache_disabled() -> None:
+    """Test that the schemas are not rendered when the cache is disabled."""
+    assert warm_openapi_schema_cache() is False
@@ -1,10 +1,21 @@
 """Test the my_game_list app views."""
 
+import gzip
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
 from django.test.client import Client
 from django.urls import reverse
+from model_bakery import baker
 from rest_framework import status
+from rest_framework.test import APIClient
 
 from my_game_list import __version__
+from my_game_list.my_game_list.models import SlowQuery
+from my_game_list.my_game_list.schema import SchemaCache
 
 
 def test_version(client: Client) -> None:
@@ -22,3 +33,101 @@ def test_metrics_endpoint(client: Client) -> None:
     assert len(response_text) > 0
     assert "cpu_usage_percent" in response_text
     assert "memory_usage_percent" in response_text
+
+
+@pytest.mark.django_db()
+def test_slow_queries_endpoint_is_admin_only(authenticated_api_client: APIClient) -> None:
+    """Check that a simple user has no access to the slow query log."""
+    response = authenticated_api_client.get(reverse("slow-queries-list"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db()
+def test_slow_queries_endpoint(admin_authenticated_api_client: APIClient) -> None:
+    """Check that the admin can list the slow query log."""
+    slow_query = baker.make(SlowQuery, view_name="games:games-list", duration=1.5)
+    response = admin_authenticated_api_client.get(reverse("slow-queries-list"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["count"] == 1
+    assert response.json()["results"][0]["id"] == slow_query.id
+    assert response.json()["results"][0]["view_name"] == "games:games-list"
+
+
+@pytest.fixture
+def schema_dir(tmp_path: Path) -> Iterator[Path]:
+    """Fixture providing the empty OpenAPI schema cache stored in the temporary directory."""
+    SchemaCache.clear()
+    with override_settings(MGL_OPENAPI_SCHEMA_CACHE_ENABLED=True, MGL_OPENAPI_SCHEMA_DIR=tmp_path):
+        yield tmp_path
+    SchemaCache.clear()
+
+
+def test_schema_is_cached(client: Client, schema_dir: Path) -> None:
+    """Check that the rendered schema is stored and served with the ETag."""
+    (schema_dir / "schema-0.0.1-en.json").write_text("{}")
+
+    response = client.get(reverse("schema"), {"format": "json"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"]
+    assert response["Content-Disposition"].startswith('inline; filename="MyGameList API.json')
+    assert (schema_dir / f"schema-{'.'.join(map(str, __version__))}-en.json").read_bytes() == response.content
+    assert not (schema_dir / "schema-0.0.1-en.json").exists()
+
+    response = client.get(reverse("schema"), {"format": "json"}, headers={"If-None-Match": response["ETag"]})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_schema_is_served_from_cache_file(client: Client, schema_dir: Path) -> None:
+    """Check that the schema stored by another worker is not generated again."""
+    SchemaCache.get_path("json", "en").write_text('{"openapi": "3.0.3"}')
+    assert SchemaCache.get_path("json", "en").parent == schema_dir
+
+    response = client.get(reverse("schema"), {"format": "json"})
+
+    assert response.json() == {"openapi": "3.0.3"}
+    assert response["Content-Type"] == "application/vnd.oai.openapi+json"
+
+
+@pytest.mark.usefixtures("schema_dir")
+def test_schema_is_gzipped(client: Client) -> None:
+    """Check that the schema is gzipped for the clients accepting it, with a different ETag."""
+    plain_response = client.get(reverse("schema"))
+    gzip_response = client.get(reverse("schema"), headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert gzip_response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(gzip_response.content) == plain_response.content
+    assert gzip_response["ETag"] != plain_response["ETag"]
+    assert "Accept-Encoding" in gzip_response["Vary"]
+
+
+@pytest.mark.usefixtures("schema_dir")
+@pytest.mark.parametrize(
+    ("accept_encoding", "gzipped"),
+    [
+        pytest.param("gzip;q=0, deflate", False, id="Refused gzip."),
+        pytest.param("br;q=1, *;q=0.5", True, id="Gzip accepted by the wildcard."),
+        pytest.param("br, *;q=0", False, id="Gzip refused by the wildcard."),
+        pytest.param("x-gzip-custom", False, id="Other encoding containing gzip."),
+    ],
+)
+def test_schema_gzip_negotiation(client: Client, accept_encoding: str, gzipped: bool) -> None:  # noqa: FBT001
+    """Check that the schema is gzipped only for the clients accepting gzip with a non-zero quality."""
+    response = client.get(reverse("schema"), headers={"Accept-Encoding": accept_encoding})
+
+    assert (response.get("Content-Encoding") == "gzip") is gzipped
+
+
+def test_cache_openapi_schema_command(schema_dir: Path) -> None:
+    """Check that the command stores the schema in every format and language."""
+    call_command("cache_openapi_schema", stdout=None)
+
+    version = ".".join(map(str, __version__))
+    assert sorted(path.name for path in schema_dir.iterdir()) == [
+        f"schema-{version}-en.json",
+        f"schema-{version}-en.yaml",
+        f"schema-{version}-pl.json",
+        f"schema-{version}-pl.yaml",
+    ]
@@ -0,0 +1,83 @@
+"""Tests for the warm up of the application caches."""
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.db import DatabaseError
+from django.test import override_settings
+from django.urls import get_resolver
+from django.utils.translation import trans_real
+from model_bakery import baker
+from pytest_django import DjangoAssertNumQueries
+
+from my_game_list.games.models import Genre, Platform
+from my_game_list.my_game_list.filters import get_dictionary_ids
+from my_game_list.my_game_list.schema import SchemaCache
+from my_game_list.my_game_list.warmup import (
+    warm_up,
+    warm_up_dictionaries,
+    warm_up_models,
+    warm_up_schemas,
+    warm_up_urls,
+)
+
+
+def test_warm_up_urls() -> None:
+    """Test that the resolvers are populated and the translations are loaded in every language."""
+    assert warm_up_urls() > 0
+
+    resolver = get_resolver()
+    assert {"pl", "en"} <= set(resolver._reverse_dict)  # noqa: SLF001
+    assert {"pl", "en"} <= set(trans_real._translations)  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+def test_warm_up_models() -> None:
+    """Test that the field caches of all models are populated."""
+    assert warm_up_models() > 0
+
+
+def test_warm_up_schemas(tmp_path: Path) -> None:
+    """Test that the stored OpenAPI schemas are loaded into the memory."""
+    with override_settings(MGL_OPENAPI_SCHEMA_CACHE_ENABLED=True, MGL_OPENAPI_SCHEMA_DIR=tmp_path):
+        SchemaCache.set("json", "en", b"{}")
+        SchemaCache.clear()
+
+        assert warm_up_schemas() == 1
+        assert SchemaCache._schemas[("json", "en")].content == b"{}"  # noqa: SLF001
+    SchemaCache.clear()
+
+
+@override_settings(MGL_OPENAPI_SCHEMA_CACHE_ENABLED=False)
+def test_warm_up_schemas_disabled() -> None:
+    """Test that the schemas are not loaded when the schema cache is disabled."""
+    assert warm_up_schemas() == 0
+
+
+@pytest.mark.django_db()
+def test_warm_up_dictionaries(django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Test that the IDs of the genres and the platforms are cached, so the filters do not query them."""
+    genre = baker.make(Genre, name="RPG")
+    platform = baker.make(Platform, name="PC")
+
+    assert warm_up_dictionaries() == 2  # noqa: PLR2004
+    with django_assert_num_queries(0):
+        assert get_dictionary_ids(Genre) == {"RPG": genre.pk}
+        assert get_dictionary_ids(Platform) == {"PC": platform.pk}
+
+
+def test_warm_up_dictionaries_database_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the IDs are not cached when the database is not available."""
+    with mock.patch("my_game_list.my_game_list.warmup.get_dictionary_ids", side_effect=DatabaseError):
+        assert warm_up_dictionaries() == 0
+
+    assert "Unable to cache the IDs of the dictionaries." in caplog.text
+
+
+@pytest.mark.django_db()
+def test_warm_up(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the warm up logs its summary."""
+    with caplog.at_level("INFO", logger="my_game_list.my_game_list.warmup"):
+        warm_up()
+
+    assert "Warmed up" in caplog.text
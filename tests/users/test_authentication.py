@@ -0,0 +1,160 @@
+"""Tests for the JWT authentication from the token claims."""
+
+import pytest
+from django.core.cache import cache
+from pytest_django import DjangoAssertNumQueries
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from my_game_list.users.authentication import (
+    ClaimsJWTAuthentication,
+    ClaimsTokenObtainPairSerializer,
+    get_snapshot_key,
+)
+from my_game_list.users.models import User
+
+PASSWORD = "test_password"  # noqa: S105 NOSONAR
+
+
+def _get_access_token(user: User) -> AccessToken:
+    """Get the access token with the claims of the user, as issued at the login."""
+    return ClaimsTokenObtainPairSerializer.get_token(user).access_token  # type: ignore[attr-defined,no-any-return]
+
+
+@pytest.mark.django_db()
+def test_token_obtain_pair_claims(user_fixture: User, api_client: APIClient) -> None:
+    """Check if the issued tokens carry the claims of the user."""
+    user_fixture.set_password(PASSWORD)
+    user_fixture.save()
+
+    response = api_client.post(reverse("token_obtain_pair"), {"email": user_fixture.email, "password": PASSWORD})
+
+    assert response.status_code == status.HTTP_200_OK
+    token = AccessToken(response.data["access"])
+    assert token["username"] == user_fixture.username
+    assert token["is_staff"] is False
+    assert token["is_superuser"] is False
+    assert token["is_active"] is True
+
+
+@pytest.mark.django_db()
+def test_get_user_without_query(user_fixture: User, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+    """Check if the user is built from the token claims without querying the database."""
+    token = _get_access_token(user_fixture)
+    cache.clear()
+
+    with django_assert_num_queries(0):
+        user = ClaimsJWTAuthentication().get_user(token)
+
+    assert user.pk == user_fixture.pk
+    assert user.username == user_fixture.username
+    assert user.is_authenticated
+    assert not user.is_staff
+
+
+@pytest.mark.django_db()
+def test_get_user_instance(user_fixture: User) -> None:
+    """Check if the user model instance is loaded from the database on demand."""
+    user = ClaimsJWTAuthentication().get_user(_get_access_token(user_fixture))
+
+    assert user.instance == user_fixture
+
+
+@pytest.mark.django_db()
+def test_get_user_token_without_claims(
+    user_fixture: User,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    """Check if the token issued without the claims is completed from the database once."""
+    token = AccessToken.for_user(user_fixture)
+    cache.clear()
+
+    with django_assert_num_queries(1):
+        user = ClaimsJWTAuthentication().get_user(token)
+    with django_assert_num_queries(0):
+        ClaimsJWTAuthentication().get_user(token)
+
+    assert user.username == user_fixture.username
+    assert cache.get(get_snapshot_key(user_fixture.pk))["username"] == user_fixture.username
+
+
+@pytest.mark.django_db()
+def test_get_user_changed_permissions(user_fixture: User) -> None:
+    """Check if the snapshot of the changed user overrides the claims of the issued token."""
+    token = _get_access_token(user_fixture)
+    user_fixture.is_staff = True
+    user_fixture.save()
+
+    user = ClaimsJWTAuthentication().get_user(token)
+
+    assert user.is_staff
+
+
+@pytest.mark.django_db()
+def test_get_user_deactivated(user_fixture: User) -> None:
+    """Check if the issued token of the deactivated user is rejected."""
+    token = _get_access_token(user_fixture)
+    user_fixture.is_active = False
+    user_fixture.save()
+
+    with pytest.raises(AuthenticationFailed, match="User is inactive"):
+        ClaimsJWTAuthentication().get_user(token)
+
+
+@pytest.mark.django_db()
+def test_get_user_deleted(user_fixture: User) -> None:
+    """Check if the issued token of the deleted user is rejected."""
+    token = _get_access_token(user_fixture)
+    User.objects.filter(pk=user_fixture.pk).delete()
+
+    with pytest.raises(AuthenticationFailed, match="User is inactive"):
+        ClaimsJWTAuthentication().get_user(token)
+
+
+@pytest.mark.django_db()
+def test_get_user_not_found(user_fixture: User) -> None:
+    """Check if the token without the claims of a not existing user is rejected."""
+    token = AccessToken.for_user(user_fixture)
+    User.objects.filter(pk=user_fixture.pk).delete()
+    cache.clear()
+
+    with pytest.raises(AuthenticationFailed, match="User not found"):
+        ClaimsJWTAuthentication().get_user(token)
+
+
+@pytest.mark.django_db()
+def test_token_refresh_current_claims(user_fixture: User, api_client: APIClient) -> None:
+    """Check if the refreshed access token carries the current claims of the user."""
+    refresh = ClaimsTokenObtainPairSerializer.get_token(user_fixture)
+    User.objects.filter(pk=user_fixture.pk).update(is_staff=True)
+
+    response = api_client.post(reverse("token_refresh"), {"refresh": str(refresh)})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert AccessToken(response.data["access"])["is_staff"] is True
+
+
+@pytest.mark.django_db()
+def test_token_refresh_inactive_user(user_fixture: User, api_client: APIClient) -> None:
+    """Check if the access token is not refreshed for the deactivated user."""
+    refresh = ClaimsTokenObtainPairSerializer.get_token(user_fixture)
+    user_fixture.is_active = False
+    user_fixture.save()
+
+    response = api_client.post(reverse("token_refresh"), {"refresh": str(refresh)})
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db()
+def test_authenticated_request(user_fixture: User, api_client: APIClient) -> None:
+    """Check if the API request is authenticated with the token claims."""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {_get_access_token(user_fixture)}")
+
+    response = api_client.get(reverse("users:users-detail", args=(user_fixture.pk,)))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.wsgi_request.user.username == user_fixture.username  # type: ignore[attr-defined]
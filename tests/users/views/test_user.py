@@ -5,10 +5,13 @@
 
 import pytest
 from django.contrib.auth import get_user_model
+from model_bakery import baker
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
+from my_game_list.friendships.models import Friendship
+from my_game_list.games.models import GameList, GameListStatus
 from my_game_list.users.models import Gender
 from my_game_list.users.models import User as UserModel
 
@@ -48,6 +51,7 @@ def test_list_users(authenticated_api_client: APIClient, admin_user_fixture: Use
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {
         "count": 2,
+        "count_estimated": False,
         "next": None,
         "previous": None,
         "results": [
@@ -118,3 +122,35 @@ def test_register_user(api_client: APIClient) -> None:
 
     assert response.status_code == status.HTTP_201_CREATED
     assert response.json()["username"] == "testuser"
+
+
+@pytest.mark.django_db()
+def test_get_user_with_game_lists_and_friends(
+    authenticated_api_client: APIClient,
+    user_fixture: UserModel,
+    admin_user_fixture: UserModel,
+) -> None:
+    """Check that the statistics, friends and latest game list updates are loaded without per-field queries."""
+    baker.make(GameList, user=user_fixture, status=GameListStatus.COMPLETED, score=8)
+    baker.make(GameList, user=user_fixture, status=GameListStatus.PLAYING, score=6)
+    baker.make(GameList, user=admin_user_fixture, status=GameListStatus.DROPPED, score=1)
+    Friendship.objects.create(user=user_fixture, friend=admin_user_fixture)
+
+    response = authenticated_api_client.get(reverse("users:users-detail", (user_fixture.pk,)))
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["game_list_statistics"] == {
+        "completed": 1,
+        "dropped": 0,
+        "mean_score": 7.0,
+        "on_hold": 0,
+        "plan_to_play": 0,
+        "playing": 1,
+        "total": 2,
+    }
+    assert data["friends"] == [{"id": admin_user_fixture.pk, "gravatar_url": admin_user_fixture.gravatar_url}]
+    assert [game_list["status_code"] for game_list in data["latest_game_list_updates"]] == [
+        GameListStatus.COMPLETED,
+        GameListStatus.PLAYING,
+    ]